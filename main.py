@@ -1,12 +1,6 @@
-from src.scraper import run_selenium_scraper
-from src.cleaner import clean_jobs
-import src.db_manager as db_mgr
+from src.cli import main
 
 
 if __name__ == "__main__":
-    # Initialize database
-    db_mgr.init_db()
-    # Run scraper
-    run_selenium_scraper()
-    # Clean jobs
-    clean_jobs()
\ No newline at end of file
+    # python main.py [run|scrape|clean|visualize|export|bench] ... (see --help)
+    main()
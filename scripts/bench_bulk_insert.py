@@ -0,0 +1,88 @@
+"""
+Benchmark raw-job write throughput (rows/sec) for the bulk loader.
+
+Compares the former single INSERT ... VALUES statement with every row inlined against
+chunked executemany and, on PostgreSQL, COPY through a staging table. Each run inserts
+into an empty jobs table and then re-inserts the same rows to time the all-duplicates case.
+
+Usage: python -m scripts.bench_bulk_insert [--db-url sqlite:///bench.db] [--sizes 1000 10000 100000]
+The default target is a temporary SQLite file; pass a PostgreSQL URL to include COPY.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+from sqlalchemy import create_engine, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from src.bulk_loader import bulk_insert
+from src.db_manager import metadata, jobs_table
+
+def make_rows(count):
+    scraped_at = datetime.now()
+    return [
+        {
+            'id': f"article-{40000000 + i}",
+            'title': "software developer",
+            'date_posted': "January 17, 2026",
+            'location': "Toronto (ON)",
+            'salary': "Salary $42.41 to $96.63 hourly",
+            'scraped_at': scraped_at
+        }
+        for i in range(count)
+    ]
+
+def single_statement_insert(conn, table, rows):
+    """The previous approach: one statement with len(rows) x 6 bound parameters."""
+    dialect = sqlite if conn.dialect.name == 'sqlite' else postgresql
+    stmt = dialect.insert(table).values(rows).on_conflict_do_nothing(index_elements=['id'])
+    return conn.execute(stmt).rowcount
+
+def timed(engine, write, rows):
+    with engine.connect() as conn:
+        start = time.perf_counter()
+        inserted = write(conn, rows)
+        conn.commit()
+        return time.perf_counter() - start, inserted
+
+def run_benchmark(db_url, sizes):
+    engine = create_engine(db_url)
+    metadata.create_all(engine, tables=[jobs_table])
+
+    methods = {
+        'single VALUES': lambda conn, rows: single_statement_insert(conn, jobs_table, rows),
+        'executemany': lambda conn, rows: bulk_insert(conn, jobs_table, rows, method='executemany'),
+    }
+    if engine.dialect.name == 'postgresql':
+        methods['copy'] = lambda conn, rows: bulk_insert(conn, jobs_table, rows, method='copy')
+
+    print(f"Target: {engine.dialect.name}\n")
+    print(f"{'method':<14} {'rows':>8} {'new rows/sec':>13} {'dup rows/sec':>13} {'inserted':>9}")
+    for count in sizes:
+        rows = make_rows(count)
+        for name, write in methods.items():
+            with engine.begin() as conn:
+                conn.execute(delete(jobs_table))
+            try:
+                elapsed, inserted = timed(engine, write, rows)
+                dup_elapsed, dup_inserted = timed(engine, write, rows)
+            except Exception as e:
+                print(f"{name:<14} {count:>8} failed: {type(e).__name__}: {str(e).splitlines()[0][:60]}")
+                continue
+            assert inserted == count and dup_inserted == 0, (name, inserted, dup_inserted)
+            print(f"{name:<14} {count:>8} {count / elapsed:>13,.0f} {count / dup_elapsed:>13,.0f} {inserted:>9}")
+
+    with engine.begin() as conn:
+        conn.execute(delete(jobs_table))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db-url', default=None, help="SQLAlchemy URL (default: temporary SQLite file)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    if args.db_url:
+        run_benchmark(args.db_url, args.sizes)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            run_benchmark(f"sqlite:///{os.path.join(tmp, 'bench.db')}", args.sizes)
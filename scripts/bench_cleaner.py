@@ -0,0 +1,93 @@
+"""
+Benchmark the scalar cleaner against the vectorized (pandas) cleaner.
+
+Raw rows are sampled from the example job_listings.csv (plus missing values) at
+10k / 100k / 1M rows. Outputs are first checked to be identical, then the engines
+are timed end to end (list of raw dicts -> list of CleanJob records): the uncached
+reference parsers, the memoized scalar cleaner (caches cleared first) and the
+vectorized cleaner. The DataFrame-only time of clean_jobs_frame is reported as well.
+
+Usage: python -m scripts.bench_cleaner [--sizes 10000 100000 1000000]
+"""
+import argparse
+import csv
+import random
+import time
+import pandas as pd
+from datetime import datetime
+from src.cleaner import PARSE_CACHES, clean_job, parse_date, parse_location
+from src.salary_parser import annualize, parse_salary
+from src.constants import JOB_LISTINGS_CSV
+from src.records import CleanJob
+from src.vectorized_cleaner import clean_job_batch, clean_jobs_frame, RAW_COLUMNS
+
+def load_sample_rows():
+    with open(JOB_LISTINGS_CSV, mode='r', encoding='utf-8-sig') as f:
+        rows = [{key: row[key] for key in RAW_COLUMNS} for row in csv.DictReader(f)]
+    # Missing-value variants the scraper produces
+    rows.append({'id': '', 'title': "N/A", 'date_posted': "N/A", 'location': "N/A", 'salary': "N/A"})
+    rows.append({'id': '', 'title': None, 'date_posted': None, 'location': None, 'salary': None})
+    return rows
+
+def make_raw_jobs(count, seed=0):
+    sample = load_sample_rows()
+    rng = random.Random(seed)
+    raw_jobs = []
+    for i in range(count):
+        job = dict(rng.choice(sample))
+        job['id'] = f"article-{40000000 + i}"
+        raw_jobs.append(job)
+    return raw_jobs
+
+def clean_job_uncached(job):
+    city, province = parse_location(job['location'])
+    min_salary, max_salary, period = parse_salary(job['salary'])
+    return CleanJob(
+        job['id'],
+        job['title'],
+        parse_date(job['date_posted']),
+        city,
+        province,
+        min_salary,
+        max_salary,
+        period,
+        annualize(min_salary, period),
+        annualize(max_salary, period),
+        datetime.now()
+    )
+
+def without_timestamp(rows):
+    return [{key: value for key, value in row.items() if key != 'cleaned_at'} for row in rows]
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def run_benchmark(sizes):
+    print(f"{'rows':>9} {'reference s':>12} {'memoized s':>11} {'vectorized s':>13} "
+          f"{'frame only s':>13} {'speedup':>8}")
+    for count in sizes:
+        raw_jobs = make_raw_jobs(count)
+        raw_frame = pd.DataFrame.from_records(raw_jobs, columns=RAW_COLUMNS)
+        for cache in PARSE_CACHES.values():
+            cache.clear()
+
+        reference_s, reference_rows = timed(lambda: [clean_job_uncached(job) for job in raw_jobs])
+        scalar_s, scalar_rows = timed(lambda: [clean_job(job) for job in raw_jobs])
+        vectorized_s, vectorized_rows = timed(lambda: clean_job_batch(raw_jobs))
+        frame_s, _ = timed(lambda: clean_jobs_frame(raw_frame))
+
+        expected = without_timestamp(reference_rows)
+        if without_timestamp(scalar_rows) != expected:
+            raise AssertionError(f"Memoized output differs from reference output at {count} rows")
+        if without_timestamp(vectorized_rows) != expected:
+            raise AssertionError(f"Vectorized output differs from reference output at {count} rows")
+        print(f"{count:>9,} {reference_s:>12.2f} {scalar_s:>11.2f} {vectorized_s:>13.2f} "
+              f"{frame_s:>13.2f} {reference_s / vectorized_s:>7.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run_benchmark(args.sizes)
@@ -0,0 +1,82 @@
+"""
+Benchmark loading cleaned jobs from the CSV against the Parquet/Arrow snapshot.
+
+For each size, a SQLite stand-in database is filled with cleaned jobs sampled from the
+example job_listings.csv and the same rows are written to a CSV. The table is then exported
+as Parquet and as Arrow IPC, and each copy is loaded into pandas: every column, and only
+the four charted columns. A second, incremental export after adding 1% more rows shows the
+append-only cost.
+
+Usage: python -m scripts.bench_export [--sizes 100000 1000000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+def run_benchmark(sizes, directory):
+    import pandas as pd
+    from src import exporter
+    from src.visualizer import CHART_COLUMNS
+    from scripts.bench_visualizer import fill, reset
+
+    print(f"{'rows':>9} {'source':<8} {'export s':>9} {'MB':>7} {'load all s':>11} {'load 4 cols s':>14} "
+          f"{'append 1% s':>12}")
+    for count in sizes:
+        reset()
+        csv_path = os.path.join(directory, f"cleaned_{count}.csv")
+        fill(count, csv_path)
+
+        load_all_s, _ = timed(pd.read_csv, csv_path, encoding='utf-8-sig')
+        load_cols_s, _ = timed(pd.read_csv, csv_path, encoding='utf-8-sig', usecols=CHART_COLUMNS)
+        csv_mb = os.path.getsize(csv_path) / 1e6
+        print(f"{count:>9,} {'csv':<8} {'':>9} {csv_mb:>7.1f} {load_all_s:>11.3f} {load_cols_s:>14.3f} {'':>12}")
+
+        export_dirs = {}
+        for export_format in exporter.EXPORT_FORMATS:
+            export_dir = os.path.join(directory, f"{export_format}_{count}")
+            export_dirs[export_format] = export_dir
+            export_s, exported = timed(exporter.export_cleaned_jobs, export_dir, export_format)
+            if exported != count:
+                raise AssertionError(f"Exported {exported} of {count} rows")
+            load_all_s, frame = timed(exporter.load_snapshot, export_dir=export_dir)
+            load_cols_s, _ = timed(exporter.load_snapshot, columns=CHART_COLUMNS, export_dir=export_dir)
+            if len(frame) != count:
+                raise AssertionError(f"Loaded {len(frame)} of {count} rows")
+            size_mb = directory_size(export_dir) / 1e6
+            print(f"{count:>9,} {export_format:<8} {export_s:>9.2f} {size_mb:>7.1f} {load_all_s:>11.3f} "
+                  f"{load_cols_s:>14.3f}")
+
+        # Incremental run: only the new rows are written, as new files
+        fill_more(count, count // 100)
+        for export_format, export_dir in export_dirs.items():
+            append_s, appended = timed(exporter.export_cleaned_jobs, export_dir, export_format)
+            print(f"{'':>9} {export_format:<8} {'':>9} {'':>7} {'':>11} {'':>14} {append_s:>12.3f} ({appended} rows)")
+
+def fill_more(start, count):
+    from src import db_manager as db_mgr
+    from src.cleaner import clean_job_batch
+    from scripts.bench_cleaner import make_raw_jobs
+
+    raw_jobs = make_raw_jobs(count, seed=1)
+    for i, job in enumerate(raw_jobs):
+        job['id'] = f"article-{50000000 + start + i}"
+    db_mgr.save_cleaned_jobs_to_db(clean_job_batch(raw_jobs, method='vectorized'))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # db_manager reads DB_URL when its engine is first created
+        os.environ['DB_URL'] = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        run_benchmark(args.sizes, directory)
@@ -0,0 +1,38 @@
+import re
+from src.constants import JOB_SEARCH_PAGE_HTML
+
+# Synthetic job numbers start here so they never collide with the saved fixture IDs
+SYNTHETIC_ID_START = 90000000
+
+ARTICLE_PATTERN = re.compile(r'\s*<article\b.*?</article>', re.DOTALL)
+JOB_NUMBER_PATTERN = re.compile(r'(article-|jobposting/|Job number: )\d+')
+
+def load_fixture_page():
+    """
+    Split the saved search result page into (head, article blocks, tail).
+    """
+    page = JOB_SEARCH_PAGE_HTML.read_text(encoding='utf-8')
+    articles = ARTICLE_PATTERN.findall(page)
+    head = page[:page.index(articles[0])]
+    tail = page[page.index(articles[-1]) + len(articles[-1]):]
+    return head, articles, tail
+
+def build_articles(count, start=0):
+    """
+    Build `count` article blocks by cycling through the fixture articles.
+    Each block gets a unique job number so the parsed IDs stay distinct.
+    """
+    _, articles, _ = load_fixture_page()
+    blocks = []
+    for i in range(start, start + count):
+        job_number = SYNTHETIC_ID_START + i
+        block = articles[i % len(articles)]
+        blocks.append(JOB_NUMBER_PATTERN.sub(lambda m: f"{m.group(1)}{job_number}", block))
+    return blocks
+
+def build_page(article_count):
+    """
+    Build a full search result page containing `article_count` articles.
+    """
+    head, _, tail = load_fixture_page()
+    return head + ''.join(build_articles(article_count)) + tail
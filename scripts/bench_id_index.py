@@ -0,0 +1,64 @@
+"""
+Benchmark duplicate-detection structures for existing job IDs.
+
+Compares the former set of 'article-NNNN' strings with JobIdIndex (sorted int64 array)
+at 10k / 1M / 10M IDs: build time, memory, and lookup latency for hits and misses.
+Memory is the tracemalloc peak while building, which covers both Python objects and
+NumPy buffers.
+
+Usage: python -m scripts.bench_id_index [--sizes 10000 1000000 10000000] [--lookups 100000]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+import numpy  # imported up front so its module state is not counted as index memory
+from src.id_index import JobIdIndex
+
+FIRST_ARTICLE = 40000000
+
+def generate_ids(count):
+    return (f"article-{FIRST_ARTICLE + i}" for i in range(count))
+
+def build_set(count):
+    return {job_id for job_id in generate_ids(count)}
+
+def build_index(count):
+    return JobIdIndex.from_ids(generate_ids(count))
+
+def measure_build(builder, count):
+    # Time without tracing, then rebuild under tracemalloc for memory
+    start = time.perf_counter()
+    structure = builder(count)
+    elapsed = time.perf_counter() - start
+    del structure
+
+    tracemalloc.start()
+    structure = builder(count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, elapsed, current / 2**20, peak / 2**20
+
+def measure_lookups(structure, probes):
+    start = time.perf_counter()
+    hits = sum(1 for job_id in probes if job_id in structure)
+    return (time.perf_counter() - start) / len(probes) * 1e6, hits
+
+def run_benchmark(sizes, lookups):
+    print(f"{'structure':<12} {'IDs':>11} {'build s':>8} {'held MB':>9} {'peak MB':>9} {'lookup us':>10}")
+    for count in sizes:
+        rng = random.Random(count)
+        # Half hits, half misses
+        probes = [f"article-{FIRST_ARTICLE + rng.randrange(count * 2)}" for _ in range(lookups)]
+        for name, builder in (('set[str]', build_set), ('JobIdIndex', build_index)):
+            structure, elapsed, held_mb, peak_mb = measure_build(builder, count)
+            latency_us, hits = measure_lookups(structure, probes)
+            print(f"{name:<12} {count:>11,} {elapsed:>8.2f} {held_mb:>9.1f} {peak_mb:>9.1f} {latency_us:>10.2f}")
+            del structure
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--lookups', type=int, default=100_000, help="Membership probes per structure")
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.lookups)
@@ -0,0 +1,52 @@
+"""
+Benchmark per-section parse time of a 'Show more' crawl.
+
+Compares re-parsing the whole page every section (driver.page_source) against
+incremental mode, which only parses the articles appended since the last section.
+
+Usage: python -m scripts.bench_incremental_parse [--sections 40] [--page-size 25]
+"""
+import argparse
+import time
+from src.parser import parse_job_listings
+from scripts.bench_fixtures import load_fixture_page, build_articles
+
+def time_parse(html, repeat):
+    """Return the best-of-`repeat` parse time in milliseconds and the parsed job count."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        jobs = parse_job_listings(html)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, len(jobs)
+
+def run_benchmark(sections, page_size, repeat):
+    head, _, tail = load_fixture_page()
+    articles = build_articles(sections * page_size)
+
+    print(f"{'section':>8} {'articles':>9} {'full (ms)':>10} {'incremental (ms)':>17}")
+    full_total = incremental_total = 0.0
+    for section in range(1, sections + 1):
+        on_page = section * page_size
+
+        # Full mode: the whole, ever-growing document
+        full_ms, full_count = time_parse(head + ''.join(articles[:on_page]) + tail, repeat)
+
+        # Incremental mode: only the <article> nodes past the high-water mark
+        incremental_ms, new_count = time_parse(''.join(articles[on_page - page_size:on_page]), repeat)
+
+        assert full_count == on_page and new_count == page_size
+        full_total += full_ms
+        incremental_total += incremental_ms
+        print(f"{section:>8} {on_page:>9} {full_ms:>10.2f} {incremental_ms:>17.2f}")
+
+    print(f"\nTotal parse time: full {full_total:.1f} ms, incremental {incremental_total:.1f} ms "
+          f"({full_total / incremental_total:.1f}x less work)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sections', type=int, default=40, help="Number of 'Show more' sections to simulate")
+    parser.add_argument('--page-size', type=int, default=25, help="Articles appended per section")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetitions per measurement (best is reported)")
+    args = parser.parse_args()
+    run_benchmark(args.sections, args.page_size, args.repeat)
@@ -0,0 +1,52 @@
+"""
+Benchmark parse_job_listings across parser backends.
+
+Pages with 100/1k/10k articles are built from the saved Job Bank fixture. Every backend
+is first checked to return exactly the same dicts as 'html.parser', then timed in a fresh
+process so its peak memory (RSS growth while parsing) is measured in isolation.
+
+Usage: python -m scripts.bench_parse [--sizes 100 1000 10000] [--backends html.parser lxml ...]
+"""
+import argparse
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.parser import available_backends, parse_job_listings
+from scripts.bench_fixtures import build_page
+
+def measure(backend, article_count):
+    """Parse one page in the current process; returns (seconds, peak RSS growth in MB)."""
+    html = build_page(article_count)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    jobs = parse_job_listings(html, backend=backend)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert len(jobs) == article_count
+    return elapsed, (peak_kb - baseline_kb) / 1024
+
+def check_identical_output(backends, article_count):
+    html = build_page(article_count)
+    reference = parse_job_listings(html, backend='html.parser')
+    for backend in backends:
+        if parse_job_listings(html, backend=backend) != reference:
+            raise AssertionError(f"Backend '{backend}' output differs from 'html.parser'")
+
+def run_benchmark(sizes, backends):
+    check_identical_output(backends, min(sizes))
+    print(f"Output identical across backends: {', '.join(backends)}\n")
+
+    print(f"{'backend':<12} {'articles':>9} {'seconds':>9} {'articles/sec':>13} {'peak MB':>9}")
+    for article_count in sizes:
+        for backend in backends:
+            # One process per measurement so ru_maxrss is not shared between runs
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                elapsed, peak_mb = pool.submit(measure, backend, article_count).result()
+            print(f"{backend:<12} {article_count:>9} {elapsed:>9.3f} {article_count / elapsed:>13,.0f} {peak_mb:>9.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help="Articles per page")
+    parser.add_argument('--backends', nargs='+', default=None, help="Backends to compare (default: all installed)")
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.backends or available_backends())
@@ -0,0 +1,96 @@
+"""
+Benchmark the memory and build time of a batch of jobs held as dicts and as records.
+
+Raw rows are sampled from the example job_listings.csv and fed in as a database driver
+returns them, i.e. with fresh string objects on every row. Each batch is built as per-row
+dicts (the previous representation) and as RawJob records, then cleaned into dicts and
+into CleanJob records. Memory is what the finished batch holds (tracemalloc), with the
+allocations made per row; time is the best of --repeat builds.
+
+Usage: python -m scripts.bench_records [--sizes 100000 500000]
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+from src.cleaner import cached_parse_date, cached_parse_location, cached_parse_salary, clean_job
+from src.records import RawJob
+from src.salary_parser import annualize
+from scripts.bench_cleaner import make_raw_jobs
+
+RAW_COLUMNS = RawJob.FIELDS
+
+def fetched_rows(sample):
+    # Like a driver cursor: every value is a new string object
+    for job in sample:
+        yield tuple(None if job[name] is None else (job[name] + '.')[:-1] for name in RAW_COLUMNS)
+
+def clean_job_dict(job):
+    # The cleaner's output before CleanJob
+    city, province = cached_parse_location(job['location'])
+    min_salary, max_salary, period = cached_parse_salary(job['salary'])
+    return {
+        'id': job['id'],
+        'title': job['title'],
+        'date_posted': cached_parse_date(job['date_posted']),
+        'city': city,
+        'province': province,
+        'min_salary': min_salary,
+        'max_salary': max_salary,
+        'salary_period': period,
+        'min_salary_annual': annualize(min_salary, period),
+        'max_salary_annual': annualize(max_salary, period),
+        'cleaned_at': datetime.now()
+    }
+
+def measure(build, repeat):
+    """(best seconds, bytes held by the result, allocations held) of build()."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del result
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    return best, size, blocks, result
+
+def run_benchmark(sizes, repeat):
+    print(f"{'rows':>9} {'batch':<14} {'dicts MB':>9} {'records MB':>11} {'dict allocs/row':>16} "
+          f"{'record allocs/row':>18} {'dicts s':>8} {'records s':>10}")
+    for count in sizes:
+        sample = make_raw_jobs(count)
+        results = {}
+        for name, build in (('raw dicts', lambda: [dict(zip(RAW_COLUMNS, row)) for row in fetched_rows(sample)]),
+                            ('raw records', lambda: [RawJob(*row) for row in fetched_rows(sample)])):
+            results[name] = measure(build, repeat)
+
+        raw_dicts, raw_records = results['raw dicts'][3], results['raw records'][3]
+        for name, build in (('clean dicts', lambda: [clean_job_dict(job) for job in raw_dicts]),
+                            ('clean records', lambda: [clean_job(job) for job in raw_records])):
+            results[name] = measure(build, repeat)
+        if [dict(job, job_number=None) for job in results['clean dicts'][3]] != \
+                [dict(job, cleaned_at=dicts['cleaned_at']) for job, dicts in
+                 zip(results['clean records'][3], results['clean dicts'][3])]:
+            raise AssertionError("CleanJob records differ from the cleaned dicts")
+
+        for batch in ('raw', 'clean'):
+            dict_s, dict_bytes, dict_blocks, _ = results[f'{batch} dicts']
+            record_s, record_bytes, record_blocks, _ = results[f'{batch} records']
+            print(f"{count:>9,} {batch:<14} {dict_bytes / 1e6:>9.1f} {record_bytes / 1e6:>11.1f} "
+                  f"{dict_blocks / count:>16.1f} {record_blocks / count:>18.1f} {dict_s:>8.2f} {record_s:>10.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 500_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.repeat)
@@ -0,0 +1,69 @@
+"""
+Benchmark the single-pass salary grammar against the former parse_salary.
+
+Salary strings are sampled from the example job_listings.csv. Both functions parse the
+same strings uncached, so the numbers compare parsing work only (clean_job adds the
+memoization cache on top). Also reports how many sample strings the two disagree on,
+e.g. biweekly salaries the former function classified as weekly.
+
+Usage: python -m scripts.bench_salary [--rows 200000]
+"""
+import argparse
+import re
+import time
+from scripts.bench_cleaner import make_raw_jobs
+from src.salary_parser import parse_salary
+
+def legacy_parse_salary(salary_str):
+    # parse_salary as it was before the grammar, kept here for comparison
+    if not salary_str or salary_str.lower() == "n/a":
+        return None, None, None
+
+    numbers = re.findall(r'[\d,.]+', salary_str)
+    numbers = [float(num.replace(',', '')) for num in numbers if num]
+
+    period = None
+    if "hourly" in salary_str.lower():
+        period = "hourly"
+    elif "annually" in salary_str.lower():
+        period = "annually"
+    elif "monthly" in salary_str.lower():
+        period = "monthly"
+    elif "weekly" in salary_str.lower():
+        period = "weekly"
+    elif "biweekly" in salary_str.lower():
+        period = "biweekly"
+    elif "daily" in salary_str.lower():
+        period = "daily"
+
+    min_salary = numbers[0] if len(numbers) > 0 else None
+    max_salary = numbers[1] if len(numbers) > 1 else min_salary
+
+    return min_salary, max_salary, period
+
+def timed(parser, salaries):
+    start = time.perf_counter()
+    for salary in salaries:
+        parser(salary)
+    return time.perf_counter() - start
+
+def run_benchmark(rows):
+    salaries = [job['salary'] for job in make_raw_jobs(rows)]
+    distinct = sorted(set(salaries), key=str)
+
+    legacy_s = timed(legacy_parse_salary, salaries)
+    grammar_s = timed(parse_salary, salaries)
+    print(f"{rows:,} salary strings ({len(distinct)} distinct)")
+    print(f"  former parse_salary: {legacy_s:.2f}s ({rows / legacy_s:,.0f} strings/sec)")
+    print(f"  salary grammar:      {grammar_s:.2f}s ({rows / grammar_s:,.0f} strings/sec)")
+
+    differences = [salary for salary in distinct if legacy_parse_salary(salary) != parse_salary(salary)]
+    print(f"  distinct strings parsed differently: {len(differences)}")
+    for salary in differences[:10]:
+        print(f"    {salary!r}: {legacy_parse_salary(salary)} -> {parse_salary(salary)}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+    run_benchmark(args.rows)
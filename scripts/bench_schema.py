@@ -0,0 +1,156 @@
+"""
+Benchmark the schema migrations' effect on the pending-work, ID fetch and dashboard queries.
+
+A SQLite stand-in database (or the database given with --db-url) is filled with raw and
+cleaned jobs sampled from the example job_listings.csv, with scraped_at and date_posted
+spread over two years. Each query is timed (best of --repeat) on the baseline schema, i.e. without the
+secondary indexes, using the pre-migration queries (the jobs/jobs_cleaned anti-join and
+ID strings). It is timed again after the migrations, and with --partition also after
+jobs_cleaned is partitioned by month (PostgreSQL).
+
+Usage: python -m scripts.bench_schema [--rows 200000] [--db-url URL] [--partition]
+A --db-url database must be a scratch database: jobs, jobs_cleaned and the rollups are emptied,
+and --partition leaves jobs_cleaned partitioned.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ANTI_JOIN = """
+    SELECT j.id FROM jobs j LEFT JOIN jobs_cleaned jc ON j.id = jc.id WHERE jc.id IS NULL
+"""
+
+def fill(count):
+    from sqlalchemy import text
+    from src import db_manager as db_mgr
+    from src.cleaner import clean_job_batch
+    from scripts.bench_cleaner import make_raw_jobs
+    from scripts.bench_visualizer import reset
+
+    reset()
+    with db_mgr.connection_scope() as conn:
+        conn.execute(db_mgr.jobs_table.delete())
+    raw_jobs = make_raw_jobs(count)
+    for start in range(0, count, 50_000):
+        chunk = raw_jobs[start:start + 50_000]
+        db_mgr.save_jobs_to_db(chunk)
+        db_mgr.save_cleaned_jobs_to_db(clean_job_batch(chunk, method='vectorized'))
+
+    with db_mgr.connection_scope() as conn:
+        # Spread scrape and posting dates over two years, like a long-running tracker
+        if conn.dialect.name == 'sqlite':
+            conn.execute(text("UPDATE jobs SET scraped_at = datetime(scraped_at, '-' || (job_number % 730) || ' days')"))
+            conn.execute(text("UPDATE jobs_cleaned SET date_posted = date(date_posted, '-' || (job_number % 730) || ' days')"))
+        else:
+            conn.execute(text("UPDATE jobs SET scraped_at = scraped_at - (job_number % 730) * INTERVAL '1 day'"))
+            conn.execute(text("UPDATE jobs_cleaned SET date_posted = date_posted - CAST(job_number % 730 AS INTEGER)"))
+        conn.exec_driver_sql('ANALYZE')
+
+def set_indexes(create):
+    from src import db_manager as db_mgr
+
+    indexes = [db_mgr.unprocessed_jobs_index, *db_mgr.jobs_table.indexes, *db_mgr.jobs_cleaned_table.indexes]
+    with db_mgr.connection_scope() as conn:
+        for index in indexes:
+            if create:
+                index.create(conn, checkfirst=True)
+            else:
+                index.drop(conn, checkfirst=True)
+        # Planner statistics, so the new indexes are used where they pay off
+        conn.exec_driver_sql('ANALYZE')
+
+def best_of(repeat, function):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def legacy_id_fetch():
+    # Before job_number: every recent ID read as a string and parsed in Python
+    from sqlalchemy import select
+    from src import db_manager as db_mgr
+    from src.constants import EXISTING_IDS_WINDOW_DAYS
+    from src.id_index import JobIdIndex
+
+    table = db_mgr.jobs_table
+    query = select(table.c.id).where(table.c.scraped_at >= datetime.now() - timedelta(days=EXISTING_IDS_WINDOW_DAYS))
+    with db_mgr.connection_scope() as conn:
+        return JobIdIndex.from_ids(conn.execution_options(stream_results=True).execute(query).scalars())
+
+def run_query(sql):
+    from sqlalchemy import text
+    from src import db_manager as db_mgr
+
+    with db_mgr.connection_scope() as conn:
+        return conn.execute(text(sql)).all()
+
+def dashboard_queries():
+    from sqlalchemy import func, select
+    from src import db_manager as db_mgr
+
+    with db_mgr.connection_scope() as conn:
+        newest = conn.execute(select(func.max(db_mgr.jobs_cleaned_table.c.date_posted))).scalar()
+    since = (datetime.fromisoformat(str(newest)) - timedelta(days=30)).date().isoformat()
+    recent = f"SELECT province, COUNT(*) FROM jobs_cleaned WHERE date_posted >= '{since}' GROUP BY province"
+    return {
+        'by province': lambda: db_mgr.count_cleaned_jobs_by('province'),
+        'top cities': lambda: db_mgr.count_cleaned_jobs_by('city', 10),
+        'top titles': lambda: db_mgr.count_cleaned_jobs_by('title', 10),
+        'by month': db_mgr.count_cleaned_jobs_by_month,
+        'recent by province': lambda: run_query(recent),
+    }
+
+def time_queries(repeat, migrated):
+    from src import db_manager as db_mgr
+
+    pending = (lambda: run_query("SELECT id FROM jobs WHERE processed_at IS NULL")) if migrated else \
+        (lambda: run_query(ANTI_JOIN))
+    id_fetch = db_mgr.get_existing_job_ids if migrated else legacy_id_fetch
+    timings = {'pending jobs': best_of(repeat, pending), 'existing IDs': best_of(repeat, id_fetch)}
+    for name, query in dashboard_queries().items():
+        timings[name] = best_of(repeat, query)
+    return timings
+
+def run_benchmark(rows, repeat, partition):
+    from src import db_manager as db_mgr
+    from src import schema
+
+    print(f"Filling {rows:,} raw and cleaned jobs...")
+    db_mgr.init_db()
+    fill(rows)
+
+    columns = {}
+    set_indexes(create=False)
+    columns['baseline'] = time_queries(repeat, migrated=False)
+    set_indexes(create=True)
+    columns['migrated'] = time_queries(repeat, migrated=True)
+    if partition:
+        with db_mgr.connection_scope() as conn:
+            schema.partition_jobs_cleaned(conn)
+            conn.exec_driver_sql('ANALYZE')
+        columns['partitioned'] = time_queries(repeat, migrated=True)
+
+    print(f"\n{'query (ms)':<20}" + ''.join(f"{name:>13}" for name in columns))
+    for query in columns['baseline']:
+        print(f"{query:<20}" + ''.join(f"{timings[query] * 1000:>13.1f}" for timings in columns.values()))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--db-url', help="scratch database to fill (default: a temporary SQLite file)")
+    parser.add_argument('--partition', action='store_true', help="also time a month-partitioned jobs_cleaned (PostgreSQL)")
+    args = parser.parse_args()
+
+    temp_dir = None
+    if not args.db_url:
+        temp_dir = tempfile.TemporaryDirectory()
+        args.db_url = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+    # db_manager reads DB_URL when its engine is first created
+    os.environ['DB_URL'] = args.db_url
+    run_benchmark(args.rows, args.repeat, args.partition)
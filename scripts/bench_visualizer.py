@@ -0,0 +1,77 @@
+"""
+Benchmark how the visualizer's aggregate loading scales with the number of cleaned jobs.
+
+For each size, a SQLite stand-in database (or the database given with --db-url) is filled
+with cleaned jobs sampled from the example job_listings.csv, and the same rows are written
+to a cleaned CSV. The chart aggregates are then loaded three ways: pandas over the CSV, SQL
+pushdown on jobs_cleaned, and the rollup tables. Plotting is not timed, and the three
+sources are checked to agree.
+
+Usage: python -m scripts.bench_visualizer [--sizes 10000 100000 1000000] [--db-url URL]
+A --db-url database must be a scratch database: jobs_cleaned and the rollups are emptied.
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+def fill(count, csv_path):
+    from src import db_manager as db_mgr
+    from src.cleaner import clean_job_batch
+    from scripts.bench_cleaner import make_raw_jobs
+
+    cleaned = clean_job_batch(make_raw_jobs(count), method='vectorized')
+    with db_mgr.connection_scope():
+        db_mgr.save_cleaned_jobs_to_db(cleaned)
+    with open(csv_path, mode='w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=list(cleaned[0]))
+        writer.writeheader()
+        writer.writerows(cleaned)
+
+def reset():
+    from sqlalchemy import delete
+    from src import db_manager as db_mgr
+
+    db_mgr.init_db()
+    with db_mgr.connection_scope() as conn:
+        for table in (db_mgr.jobs_cleaned_table, db_mgr.rollup_counts_table,
+                      db_mgr.rollup_salary_table, db_mgr.rollup_salary_sketch_table):
+            conn.execute(delete(table))
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+def run_benchmark(sizes):
+    from src import visualizer
+
+    print(f"{'rows':>9} {'csv s':>8} {'sql s':>8} {'rollups s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'cleaned.csv')
+        for count in sizes:
+            reset()
+            fill(count, csv_path)
+            csv_s, from_csv = timed(visualizer.csv_aggregates, csv_path)
+            sql_s, from_sql = timed(visualizer.sql_aggregates)
+            rollup_s, from_rollups = timed(visualizer.rollup_aggregates)
+            # Only the untied top-N entries are guaranteed to match across sources
+            for name in ('province_counts', 'monthly_counts'):
+                if not (from_csv[name].to_dict() == from_sql[name].to_dict() == from_rollups[name].to_dict()):
+                    raise AssertionError(f"{name} differs between sources at {count} rows")
+            print(f"{count:>9,} {csv_s:>8.3f} {sql_s:>8.3f} {rollup_s:>10.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--db-url', help="scratch database to fill (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    temp_dir = None
+    if not args.db_url:
+        temp_dir = tempfile.TemporaryDirectory()
+        args.db_url = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+    # db_manager reads DB_URL when its engine is first created
+    os.environ['DB_URL'] = args.db_url
+    run_benchmark(args.sizes)
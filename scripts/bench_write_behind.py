@@ -0,0 +1,77 @@
+"""
+Benchmark synchronous saves against the background writer in a simulated crawl loop.
+
+Each section waits --browser-ms (the 'Show more' click and page update) and yields 25 new
+jobs. The synchronous loop then saves them, paying --db-ms per insert round-trip. The
+write-behind loop queues them for a BackgroundWriter, which coalesces sections into larger
+inserts while the next section loads. A final run makes the writer fail and checks that the
+crawl loop sees the error.
+
+Usage: python -m scripts.bench_write_behind [--sections 40] [--browser-ms 200] [--db-ms 150]
+"""
+import argparse
+import time
+from src.write_behind import BackgroundWriter, BackgroundWriteError
+
+JOBS_PER_SECTION = 25
+
+def make_section(number):
+    return [{'id': f"article-{number * JOBS_PER_SECTION + i}"} for i in range(JOBS_PER_SECTION)]
+
+def slow_save(db_seconds, batches):
+    def save(jobs):
+        time.sleep(db_seconds)
+        batches.append(len(jobs))
+        return len(jobs)
+    return save
+
+def crawl_synchronous(sections, browser_seconds, save):
+    for number in range(sections):
+        time.sleep(browser_seconds)
+        save(make_section(number))
+
+def crawl_write_behind(sections, browser_seconds, save, batch_size):
+    with BackgroundWriter(save, batch_size=batch_size) as writer:
+        for number in range(sections):
+            time.sleep(browser_seconds)
+            writer.submit(make_section(number))
+
+def check_failure(browser_seconds):
+    def failing_save(jobs):
+        raise ConnectionError("server closed the connection unexpectedly")
+
+    try:
+        with BackgroundWriter(failing_save, batch_size=JOBS_PER_SECTION) as writer:
+            for number in range(20):
+                time.sleep(browser_seconds)
+                writer.submit(make_section(number))
+    except BackgroundWriteError as e:
+        print(f"Write failure surfaced to the crawl loop: {e}")
+        return
+    raise AssertionError("The write failure was not raised in the crawl loop")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sections', type=int, default=40)
+    parser.add_argument('--browser-ms', type=float, default=200)
+    parser.add_argument('--db-ms', type=float, default=150)
+    parser.add_argument('--batch-size', type=int, default=100)
+    args = parser.parse_args()
+    browser_seconds, db_seconds = args.browser_ms / 1000, args.db_ms / 1000
+
+    batches = []
+    start = time.perf_counter()
+    crawl_synchronous(args.sections, browser_seconds, slow_save(db_seconds, batches))
+    sync_s = time.perf_counter() - start
+    print(f"synchronous:  {sync_s:6.2f}s, {len(batches)} inserts, {sum(batches)} jobs")
+
+    batches = []
+    start = time.perf_counter()
+    crawl_write_behind(args.sections, browser_seconds, slow_save(db_seconds, batches), args.batch_size)
+    behind_s = time.perf_counter() - start
+    if sum(batches) != args.sections * JOBS_PER_SECTION:
+        raise AssertionError(f"Write-behind saved {sum(batches)} jobs")
+    print(f"write-behind: {behind_s:6.2f}s, {len(batches)} inserts, {sum(batches)} jobs "
+          f"({sync_s / behind_s:.2f}x)")
+
+    check_failure(browser_seconds / 10)
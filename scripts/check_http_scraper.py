@@ -0,0 +1,114 @@
+"""
+Check the HTTP scraper engine end to end against the local Job Bank stand-in.
+
+The fixture server (scripts/fixture_server.py) serves --articles listings, --page-size
+per page, and an empty page after the last one. run_http_scraper crawls it into a scratch
+SQLite database, and the check asserts that:
+  - every page up to and including the empty one is fetched, and nothing after it;
+  - every listing is saved to the jobs table;
+  - a second run over the same database stops on the duplicate streak without saving;
+  - against a server that ignores the page number, the crawl stops at the repeated
+    page 2 and reports no result, so the 'auto' engine falls back to Selenium.
+Exits non-zero on the first failure.
+
+Usage: python -m scripts.check_http_scraper [--articles 100] [--page-size 25]
+"""
+import argparse
+import os
+import sys
+import tempfile
+from http.server import ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs, urlsplit
+from scripts.fixture_server import SEARCH_PATH, make_handler
+
+def fail(message):
+    print(f"FAIL: {message}")
+    sys.exit(1)
+
+def start_server(article_count, page_size, repeat_first_page=False):
+    """
+    Fixture server recording the page numbers requested.
+    Returns tuple: (server, search_url, requested_pages)
+    """
+    requested = []
+
+    class RecordingHandler(make_handler(article_count, page_size)):
+        def do_GET(self):
+            requested.append(int(parse_qs(urlsplit(self.path).query).get('page', ['1'])[0]))
+            if repeat_first_page:
+                # Like a site that ignores the page parameter
+                self.path = f"{SEARCH_PATH}?page=1"
+            super().do_GET()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RecordingHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}{SEARCH_PATH}?page=1&sort=D", requested
+
+def use_database(url):
+    from src import db_manager as db_mgr
+
+    # db_manager reads DB_URL when its engine is first created
+    os.environ['DB_URL'] = url
+    db_mgr.dispose_engine()
+    db_mgr.init_db()
+
+def saved_job_ids():
+    from sqlalchemy import select
+    from src import db_manager as db_mgr
+
+    with db_mgr.connection_scope() as conn:
+        return set(conn.execute(select(db_mgr.jobs_table.c.id)).scalars())
+
+def crawl(article_count, page_size, repeat_first_page=False):
+    from src.http_scraper import run_http_scraper
+
+    server, url, requested = start_server(article_count, page_size, repeat_first_page)
+    try:
+        found = run_http_scraper(url, page_delay=0)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return found, requested
+
+def check(article_count, page_size, temp_dir):
+    pages = -(-article_count // page_size)
+
+    use_database(f"sqlite:///{os.path.join(temp_dir, 'crawl.db')}")
+    found, requested = crawl(article_count, page_size)
+    if requested != list(range(1, pages + 2)):
+        fail(f"expected pages 1..{pages + 1} (the last one empty) to be fetched, got {requested}")
+    if found != article_count:
+        fail(f"run_http_scraper reported {found} new jobs, expected {article_count}")
+    if len(saved_job_ids()) != article_count:
+        fail(f"{len(saved_job_ids())} jobs saved, expected {article_count}")
+    print(f"Crawl: {len(requested)} pages fetched, {article_count} jobs saved, stopped on the empty page.")
+
+    found, requested = crawl(article_count, page_size)
+    if found != 0 or len(saved_job_ids()) != article_count:
+        fail(f"second run found {found} new jobs; the database holds {len(saved_job_ids())}")
+    if len(requested) >= pages + 1:
+        fail(f"second run fetched every page ({requested}) instead of stopping on duplicates")
+    print(f"Incremental: second run stopped on duplicates after {len(requested)} pages, nothing saved.")
+
+    use_database(f"sqlite:///{os.path.join(temp_dir, 'repeat.db')}")
+    found, requested = crawl(article_count, page_size, repeat_first_page=True)
+    if requested != [1, 2]:
+        fail(f"expected the crawl to stop at the repeated page 2, got pages {requested}")
+    if found is not None:
+        fail(f"repeated pages: run_http_scraper reported {found} new jobs instead of None (no fallback)")
+    print(f"Repeated page: stopped after page {requested[-1]}, reported as unpaginated "
+          f"({len(saved_job_ids())} first-page jobs saved).")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--articles', type=int, default=100)
+    parser.add_argument('--page-size', type=int, default=25)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        check(args.articles, args.page_size, temp_dir)
+        from src import db_manager as db_mgr
+
+        # Release the SQLite files before the directory is removed
+        db_mgr.dispose_engine()
@@ -0,0 +1,89 @@
+"""
+Check the cold-start import time of each CLI command against a budget.
+
+Every command is imported in a fresh interpreter with `python -X importtime`: the CLI
+module plus the modules its stage loads on the default path. The check fails if their
+import time (best of --repeat runs, not counting the interpreter's own startup imports)
+exceeds the command's budget, or if a heavy dependency the stage does not need gets
+imported at all (e.g. Selenium for `clean`).
+The forbidden-module part is exact; the time budgets are for a typical container and
+can be scaled with --budget-scale on slower machines.
+
+Usage: python -m scripts.check_import_time [--repeat 5] [--budget-scale 1.0]
+"""
+import argparse
+import subprocess
+import sys
+
+HEAVY = {'selenium', 'webdriver_manager', 'bs4', 'requests', 'sqlalchemy', 'pandas', 'numpy', 'matplotlib',
+         'seaborn', 'pyarrow'}
+
+# command: (modules imported by the command, budget in ms, heavy packages it may import)
+# Budgets are about twice the import times measured over repeated runs in the dev container
+# (help ~30, scrape 480-710, clean 370-470, visualize ~40, export 370-410 ms), so scheduler
+# noise does not fail the check but a new heavy import does
+COMMANDS = {
+    'help': (['src.cli'], 100, set()),
+    'scrape': (['src.cli', 'src.scraper', 'src.http_scraper'], 1400, {'sqlalchemy', 'requests', 'bs4'}),
+    'clean': (['src.cli', 'src.cleaner'], 800, {'sqlalchemy'}),
+    'visualize': (['src.cli', 'src.visualizer'], 100, set()),
+    'export': (['src.cli', 'src.exporter'], 800, {'sqlalchemy'}),
+}
+
+def import_profile(code):
+    """
+    {top-level module: cumulative import ms} and the top-level packages imported, for
+    running code in a fresh interpreter.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    timings = {}
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        if not cumulative_us.strip().isdigit():
+            continue  # header line
+        # Nesting is shown by indentation; unindented names are imported by the code itself
+        if not name[1:].startswith(' '):
+            timings[name.strip()] = timings.get(name.strip(), 0) + int(cumulative_us) / 1000
+        packages.add(name.strip().split('.')[0])
+    return timings, packages
+
+def stage_import_ms(modules, startup):
+    """(import ms, packages) of the modules, without the interpreter's own startup imports."""
+    timings, packages = import_profile('; '.join(f"import {module}" for module in modules))
+    startup_timings, startup_packages = startup
+    return sum(ms for name, ms in timings.items() if name not in startup_timings), packages - startup_packages
+
+def fail(message):
+    print(f"FAIL: {message}")
+    sys.exit(1)
+
+def check(repeat, budget_scale):
+    print(f"{'command':<10} {'import ms':>10} {'budget ms':>10}")
+    failures = []
+    # Imported by every interpreter (site, sitecustomize, .pth hooks) before any of ours
+    startup = import_profile('pass')
+    for command, (modules, budget_ms, allowed) in COMMANDS.items():
+        runs = [stage_import_ms(modules, startup) for _ in range(repeat)]
+        best_ms = min(total for total, _ in runs)
+        budget_ms *= budget_scale
+        print(f"{command:<10} {best_ms:>10.1f} {budget_ms:>10.0f}")
+
+        unexpected = (HEAVY - allowed) & runs[0][1]
+        if unexpected:
+            failures.append(f"'{command}' imports {', '.join(sorted(unexpected))}")
+        if best_ms > budget_ms:
+            failures.append(f"'{command}' imports take {best_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    if failures:
+        fail('; '.join(failures))
+    print("Every command is within its import budget.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-scale', type=float, default=1.0)
+    args = parser.parse_args()
+    check(args.repeat, args.budget_scale)
@@ -0,0 +1,148 @@
+"""
+Check the salary grammar against a fixed corpus and randomized property tests.
+
+The corpus pins expected (min, max, period) results for English and French Job Bank
+variants, range keywords and malformed numbers. The fuzz step builds random salary
+strings from known amounts and periods, formats them in several styles and checks that
+parse_salary recovers them (and that the Job Bank fast path agrees with the general
+scan_salary tokenizer); it also feeds random garbage and checks that nothing raises
+and that the results are well formed.
+Exits non-zero on the first failure.
+
+Usage: python -m scripts.check_salary_grammar [--cases 20000] [--seed 0]
+"""
+import argparse
+import random
+import string
+import sys
+from src.salary_parser import ANNUAL_FACTORS, annualize, parse_salary, scan_salary
+
+CORPUS = [
+    ("Salary $42.41 to $96.63 hourly", (42.41, 96.63, 'hourly')),
+    ("Salary $119,700.00 annually", (119700.0, 119700.0, 'annually')),
+    ("Salary $10,000.00 monthly", (10000.0, 10000.0, 'monthly')),
+    ("Salary $44.00 to $46.00 hourly (to be negotiated)", (44.0, 46.0, 'hourly')),
+    ("Salary $2,000.00 biweekly", (2000.0, 2000.0, 'biweekly')),
+    ("Salary $1,500.00 bi-weekly", (1500.0, 1500.0, 'biweekly')),
+    ("Salary $900.00 weekly", (900.0, 900.0, 'weekly')),
+    ("Salary $250.00 daily", (250.0, 250.0, 'daily')),
+    ("$25 - $30 per hour", (25.0, 30.0, 'hourly')),
+    ("$40/hr", (40.0, 40.0, 'hourly')),
+    ("up to $50/hour", (None, 50.0, 'hourly')),
+    ("From $60K a year", (60000.0, None, 'annually')),
+    ("$70,000 per annum", (70000.0, 70000.0, 'annually')),
+    ("$3,200 every two weeks", (3200.0, 3200.0, 'biweekly')),
+    ("Salaire 42,41 $ à 96,63 $ de l'heure", (42.41, 96.63, 'hourly')),
+    ("Salaire 119 700,00 $ par année", (119700.0, 119700.0, 'annually')),
+    ("Salaire 119 700,00 $ annuellement", (119700.0, 119700.0, 'annually')),
+    ("de 50 000 $ à 60 000 $ par an", (50000.0, 60000.0, 'annually')),
+    ("jusqu'à 30 $ de l’heure", (None, 30.0, 'hourly')),
+    ("à partir de 4 000 $ par mois", (4000.0, None, 'monthly')),
+    ("1.234,56 $ aux deux semaines", (1234.56, 1234.56, 'biweekly')),
+    ("800 $ par semaine", (800.0, 800.0, 'weekly')),
+    ("Salaire de 25,00 $ de l'heure", (25.0, 25.0, 'hourly')),
+    ("De 50 000 $ par année", (50000.0, 50000.0, 'annually')),
+    ("Salaire de 42,41 $ à 96,63 $ de l'heure", (42.41, 96.63, 'hourly')),
+    ("$2,500 semi-monthly", (2500.0, 2500.0, 'semimonthly')),
+    ("2 500 $ bimensuel", (2500.0, 2500.0, 'semimonthly')),
+    ("Salary $40.", (40.0, 40.0, None)),
+    ("1.2.3 hourly", (None, None, 'hourly')),
+    ("12,34,5 weekly", (None, None, 'weekly')),
+    ("hourly", (None, None, 'hourly')),
+    ("N/A", (None, None, None)),
+    ("s/o", (None, None, None)),
+    ("", (None, None, None)),
+    (None, (None, None, None)),
+]
+
+PERIOD_WORDS = {
+    'hourly': ["hourly", "per hour", "/hr", "de l'heure"],
+    'daily': ["daily", "per day", "par jour"],
+    'weekly': ["weekly", "per week", "par semaine"],
+    'biweekly': ["biweekly", "bi-weekly", "every two weeks", "aux deux semaines"],
+    'semimonthly': ["semi-monthly", "semimonthly", "bimensuel"],
+    'monthly': ["monthly", "per month", "par mois"],
+    'annually': ["annually", "per year", "par année", "yearly"],
+}
+
+def format_amount(value, rng):
+    """Render a two-decimal amount in one of the formats Job Bank (or a human) uses."""
+    whole, cents = f"{value:.2f}".split('.')
+    groups = []
+    while len(whole) > 3:
+        groups.insert(0, whole[-3:])
+        whole = whole[:-3]
+    groups.insert(0, whole)
+    style = rng.choice(['english', 'french', 'plain'])
+    if style == 'english':
+        return "$" + ",".join(groups) + "." + cents
+    if style == 'french':
+        return " ".join(groups) + "," + cents + " $"
+    return "$" + "".join(groups) + "." + cents
+
+def random_salary(rng):
+    period = rng.choice(list(PERIOD_WORDS))
+    low = round(rng.uniform(1, 250_000), 2)
+    high = round(low + rng.uniform(0, 50_000), 2)
+    template = rng.choice(['single', 'range', 'range_fr'])
+    word = rng.choice(PERIOD_WORDS[period])
+    if template == 'single':
+        return f"Salary {format_amount(low, rng)} {word}", (low, low, period)
+    if template == 'range':
+        return f"Salary {format_amount(low, rng)} to {format_amount(high, rng)} {word}", (low, high, period)
+    return f"Salaire {format_amount(low, rng)} à {format_amount(high, rng)} {word}", (low, high, period)
+
+def random_garbage(rng):
+    alphabet = string.ascii_letters + string.digits + " $,.'/-()àé "
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+
+def fail(message):
+    print(f"FAIL: {message}")
+    sys.exit(1)
+
+def check_corpus():
+    for salary, expected in CORPUS:
+        result = parse_salary(salary)
+        if result != expected:
+            fail(f"{salary!r}: expected {expected}, got {result}")
+        if salary and salary.lower() not in ("n/a", "s/o") and scan_salary(salary) != expected:
+            fail(f"{salary!r}: scan_salary expected {expected}, got {scan_salary(salary)}")
+    print(f"Corpus: {len(CORPUS)} cases passed.")
+
+def check_well_formed(salary, result):
+    min_salary, max_salary, period = result
+    if period is not None and period not in ANNUAL_FACTORS:
+        fail(f"{salary!r}: unknown period {period!r}")
+    for amount in (min_salary, max_salary):
+        if amount is not None and (not isinstance(amount, float) or amount < 0):
+            fail(f"{salary!r}: bad amount {amount!r}")
+        annual = annualize(amount, period)
+        if annual is not None and annual != round(amount * ANNUAL_FACTORS[period], 2):
+            fail(f"{salary!r}: bad annualized amount {annual!r}")
+
+def check_fuzz(cases, seed):
+    rng = random.Random(seed)
+    for _ in range(cases):
+        salary, expected = random_salary(rng)
+        result = parse_salary(salary)
+        if result != expected:
+            fail(f"{salary!r}: expected {expected}, got {result}")
+        if scan_salary(salary) != result:
+            fail(f"{salary!r}: scan_salary gives {scan_salary(salary)}, parse_salary gives {result}")
+        check_well_formed(salary, result)
+
+        garbage = random_garbage(rng)
+        try:
+            result = parse_salary(garbage)
+        except Exception as e:
+            fail(f"{garbage!r} raised {e!r}")
+        check_well_formed(garbage, result)
+    print(f"Fuzz: {cases} generated and {cases} random strings passed (seed {seed}).")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cases', type=int, default=20_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    check_corpus()
+    check_fuzz(args.cases, args.seed)
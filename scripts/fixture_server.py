@@ -0,0 +1,72 @@
+"""
+Local HTTP stand-in for the Job Bank search pages.
+
+Serves /jobsearch/jobsearch?page=N built from the saved fixture page, `page_size`
+articles per page, and an empty result page past the last one. Use it to run the
+HTTP scraper engine without touching jobbank.gc.ca.
+
+Usage: python -m scripts.fixture_server [--port 8000] [--articles 100] [--page-size 25]
+Then:  python -c "from src.http_scraper import run_http_scraper; \\
+           run_http_scraper('http://127.0.0.1:8000/jobsearch/jobsearch?page=1', page_delay=0)"
+scripts/check_http_scraper.py runs that crawl automatically and checks the results.
+"""
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from scripts.bench_fixtures import load_fixture_page, build_articles
+
+SEARCH_PATH = '/jobsearch/jobsearch'
+
+def make_handler(article_count, page_size):
+    head, _, tail = load_fixture_page()
+    articles = build_articles(article_count)
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path != SEARCH_PATH:
+                self.send_error(404)
+                return
+            try:
+                page = int(parse_qs(parts.query).get('page', ['1'])[0])
+            except ValueError:
+                self.send_error(400, "Invalid page number")
+                return
+
+            start = (page - 1) * page_size
+            body = (head + ''.join(articles[start:start + page_size]) + tail).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # keep scraper output readable
+
+    return FixtureHandler
+
+def start_fixture_server(article_count=100, page_size=25, port=0):
+    """
+    Start the stand-in on a background thread.
+    Returns tuple: (server, search_url) - call server.shutdown() when done.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(article_count, page_size))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}{SEARCH_PATH}?page=1&sort=D"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--articles', type=int, default=100, help="Total articles across all pages")
+    parser.add_argument('--page-size', type=int, default=25, help="Articles per page")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(args.articles, args.page_size))
+    print(f"Serving {args.articles} fixture articles at http://127.0.0.1:{args.port}{SEARCH_PATH}?page=1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,259 @@
+"""
+Stream rows from a CSV file or a database table into the jobs or jobs_cleaned table.
+
+Rows are read in fixed-size batches (keyset pagination on the primary key for databases,
+so no long read transaction is held) and written through the bulk loader, skipping rows
+whose ID already exists. After each committed batch the position is saved to a checkpoint
+file, so an interrupted migration resumes after the last committed batch instead of
+starting over. Throughput is reported in rows/sec.
+
+Usage:
+  python -m scripts.migrate data/data_example/job_listings.csv
+  python -m scripts.migrate sqlite:///data/job_listings.db --target-url postgresql://...
+  python -m scripts.migrate SOURCE [--source-table jobs] [--table jobs] [--batch-size 10000]
+                           [--checkpoint FILE] [--restart] [--replace]
+The target is the db_manager database (DB_URL / DB_HOST) unless --target-url is given.
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from datetime import date, datetime
+from itertools import islice
+from sqlalchemy import MetaData, Table, make_url, select, update
+from sqlalchemy.types import Date, DateTime, Float, Integer, String
+from src import db_manager as db_mgr
+from src.bulk_loader import bulk_insert
+from src.dates import posted_on
+from src.constants import BULK_INSERT_METHOD
+from src.id_index import article_number
+
+MIGRATION_BATCH_SIZE = 10_000
+CHECKPOINT_DIR = 'data/migrations'
+
+def is_database_url(source):
+    return '://' in str(source)
+
+def describe(url):
+    # Never write passwords to the checkpoint file or the console
+    return make_url(url).render_as_string(hide_password=True) if is_database_url(url) else str(url)
+
+def checkpoint_path(source, source_table, table):
+    name = os.path.basename(str(source)) if not is_database_url(source) else source_table
+    return os.path.join(CHECKPOINT_DIR, f"{name}-to-{table}.json")
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, mode='r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_checkpoint(path, checkpoint):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, mode='w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(temp_path, path)
+
+def csv_batches(path, batch_size, position):
+    """
+    Yield (rows, position) from a CSV file, where position is the number of data rows
+    consumed so far. Resuming skips the first position rows without converting them.
+    """
+    with open(path, mode='r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        for _ in islice(reader, position or 0):
+            pass
+        consumed = position or 0
+        while True:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                return
+            consumed += len(rows)
+            yield rows, consumed
+
+def table_batches(url, table_name, batch_size, position):
+    """
+    Yield (rows, position) from a database table in primary-key order, where position is
+    the last key read. Each batch is a separate short query (WHERE key > position LIMIT n).
+    """
+    engine = db_mgr.create_db_engine(url)
+    try:
+        table = Table(table_name, MetaData(), autoload_with=engine)
+        key_columns = list(table.primary_key.columns)
+        if len(key_columns) != 1:
+            raise ValueError(f"{table_name} needs a single-column primary key to be migrated in batches")
+        key = key_columns[0]
+        while True:
+            query = select(table).order_by(key).limit(batch_size)
+            if position is not None:
+                query = query.where(key > position)
+            with engine.connect() as conn:
+                rows = [dict(row) for row in conn.execute(query).mappings()]
+            if not rows:
+                return
+            position = rows[-1][key.name]
+            yield rows, position
+    finally:
+        engine.dispose()
+
+def _coerce(column, value):
+    # CSV values are strings; convert them to the target column's type (empty = NULL)
+    if not isinstance(value, str) or isinstance(column.type, String):
+        return value
+    if value == '':
+        return None
+    if isinstance(column.type, Date):
+        return date.fromisoformat(value[:10])
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Float):
+        return float(value)
+    if isinstance(column.type, Integer):
+        return int(value)
+    return value
+
+def target_rows(table, rows, migrated_at):
+    """
+    Map source rows onto the target table's columns. Columns the source lacks are NULL,
+    except the scraped_at/cleaned_at timestamps, which default to the migration time, and
+    job_number/posted_on, which are derived from id/date_posted.
+    """
+    for row in rows:
+        target = {column.name: _coerce(column, row.get(column.name)) for column in table.columns}
+        for stamp in ('scraped_at', 'cleaned_at'):
+            if stamp in target and target[stamp] is None:
+                target[stamp] = migrated_at
+        # Derived columns, for sources older than the schema (see src/schema.py)
+        if 'job_number' in target and target['job_number'] is None and target['id']:
+            target['job_number'] = article_number(target['id'])
+        if 'posted_on' in target and target['posted_on'] is None and target['date_posted']:
+            target['posted_on'] = posted_on(target['date_posted'])
+        yield target
+
+def keep_processed_if_cleaned(conn, rows):
+    """
+    Clear processed_at on jobs rows whose cleaned row is not in the target's jobs_cleaned,
+    so the next clean run picks them up instead of skipping them for good.
+    """
+    processed_ids = [row['id'] for row in rows if row['processed_at'] is not None]
+    if not processed_ids:
+        return
+    cleaned_table = db_mgr.jobs_cleaned_table
+    cleaned_ids = set(conn.execute(select(cleaned_table.c.id).where(cleaned_table.c.id.in_(processed_ids))).scalars())
+    for row in rows:
+        if row['id'] not in cleaned_ids:
+            row['processed_at'] = None
+
+def clear_cleaned_state(conn):
+    """After jobs_cleaned is dropped: empty the rollups and mark every job pending again."""
+    from src.rollups import rebuild_rollups
+
+    rebuild_rollups(conn)
+    conn.execute(update(db_mgr.jobs_table).values(processed_at=None))
+
+def migrate(source, table='jobs', source_table=None, target_url=None, batch_size=MIGRATION_BATCH_SIZE,
+            checkpoint_file=None, restart=False, replace=False, method=BULK_INSERT_METHOD, max_batches=None):
+    """
+    Copy rows from source (a CSV path or a database URL) into the target table.
+    Resumes from the checkpoint file unless restart is set; replace drops and recreates
+    the target table first (implies restart). max_batches stops early, e.g. to test resuming.
+    Migrated jobs keep processed_at only if their cleaned row is already in the target;
+    migrated jobs_cleaned rows update the rollups and mark their jobs processed.
+    Returns (rows_read, rows_inserted) for this run.
+    """
+    target_table = db_mgr.metadata.tables[table]
+    source_table = source_table or table
+    checkpoint_file = checkpoint_file or checkpoint_path(source, source_table, table)
+    engine = db_mgr.create_db_engine(target_url) if target_url else db_mgr.get_engine()
+
+    checkpoint = None if (restart or replace) else load_checkpoint(checkpoint_file)
+    source_name = describe(source)
+    if checkpoint and (checkpoint['source'], checkpoint['source_table'], checkpoint['table']) != (source_name, source_table, table):
+        raise ValueError(f"{checkpoint_file} belongs to another migration "
+                         f"({checkpoint['source']}:{checkpoint['source_table']} -> {checkpoint['table']}); "
+                         f"pass --checkpoint or --restart")
+    if checkpoint and checkpoint.get('done'):
+        print(f"Migration already completed ({checkpoint['rows_read']} rows read). Use --restart to run it again.")
+        return 0, 0
+    if checkpoint is None:
+        checkpoint = {'source': source_name, 'source_table': source_table, 'table': table,
+                      'position': None, 'rows_read': 0, 'rows_inserted': 0, 'done': False}
+    else:
+        print(f"Resuming after {checkpoint['rows_read']} rows (position {checkpoint['position']!r}).")
+
+    if replace:
+        print(f"Dropping {table} on the target database...")
+        target_table.drop(engine, checkfirst=True)
+    db_mgr.metadata.create_all(engine)
+    with engine.begin() as conn:
+        db_mgr.ensure_columns(conn, target_table)
+        if replace and table == 'jobs_cleaned':
+            # The dropped rows are still counted in the rollups and their jobs marked processed
+            clear_cleaned_state(conn)
+
+    if is_database_url(source):
+        batches = table_batches(source, source_table, batch_size, checkpoint['position'])
+    else:
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"{source} not found")
+        batches = csv_batches(source, batch_size, checkpoint['position'])
+
+    print(f"Migrating {source_name} -> {table} in batches of {batch_size}...")
+    start = time.perf_counter()
+    read = inserted = 0
+    try:
+        for number, (rows, position) in enumerate(batches, start=1):
+            with engine.begin() as conn:
+                migrated_at = datetime.now()
+                new_rows = list(target_rows(target_table, rows, migrated_at))
+                if table == 'jobs':
+                    keep_processed_if_cleaned(conn, new_rows)
+                inserted_ids = []
+                batch_inserted = bulk_insert(conn, target_table, new_rows, method=method, inserted_keys=inserted_ids)
+                if table == 'jobs_cleaned':
+                    from src.rollups import update_rollups
+                    update_rollups(conn, new_rows, set(inserted_ids))
+                    db_mgr.mark_jobs_processed(conn, [row['id'] for row in new_rows], migrated_at)
+            # Only recorded once the batch is committed: a crash re-reads at most one batch
+            read += len(rows)
+            inserted += batch_inserted
+            checkpoint.update(position=position, rows_read=checkpoint['rows_read'] + len(rows),
+                              rows_inserted=checkpoint['rows_inserted'] + batch_inserted)
+            save_checkpoint(checkpoint_file, checkpoint)
+
+            elapsed = time.perf_counter() - start
+            print(f"  {checkpoint['rows_read']:,} rows read, {checkpoint['rows_inserted']:,} inserted "
+                  f"({read / elapsed:,.0f} rows/s)")
+            if max_batches and number >= max_batches:
+                print(f"Stopped after {number} batches; run again to resume.")
+                return read, inserted
+    finally:
+        if target_url:
+            engine.dispose()
+
+    checkpoint['done'] = True
+    save_checkpoint(checkpoint_file, checkpoint)
+    elapsed = time.perf_counter() - start
+    rate = read / elapsed if elapsed else 0
+    print(f"Migration completed: {read:,} rows read, {inserted:,} new rows in {elapsed:.1f}s ({rate:,.0f} rows/s).")
+    return read, inserted
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('source', help="CSV file or SQLAlchemy database URL")
+    parser.add_argument('--table', default='jobs', choices=['jobs', 'jobs_cleaned'], help="target table")
+    parser.add_argument('--source-table', help="table to read from a database source (default: --table)")
+    parser.add_argument('--target-url', help="target database (default: the db_manager database)")
+    parser.add_argument('--batch-size', type=int, default=MIGRATION_BATCH_SIZE)
+    parser.add_argument('--checkpoint', help=f"checkpoint file (default: under {CHECKPOINT_DIR}/)")
+    parser.add_argument('--restart', action='store_true', help="ignore the checkpoint and start from the first row")
+    parser.add_argument('--replace', action='store_true', help="drop and recreate the target table first")
+    parser.add_argument('--method', default=BULK_INSERT_METHOD, choices=['auto', 'copy', 'executemany'])
+    return parser
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    migrate(args.source, args.table, args.source_table, args.target_url, args.batch_size,
+            args.checkpoint, args.restart, args.replace, args.method)
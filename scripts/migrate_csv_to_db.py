@@ -1,55 +1,22 @@
-import csv
-import sqlite3
-from datetime import datetime
-from src import db_manager as db_mgr
-from src.constants import DB_FILE, JOB_LISTINGS_CSV
-import os
-
-def migrate():
-
-    # 1. Connect and drop existing table
-    print(f"Connecting to {DB_FILE}...")
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    print("Dropping existing jobs table...")
-    cursor.execute("DROP TABLE IF EXISTS jobs")
-    conn.commit()
-    conn.close()
-
-    # 2. Re-initialize DB
-    print("Re-initializing database...")
-    db_mgr.init_db()
-
-    # 3. Read CSV and Insert
-    if not os.path.exists(JOB_LISTINGS_CSV):
-        print(f"Error: {JOB_LISTINGS_CSV} not found.")
-        return
+import argparse
+from scripts.migrate import migrate as run_migration, MIGRATION_BATCH_SIZE
+from src.constants import JOB_LISTINGS_CSV
 
+def migrate(replace=False, batch_size=MIGRATION_BATCH_SIZE):
+    """
+    Import the scraped jobs CSV into the jobs table of the configured database
+    (SQLite or PostgreSQL), streaming it in batches and resuming after an interruption.
+    Existing job IDs are kept; replace drops and recreates the jobs table first.
+    """
     print(f"Reading data from {JOB_LISTINGS_CSV}...")
-    jobs_to_import = []
-    
-    # utf-8-sig to handle BOM if present
-    with open(JOB_LISTINGS_CSV, mode='r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Prepare data for save_jobs_to_db format or custom insert
-            jobs_to_import.append({
-                'id': row['id'],
-                'title': row['title'],
-                'date_posted': row['date_posted'],
-                'location': row['location'],
-                'salary': row['salary']
-            })
-
-    print(f"Total jobs to migrate: {len(jobs_to_import)}")
-    
-    # 4. Save to DB
-    if jobs_to_import:
-        db_mgr.save_jobs_to_db(jobs_to_import)
-        print("Migration completed successfully!")
-    else:
-        print("No data found in CSV to migrate.")
+    try:
+        run_migration(str(JOB_LISTINGS_CSV), table='jobs', batch_size=batch_size, replace=replace)
+    except FileNotFoundError:
+        print(f"Error: {JOB_LISTINGS_CSV} not found.")
 
 if __name__ == "__main__":
-    migrate()
+    parser = argparse.ArgumentParser(description="Import the jobs CSV into the database.")
+    parser.add_argument('--replace', action='store_true', help="drop and recreate the jobs table first")
+    parser.add_argument('--batch-size', type=int, default=MIGRATION_BATCH_SIZE)
+    args = parser.parse_args()
+    migrate(args.replace, args.batch_size)
@@ -0,0 +1,105 @@
+import io
+from itertools import islice
+from sqlalchemy.dialects import postgresql, sqlite
+from src.constants import BULK_CHUNK_SIZE, BULK_INSERT_METHOD
+
+# Rows per COPY round-trip; COPY has no bound-parameter limit, so chunks can be much larger
+COPY_CHUNK_SIZE = 50_000
+
+def chunked(rows, chunk_size):
+    """
+    Yield lists of at most chunk_size rows from any iterable.
+    """
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def insert_ignore_duplicates(conn, table, rows, chunk_size=BULK_CHUNK_SIZE, inserted_keys=None):
+    """
+    INSERT ... ON CONFLICT DO NOTHING in executemany batches of chunk_size rows.
+    SQLAlchemy's insertmanyvalues batching keeps every statement under the driver's
+    parameter limit; RETURNING the primary key gives an exact count of new rows.
+    Any unique index counts as a conflict (no conflict target), so tables whose unique
+    key includes more columns, e.g. a partitioned jobs_cleaned, work too.
+    Primary keys of new rows are appended to inserted_keys if a list is given.
+    Returns the number of rows inserted.
+    """
+    dialect = sqlite if conn.dialect.name == 'sqlite' else postgresql
+    key = list(table.primary_key.columns)[0]
+    stmt = dialect.insert(table).on_conflict_do_nothing().returning(key)
+
+    inserted = 0
+    for chunk in chunked(rows, chunk_size):
+        keys = conn.execute(stmt, chunk).scalars().all()
+        inserted += len(keys)
+        if inserted_keys is not None:
+            inserted_keys.extend(keys)
+    return inserted
+
+def _copy_value(value):
+    # PostgreSQL COPY text format: \N is NULL, backslash escapes for control characters
+    if value is None:
+        return '\\N'
+    text = str(value)
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def copy_ignore_duplicates(conn, table, rows, chunk_size=COPY_CHUNK_SIZE, inserted_keys=None):
+    """
+    PostgreSQL bulk path: COPY each chunk into a temporary staging table, then
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING into the target table.
+    Runs inside the caller's transaction. Primary keys of new rows are appended to
+    inserted_keys if a list is given. Returns the number of rows inserted.
+    """
+    columns = [column.name for column in table.columns]
+    key = list(table.primary_key.columns)[0].name
+    column_list = ', '.join(f'"{name}"' for name in columns)
+    staging = f"{table.name}_staging"
+
+    conn.exec_driver_sql(
+        f'CREATE TEMP TABLE IF NOT EXISTS "{staging}" (LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DROP'
+    )
+    cursor = conn.connection.dbapi_connection.cursor()
+
+    inserted = 0
+    try:
+        for chunk in chunked(rows, chunk_size):
+            buffer = io.StringIO()
+            for row in chunk:
+                buffer.write('\t'.join(_copy_value(row.get(name)) for name in columns))
+                buffer.write('\n')
+            buffer.seek(0)
+
+            conn.exec_driver_sql(f'TRUNCATE "{staging}"')
+            cursor.copy_expert(f'COPY "{staging}" ({column_list}) FROM STDIN', buffer)
+            insert = (f'INSERT INTO "{table.name}" ({column_list}) SELECT {column_list} FROM "{staging}" '
+                      f'ON CONFLICT DO NOTHING')
+            if inserted_keys is None:
+                inserted += conn.exec_driver_sql(insert).rowcount
+                continue
+            keys = conn.exec_driver_sql(f'{insert} RETURNING "{key}"').scalars().all()
+            inserted += len(keys)
+            inserted_keys.extend(keys)
+    finally:
+        cursor.close()
+    return inserted
+
+def bulk_insert(conn, table, rows, method=BULK_INSERT_METHOD, chunk_size=None, inserted_keys=None):
+    """
+    Insert rows (dicts or src.records records keyed by column name), skipping existing primary keys.
+    method: 'copy' (PostgreSQL COPY via a staging table), 'executemany', or
+    'auto' (COPY on PostgreSQL with psycopg2, executemany elsewhere).
+    Pass a list as inserted_keys to collect the primary keys of the new rows.
+    Returns the exact number of new rows.
+    """
+    if method == 'auto':
+        use_copy = conn.dialect.name == 'postgresql' and conn.dialect.driver == 'psycopg2'
+        method = 'copy' if use_copy else 'executemany'
+
+    if method == 'copy':
+        return copy_ignore_duplicates(conn, table, rows, chunk_size or COPY_CHUNK_SIZE, inserted_keys)
+    if method == 'executemany':
+        return insert_ignore_duplicates(conn, table, rows, chunk_size or BULK_CHUNK_SIZE, inserted_keys)
+    raise ValueError(f"Unknown bulk insert method '{method}'. Choose from: auto, copy, executemany")
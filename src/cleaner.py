@@ -1,21 +1,13 @@
 import re
 from src import db_manager as db_mgr
+from src import metrics
+from src import parse_cache
+from src.constants import CLEANER_METHOD, CLEAN_CHUNK_SIZE, CLEAN_WORKERS, PARSE_CACHE_FILE, PARSE_CACHE_SIZE
+from src.dates import cached_parse_date, parse_date
+from src.records import CleanJob, intern
+from src.salary_parser import annualize, parse_salary
 from datetime import datetime
 
-def parse_date(date_str):
-    """
-    Convert date string to ISO format (YYYY-MM-DD).
-    Returns None if parsing fails.
-    """
-    if not date_str or date_str.lower() == "n/a":
-        return None
-    try:
-         # Handle format like "January 27, 2026"
-         parsed = datetime.strptime(date_str, "%B %d, %Y")
-         return parsed.strftime("%Y-%m-%d") 
-    except ValueError:
-        return None
-
 def parse_location(location_str):
     """
     Split location string into city and province.
@@ -26,78 +18,122 @@ def parse_location(location_str):
     
     # match city and province
     match = re.search(r'(.+?)\s*\((.+?)\)', location_str)
+    # Interned: every row of a city shares one string
     if match:
         city = match.group(1).strip()
         province = match.group(2).strip()
-        return city, province
+        return intern(city), intern(province)
+
+    return intern(location_str.strip()), None
+
+# Memoized parsers used by clean_job; the parse_* functions stay the uncached reference
+# (the date parser lives in src/dates.py, shared with db_manager)
+cached_parse_location = parse_cache.MemoizedParser(parse_location, PARSE_CACHE_SIZE)
+cached_parse_salary = parse_cache.MemoizedParser(parse_salary, PARSE_CACHE_SIZE)
+
+PARSE_CACHES = {
+    'date': cached_parse_date,
+    'location': cached_parse_location,
+    'salary': cached_parse_salary,
+}
 
-    return location_str.strip(), None
+def load_parse_caches(path=PARSE_CACHE_FILE):
+    parse_cache.load_caches(path, PARSE_CACHES)
 
-def parse_salary(salary_str):
+def save_parse_caches(path=PARSE_CACHE_FILE):
+    try:
+        parse_cache.save_caches(path, PARSE_CACHES)
+    except OSError as e:
+        print(f"Could not save parse cache {path}: {e}")
+
+def print_parse_cache_stats():
+    for name, cache in PARSE_CACHES.items():
+        print(f"Parse cache ({name}): {cache.stats()}")
+
+def clean_job(job):
     """
-    Extract min/max salary and period from salary string.
-    Returns tuple: (min_salary, max_salary, period)
+    Clean a single raw job (RawJob or dict) into a CleanJob row.
     """
-    if not salary_str or salary_str.lower() == "n/a":
-        return None, None, None
-    
-    # Extract all numeric values from the string
-    numbers = re.findall(r'[\d,.]+', salary_str)
-    numbers = [float(num.replace(',', '')) for num in numbers if num]
-
-    # Determine salary period
-    period = None
-    if "hourly" in salary_str.lower():
-        period = "hourly"
-    elif "annually" in salary_str.lower():
-        period = "annually"
-    elif "monthly" in salary_str.lower():
-        period = "monthly"
-    elif "weekly" in salary_str.lower():
-        period = "weekly"
-    elif "biweekly" in salary_str.lower():
-        period = "biweekly"
-    elif "daily" in salary_str.lower():
-        period = "daily"
-    
-    min_salary = numbers[0] if len(numbers) > 0 else None
-    max_salary = numbers[1] if len(numbers) > 1 else min_salary
-    
-    return min_salary, max_salary, period
+    city, province = cached_parse_location(job['location'])
+    min_salary, max_salary, period = cached_parse_salary(job['salary'])
 
-def clean_jobs():
+    return CleanJob(
+        job['id'],
+        job['title'],
+        cached_parse_date(job['date_posted']),
+        city,
+        province,
+        min_salary,
+        max_salary,
+        period,
+        annualize(min_salary, period),
+        annualize(max_salary, period),
+        datetime.now()
+    )
+
+@metrics.timed('clean.batch')
+def clean_job_batch(raw_jobs, method=CLEANER_METHOD):
+    """
+    Clean a list of raw jobs.
+    method: 'scalar' cleans row by row with the parse_* functions (the reference),
+    'vectorized' cleans the whole batch with pandas (same output).
+    """
+    if method == 'vectorized':
+        from src.vectorized_cleaner import clean_job_batch as clean_vectorized
+
+        return clean_vectorized(raw_jobs)
+    if method == 'scalar':
+        return [clean_job(job) for job in raw_jobs]
+    raise ValueError(f"Unknown cleaner method '{method}'. Choose from: scalar, vectorized")
+
+def clean_jobs(method=CLEANER_METHOD, chunk_size=CLEAN_CHUNK_SIZE, workers=CLEAN_WORKERS,
+               reprocess_since=None, reprocess_until=None):
     """
     Main cleaning function.
-    Fetches unprocessed jobs, cleans them, and saves to jobs_cleaned table.
+    Streams unprocessed jobs in chunks, cleans each chunk and saves it to the jobs_cleaned
+    table before the next one is fetched. Memory stays bounded by chunk_size, and a crash
+    mid-run only loses the chunk in progress. Only jobs not yet marked processed are read.
+    With workers > 1, chunks are cleaned in parallel worker processes instead (not on
+    SQLite, which allows one writer at a time: there the run stays in this process).
+    reprocess_since/reprocess_until (scraped_at bounds) first reset that range, so its
+    jobs are cleaned again, e.g. after a parser fix.
     """
-    # Fetch only unprocessed jobs
-    raw_jobs = db_mgr.get_unprocessed_jobs()
+    if reprocess_since is not None or reprocess_until is not None:
+        db_mgr.reset_processed_jobs(reprocess_since, reprocess_until)
+
+    if workers > 1 and db_mgr.get_engine().dialect.name == 'sqlite':
+        print(f"Warning: SQLite allows one writer at a time; cleaning with 1 worker instead of {workers}.")
+        workers = 1
+
+    if workers > 1:
+        from src.parallel_cleaner import clean_jobs_parallel
 
-    if not raw_jobs:
+        clean_jobs_parallel(workers, method, chunk_size)
+        return
+
+    load_parse_caches()
+    total = 0
+    for raw_jobs in db_mgr.iter_unprocessed_jobs(chunk_size):
+        print(f"Cleaning {len(raw_jobs)} unprocessed jobs...")
+        db_mgr.save_cleaned_jobs_to_db(clean_job_batch(raw_jobs, method))
+        total += len(raw_jobs)
+        metrics.count('clean.rows', len(raw_jobs))
+
+    if not total:
         print("No new jobs to clean.")
         return
-    
-    # Clean each job
-    print(f"Cleaning {len(raw_jobs)} unprocessed jobs...")
-    cleaned_jobs = []
-    for job in raw_jobs:
-        city, province = parse_location(job['location'])
-        min_salary, max_salary, period = parse_salary(job['salary'])
-
-        cleaned_jobs.append({
-            'id': job['id'],
-            'title': job['title'],
-            'date_posted': parse_date(job['date_posted']),
-            'city': city,
-            'province': province,
-            'min_salary': min_salary,
-            'max_salary': max_salary,
-            'salary_period': period,
-            'cleaned_at': datetime.now()
-        })
-    
-    # Save cleaned jobs to database
-    db_mgr.save_cleaned_jobs_to_db(cleaned_jobs)
+    print(f"Cleaned {total} jobs in total.")
+    if method == 'scalar':
+        print_parse_cache_stats()
+        save_parse_caches()
 
 if __name__ == "__main__":
-    clean_jobs()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Clean jobs scraped since the last run.")
+    parser.add_argument('--reprocess-since', type=datetime.fromisoformat,
+                        help="clean again every job scraped at or after this date/time (ISO format)")
+    parser.add_argument('--reprocess-until', type=datetime.fromisoformat,
+                        help="clean again every job scraped at or before this date/time (ISO format)")
+    args = parser.parse_args()
+    clean_jobs(reprocess_since=args.reprocess_since, reprocess_until=args.reprocess_until)
\ No newline at end of file
@@ -0,0 +1,135 @@
+import argparse
+import os
+import pkgutil
+import runpy
+import sys
+from datetime import datetime
+from src import metrics
+from src.constants import (CLEANED_JOB_LISTINGS_CSV, CLEANER_METHOD, CLEAN_CHUNK_SIZE, CLEAN_WORKERS, EXPORT_DIR,
+                           EXPORT_FORMAT, SCRAPER_ENGINE, VISUALIZATION_DPI, VISUALIZATION_FORMAT,
+                           VISUALIZATION_IMAGE, VISUALIZATION_PANELS, VISUALIZER_SOURCE)
+
+# Command-line entry point: python main.py <command> (no command runs scrape, then clean).
+# Only src.constants and src.metrics are imported up front; each command imports the
+# modules of its own stage, so e.g. `clean` never loads Selenium, BeautifulSoup or pandas.
+# scripts/check_import_time.py keeps these imports within a cold-start budget.
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+
+def init_db():
+    from src import db_manager as db_mgr
+
+    with metrics.timer('stage.init_db'):
+        try:
+            db_mgr.init_db()
+        except db_mgr.DatabaseConfigError as e:
+            raise SystemExit(f"Error: {e}")
+
+def scrape(args):
+    from src.scraper import run_scraper
+
+    init_db()
+    with metrics.timer('stage.scrape'):
+        run_scraper(args.engine)
+
+def clean(args):
+    from src.cleaner import clean_jobs
+
+    init_db()
+    # Streamed in chunks, each chunk committed on its own
+    with metrics.timer('stage.clean'):
+        clean_jobs(method=args.method, chunk_size=args.chunk_size, workers=args.workers,
+                   reprocess_since=args.reprocess_since, reprocess_until=args.reprocess_until)
+
+def run(args):
+    scrape(args)
+    clean(args)
+
+def visualize(args):
+    from src.visualizer import generate_visuals
+
+    if args.source in ('rollups', 'sql'):
+        # Configured and up to date (rollup tables included) before reading from it
+        init_db()
+    with metrics.timer('stage.visualize'):
+        generate_visuals(args.input, source=args.source, output_file=args.output, panels=args.panels,
+                         dpi=args.dpi, image_format=args.format)
+
+def export(args):
+    from src.exporter import export_cleaned_jobs
+
+    init_db()
+    with metrics.timer('stage.export'):
+        export_cleaned_jobs(args.dir, args.format)
+
+def bench_names():
+    return sorted(name[len('bench_'):] for _, name, _ in pkgutil.iter_modules([SCRIPTS_DIR])
+                  if name.startswith('bench_') and name != 'bench_fixtures')
+
+def bench(args):
+    if args.name not in bench_names():
+        raise SystemExit(f"Unknown benchmark '{args.name}'. Choose from: {', '.join(bench_names())}")
+    # Run the script as `python -m scripts.bench_<name> <args>` would
+    sys.argv = [f"scripts/bench_{args.name}.py", *args.args]
+    runpy.run_module(f"scripts.bench_{args.name}", run_name='__main__', alter_sys=True)
+
+def add_clean_arguments(parser):
+    parser.add_argument('--method', choices=['scalar', 'vectorized'], default=CLEANER_METHOD)
+    parser.add_argument('--chunk-size', type=int, default=CLEAN_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=CLEAN_WORKERS)
+    parser.add_argument('--reprocess-since', type=datetime.fromisoformat,
+                        help="clean again every job scraped at or after this date/time (ISO format)")
+    parser.add_argument('--reprocess-until', type=datetime.fromisoformat,
+                        help="clean again every job scraped at or before this date/time (ISO format)")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='main.py', description="Job Bank trend tracker.")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+
+    engine = argparse.ArgumentParser(add_help=False)
+    engine.add_argument('--engine', choices=['auto', 'http', 'sharded', 'selenium'], default=SCRAPER_ENGINE)
+
+    command = commands.add_parser('run', parents=[engine], help="scrape new jobs, then clean them (default)")
+    add_clean_arguments(command)
+    command.set_defaults(handler=run)
+
+    command = commands.add_parser('scrape', parents=[engine], help="scrape new jobs into the database")
+    command.set_defaults(handler=scrape)
+
+    command = commands.add_parser('clean', help="clean the jobs scraped since the last run")
+    add_clean_arguments(command)
+    command.set_defaults(handler=clean)
+
+    command = commands.add_parser('visualize', help="draw the job market charts")
+    command.add_argument('--source', choices=['rollups', 'sql', 'snapshot', 'csv'], default=VISUALIZER_SOURCE)
+    command.add_argument('--input', default=CLEANED_JOB_LISTINGS_CSV, help="cleaned CSV for --source csv")
+    command.add_argument('--output', default=VISUALIZATION_IMAGE)
+    command.add_argument('--panels', choices=['combined', 'separate'], default=VISUALIZATION_PANELS)
+    command.add_argument('--format', choices=['png', 'svg', 'webp'], default=VISUALIZATION_FORMAT)
+    command.add_argument('--dpi', type=int, default=VISUALIZATION_DPI)
+    command.set_defaults(handler=visualize)
+
+    command = commands.add_parser('export', help="append newly cleaned jobs to the columnar snapshot")
+    command.add_argument('--dir', default=EXPORT_DIR)
+    command.add_argument('--format', choices=['parquet', 'arrow'], default=EXPORT_FORMAT)
+    command.set_defaults(handler=export)
+
+    command = commands.add_parser('bench', help="run a benchmark from scripts/ (e.g. bench cleaner --sizes 10000)")
+    command.add_argument('name', help="benchmark name: bench_<name>.py in scripts/")
+    command.add_argument('args', nargs=argparse.REMAINDER, help="arguments passed to the benchmark")
+    command.set_defaults(handler=bench)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else argv
+    # No command: the scheduled scrape-and-clean run
+    args = parser.parse_args(argv or ['run'])
+    if args.handler is bench:
+        bench(args)
+        return
+    try:
+        args.handler(args)
+    finally:
+        # Run report (METRICS_ENABLED): where the time went, pages, duplicates, rows inserted
+        metrics.write_reports()
@@ -1,10 +1,85 @@
+import os
 import pathlib as pl
+from dotenv import load_dotenv
+
+# load environment variables from .env file before reading any setting below
+load_dotenv()
+
+# Job Bank search URL (provinces, search terms and occupation facets, newest first)
+BASE_URL = "https://www.jobbank.gc.ca/jobsearch/jobsearch?fcid=3001&fcid=3019&fcid=3739&fcid=5395&fcid=15885&fcid=22534&fcid=22887&fcid=25803&fcid=296425&fcid=296531&fcid=297197&fcid=297520&fn21=12010&fn21=20012&fn21=21211&fn21=21223&fn21=21232&fprov=AB&fprov=BC&fprov=ON&fprov=QC&page=1&sort=D&term=data&term=software+developer&term=data+engineer"
+
+# Scraper engine: 'auto' (HTTP first, Selenium fallback), 'http', 'sharded' or 'selenium'
+SCRAPER_ENGINE = os.getenv('SCRAPER_ENGINE', 'auto')
+
+# Sharded engine: parallel workers and the global request rate they share
+SHARD_WORKERS = int(os.getenv('SHARD_WORKERS', '4'))
+MAX_REQUESTS_PER_SECOND = float(os.getenv('MAX_REQUESTS_PER_SECOND', '2'))
+
+# Selenium driver pool: warm browsers kept per process, recycled after this many pages
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))
+DRIVER_MAX_PAGES = int(os.getenv('DRIVER_MAX_PAGES', '100'))
+
+# Ceiling on 'Show more' clicks; the adaptive pacer never exceeds this rate
+MAX_CLICKS_PER_MINUTE = float(os.getenv('MAX_CLICKS_PER_MINUTE', '12'))
+
+# Write-behind for scraped jobs: per-page results are coalesced into inserts of about
+# WRITER_BATCH_SIZE jobs (a partial batch waits at most WRITER_FLUSH_SECONDS), with at most
+# WRITER_QUEUE_SIZE pages queued before the crawl waits for the database
+WRITER_BATCH_SIZE = int(os.getenv('WRITER_BATCH_SIZE', '500'))
+WRITER_FLUSH_SECONDS = float(os.getenv('WRITER_FLUSH_SECONDS', '5'))
+WRITER_QUEUE_SIZE = int(os.getenv('WRITER_QUEUE_SIZE', '100'))
 
 # Define constants for file paths
 JOB_LISTINGS_CSV = pl.Path("data/data_example/job_listings.csv")
 CLEANED_JOB_LISTINGS_CSV = pl.Path("data/data_example/cleaned_job_listings.csv")
 VISUALIZATION_IMAGE = pl.Path("outputs/job_market_analysis.png")
 
+# Where the visualizer gets its aggregates: 'rollups' (database rollup tables),
+# 'sql' (GROUP BY queries on jobs_cleaned), 'snapshot' (Parquet/Arrow export) or 'csv'.
+# Default for `main.py visualize`; `python -m src.visualizer` defaults to 'csv' (no database)
+VISUALIZER_SOURCE = os.getenv('VISUALIZER_SOURCE', 'rollups')
+
+# Chart rendering: resolution, image format (png, svg, webp), 'combined' (one 2x2 image)
+# or 'separate' (one image per panel, rendered by up to VISUALIZATION_WORKERS processes)
+VISUALIZATION_DPI = int(os.getenv('VISUALIZATION_DPI', '300'))
+VISUALIZATION_FORMAT = os.getenv('VISUALIZATION_FORMAT', 'png')
+VISUALIZATION_PANELS = os.getenv('VISUALIZATION_PANELS', 'combined')
+VISUALIZATION_WORKERS = int(os.getenv('VISUALIZATION_WORKERS', '4'))
+
 # Define constants for database
 DB_FILE = pl.Path("data/job_listings.db")
 DB_TABLE = "jobs"
+
+# Only job IDs scraped in the last N days are loaded for duplicate detection (0 = all)
+EXISTING_IDS_WINDOW_DAYS = int(os.getenv('EXISTING_IDS_WINDOW_DAYS', '90'))
+
+# Bulk writes: 'auto' (COPY on PostgreSQL, executemany elsewhere), 'copy' or 'executemany'
+BULK_INSERT_METHOD = os.getenv('BULK_INSERT_METHOD', 'auto')
+BULK_CHUNK_SIZE = int(os.getenv('BULK_CHUNK_SIZE', '1000'))
+
+# Cleaner: 'scalar' (row by row, reference implementation) or 'vectorized' (pandas batch)
+CLEANER_METHOD = os.getenv('CLEANER_METHOD', 'scalar')
+
+# Unprocessed jobs are fetched, cleaned and saved this many rows at a time
+CLEAN_CHUNK_SIZE = int(os.getenv('CLEAN_CHUNK_SIZE', '5000'))
+
+# Worker processes for cleaning (1 = in-process streaming; more for large backfills)
+CLEAN_WORKERS = int(os.getenv('CLEAN_WORKERS', '1'))
+
+# Parse memoization: LRU entries per parser, and an optional raw -> parsed lookup table
+# persisted across runs (empty = in-memory only)
+PARSE_CACHE_SIZE = int(os.getenv('PARSE_CACHE_SIZE', '50000'))
+PARSE_CACHE_FILE = os.getenv('PARSE_CACHE_FILE', '')
+
+# Columnar snapshot of jobs_cleaned: 'parquet' or 'arrow' (Arrow IPC), needs pyarrow
+EXPORT_DIR = pl.Path(os.getenv('EXPORT_DIR', 'data/export/jobs_cleaned'))
+EXPORT_FORMAT = os.getenv('EXPORT_FORMAT', 'parquet')
+
+# Run instrumentation: stage timers and counters, written as a JSON run report and,
+# if a path is set, a Prometheus textfile (e.g. for node_exporter's textfile collector)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+METRICS_REPORT_FILE = pl.Path(os.getenv('METRICS_REPORT_FILE', 'outputs/run_report.json'))
+METRICS_PROMETHEUS_FILE = os.getenv('METRICS_PROMETHEUS_FILE', '')
+
+# Saved Job Bank search result page used for benchmarks and the local HTTP stand-in
+JOB_SEARCH_PAGE_HTML = pl.Path("data/data_example/job_search_page.html")
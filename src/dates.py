@@ -0,0 +1,28 @@
+from datetime import date, datetime
+from src import parse_cache
+from src.constants import PARSE_CACHE_SIZE
+
+# Job Bank posting dates ("January 27, 2026"). Shared by the cleaner and by db_manager,
+# which stores the typed posted_on date with every raw job.
+
+def parse_date(date_str):
+    """
+    Convert date string to ISO format (YYYY-MM-DD).
+    Returns None if parsing fails.
+    """
+    if not date_str or date_str.lower() == "n/a":
+        return None
+    try:
+         # Handle format like "January 27, 2026"
+         parsed = datetime.strptime(date_str, "%B %d, %Y")
+         return parsed.strftime("%Y-%m-%d") 
+    except ValueError:
+        return None
+
+# Memoized parse_date: posting dates are few distinct strings
+cached_parse_date = parse_cache.MemoizedParser(parse_date, PARSE_CACHE_SIZE)
+
+def posted_on(date_str):
+    """The posting date as a date object (None if it does not parse)."""
+    parsed = cached_parse_date(date_str)
+    return date.fromisoformat(parsed) if parsed else None
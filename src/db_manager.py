@@ -1,18 +1,166 @@
 import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine, text, Table, Column, String, MetaData, TIMESTAMP, Float, Date
-from sqlalchemy.dialects.postgresql import insert
-from datetime import datetime
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import (create_engine, delete, func, inspect, text, select, update, Table, Column, String,
+                        MetaData, TIMESTAMP, Float, Date, Integer, BigInteger, Index)
+from sqlalchemy.engine import URL
+from datetime import date, datetime, timedelta
+from src import metrics
+from src.bulk_loader import bulk_insert, chunked
+from src.dates import posted_on
+from src.constants import DB_FILE, EXISTING_IDS_WINDOW_DAYS, CLEAN_CHUNK_SIZE, BULK_CHUNK_SIZE
+from src.id_index import JobIdIndex, article_number
+from src.records import CleanJob, RawJob, as_records
 
-# load environment variables from .env file
-load_dotenv()
+# Engine settings (all optional; .env is loaded by src.constants)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '5'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))  # seconds; RDS drops idle connections
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '0'))  # 0 = no limit
+# PostgreSQL only: partition jobs_cleaned by month of date_posted (converted by init_db)
+DB_PARTITION_BY_MONTH = os.getenv('DB_PARTITION_BY_MONTH', 'false').lower() in ('1', 'true', 'yes')
 
-# generate db connection URL
-# Note: Removed the extra port variable to avoid connection string errors like 'host::5432'
-DB_URL = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:5432/{os.getenv('DB_NAME')}"
+_engine = None
+_engine_lock = threading.Lock()
+
+# Connection shared by every helper inside connection_scope()
+_scoped_connection = ContextVar('scoped_connection', default=None)
+
+class DatabaseConfigError(ValueError):
+    """Neither DB_URL nor complete PostgreSQL settings are configured."""
+
+# PostgreSQL settings that must all be set when DB_URL is not (DB_PORT defaults to 5432)
+REQUIRED_DB_SETTINGS = ('DB_HOST', 'DB_NAME', 'DB_USER')
+
+def build_db_url():
+    """
+    Resolve the database URL.
+    DB_URL wins if set (any SQLAlchemy DSN, e.g. sqlite:///data/job_listings.db for a local run).
+    Otherwise PostgreSQL is built from DB_HOST/DB_PORT/DB_NAME/DB_USER/DB_PASSWORD.
+    SQLite is never picked implicitly: with incomplete settings (e.g. missing CI secrets)
+    DatabaseConfigError is raised instead of writing to a local file.
+    """
+    if os.getenv('DB_URL'):
+        return os.getenv('DB_URL')
+    missing = [name for name in REQUIRED_DB_SETTINGS if not os.getenv(name)]
+    if missing:
+        raise DatabaseConfigError(
+            f"Database not configured: {', '.join(missing)} not set. Set DB_HOST, DB_NAME, DB_USER and "
+            f"DB_PASSWORD for PostgreSQL, or DB_URL (e.g. DB_URL=sqlite:///{DB_FILE.as_posix()}) for a local database."
+        )
+    return URL.create(
+        'postgresql',
+        username=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        host=os.getenv('DB_HOST'),
+        port=int(os.getenv('DB_PORT') or 5432),
+        database=os.getenv('DB_NAME'),
+    )
+
+def create_db_engine(url=None, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                     pool_recycle=DB_POOL_RECYCLE, pool_pre_ping=DB_POOL_PRE_PING,
+                     statement_timeout_ms=DB_STATEMENT_TIMEOUT_MS):
+    """
+    Create an engine with pooling configured for the target database.
+    """
+    url = url or build_db_url()
+    if str(url).startswith('sqlite'):
+        # SQLite: file-level locking, no server-side timeouts or pool tuning
+        return create_engine(url)
+
+    connect_args = {}
+    if statement_timeout_ms:
+        connect_args['options'] = f"-c statement_timeout={statement_timeout_ms}"
+    return create_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        connect_args=connect_args,
+    )
+
+def get_engine():
+    """
+    Return the process-wide engine, creating it on first use.
+    Importing this module therefore opens no database resources.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = create_db_engine()
+        return _engine
+
+def dispose_engine(close=True):
+    """
+    Drop the process-wide engine. Worker processes call this with close=False right after
+    fork so they open their own connections instead of sharing the parent's sockets.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose(close=close)
+            _engine = None
+
+def __getattr__(name):
+    # Backwards compatibility: `db_manager.engine` resolves lazily
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@contextmanager
+def connection_scope():
+    """
+    Run every db_manager call in this block on one connection and one transaction,
+    e.g. a whole scrape-clean run. Commits on success, rolls back on error.
+    Nested scopes join the outer one.
+    """
+    if _scoped_connection.get() is not None:
+        yield _scoped_connection.get()
+        return
+
+    with get_engine().connect() as conn:
+        token = _scoped_connection.set(conn)
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            _scoped_connection.reset(token)
+
+@contextmanager
+def _read_connection():
+    """
+    Yield the scoped connection if one is active, otherwise a dedicated pooled
+    connection for a long-running read (e.g. a server-side cursor).
+    """
+    conn = _scoped_connection.get()
+    if conn is not None:
+        yield conn
+        return
+
+    with get_engine().connect() as conn:
+        yield conn
+
+@contextmanager
+def _connection():
+    """
+    Yield the scoped connection if one is active (its scope commits),
+    otherwise a pooled connection that is committed when the block succeeds.
+    """
+    conn = _scoped_connection.get()
+    if conn is not None:
+        yield conn
+        return
+
+    with get_engine().connect() as conn:
+        yield conn
+        conn.commit()
 
-# create database engine
-engine = create_engine(DB_URL)
 metadata = MetaData()
 
 # define jobs table
@@ -23,7 +171,22 @@ jobs_table = Table(
     Column('date_posted', String),
     Column('location', String),
     Column('salary', String),
-    Column('scraped_at', TIMESTAMP)
+    Column('scraped_at', TIMESTAMP),
+    # Change capture: set when the cleaner has processed the row, NULL while it is pending
+    Column('processed_at', TIMESTAMP),
+    # Numeric surrogate key parsed from 'article-NNNN' (NULL for other ID formats)
+    Column('job_number', BigInteger),
+    # date_posted parsed to a date; date_posted keeps the scraped text
+    Column('posted_on', Date),
+    Index('ix_jobs_scraped_at', 'scraped_at'),
+    Index('ux_jobs_job_number', 'job_number', unique=True),
+)
+
+# Partial index holding only pending jobs, so finding work costs O(new rows), not O(history)
+unprocessed_jobs_index = Index(
+    'ix_jobs_unprocessed', jobs_table.c.id,
+    postgresql_where=jobs_table.c.processed_at.is_(None),
+    sqlite_where=jobs_table.c.processed_at.is_(None),
 )
 
 # define cleaned jobs table
@@ -37,130 +200,385 @@ jobs_cleaned_table = Table(
     Column('min_salary', Float),
     Column('max_salary', Float),
     Column('salary_period', String),
-    Column('cleaned_at', TIMESTAMP)
+    Column('cleaned_at', TIMESTAMP),
+    # Salary normalized to a yearly figure (see src/salary_parser.ANNUAL_FACTORS)
+    Column('min_salary_annual', Float),
+    Column('max_salary_annual', Float),
+    Column('job_number', BigInteger),
+    # Columns the dashboards filter and group on. Not unique, so they also work on a
+    # table partitioned by date_posted
+    Index('ix_jobs_cleaned_job_number', 'job_number'),
+    Index('ix_jobs_cleaned_date_posted', 'date_posted'),
+    Index('ix_jobs_cleaned_province', 'province'),
+    Index('ix_jobs_cleaned_city', 'city'),
+    Index('ix_jobs_cleaned_title', 'title'),
+)
+
+# Versions of the schema migrations applied to this database (see src/schema.py)
+schema_migrations_table = Table(
+    'schema_migrations', metadata,
+    Column('version', Integer, primary_key=True),
+    Column('description', String),
+    Column('applied_at', TIMESTAMP)
+)
+
+# Rollups maintained incrementally by src/rollups.py as cleaned jobs are inserted.
+# Job counts per dimension ('province', 'city', 'month', 'title') and key
+rollup_counts_table = Table(
+    'rollup_counts', metadata,
+    Column('dimension', String, primary_key=True),
+    Column('key', String, primary_key=True),
+    Column('job_count', Integer, nullable=False)
+)
+
+# Annualized salary totals per dimension ('all', 'province', 'period') and key
+rollup_salary_table = Table(
+    'rollup_salary', metadata,
+    Column('dimension', String, primary_key=True),
+    Column('key', String, primary_key=True),
+    Column('salary_count', Integer, nullable=False),
+    Column('min_annual_sum', Float, nullable=False),
+    Column('max_annual_sum', Float, nullable=False)
+)
+
+# Log-bucketed histogram of annualized salaries, for approximate quantiles
+rollup_salary_sketch_table = Table(
+    'rollup_salary_sketch', metadata,
+    Column('bucket', Integer, primary_key=True),
+    Column('job_count', Integer, nullable=False)
 )
 
+def ensure_columns(conn, table):
+    """
+    Add columns declared on table but missing from the existing database table
+    (create_all never alters tables). Returns the names of the added columns.
+    """
+    existing = {column['name'] for column in inspect(conn).get_columns(table.name)}
+    added = []
+    for column in table.columns:
+        if column.name in existing:
+            continue
+        column_type = column.type.compile(dialect=conn.dialect)
+        conn.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}')
+        added.append(column.name)
+    return added
+
+@metrics.timed('db.init')
 def init_db():
     """
     Initialize the database and create tables if they don't exist.
+    Existing databases are brought up to date by the schema migrations (src/schema.py),
+    and jobs_cleaned is partitioned by month if DB_PARTITION_BY_MONTH is set (PostgreSQL).
     """
     try:
-        metadata.create_all(engine)
+        metadata.create_all(get_engine())
+        with _connection() as conn:
+            from src import schema
+
+            schema.migrate(conn)
+            if DB_PARTITION_BY_MONTH and conn.dialect.name == 'postgresql':
+                schema.partition_jobs_cleaned(conn)
+
+            from src.rollups import ensure_rollups
+            ensure_rollups(conn)
         print("Database initialized successfully.")
+    except DatabaseConfigError:
+        # A run without a configured database must fail, not carry on printing errors
+        raise
     except Exception as e:
         print(f"Error initializing database: {e}")
 
+@metrics.timed('db.save_jobs')
 def save_jobs_to_db(job_list):
     """
     Save raw job listings to the database.
-    Uses 'INSERT ON CONFLICT DO NOTHING' to handle duplicates efficiently.
+    Rows are written in chunks through the bulk loader (COPY on PostgreSQL),
+    skipping IDs that already exist (ON CONFLICT DO NOTHING).
+    Returns the number of new rows (None if nothing was written).
     """
     if not job_list:
         print("No jobs to save.")
         return
 
-    try:
-        with engine.connect() as conn:
-            # PostgreSQL: INSERT ... ON CONFLICT DO NOTHING
-            stmt = insert(jobs_table).values([
-                {
-                    'id': job['id'],
-                    'title': job['title'],
-                    'date_posted': job['date_posted'],
-                    'location': job['location'],
-                    'salary': job['salary'],
-                    'scraped_at': datetime.now()
-                }
-                for job in job_list
-            ])
+    scraped_at = datetime.now()
+    rows = (
+        {
+            'id': job['id'],
+            'title': job['title'],
+            'date_posted': job['date_posted'],
+            'location': job['location'],
+            'salary': job['salary'],
+            'scraped_at': scraped_at,
+            'job_number': article_number(job['id']),
+            'posted_on': posted_on(job['date_posted'])
+        }
+        for job in job_list
+    )
 
+    try:
+        with _connection() as conn:
             # Do not update existing jobs
-            stmt = stmt.on_conflict_do_nothing(index_elements=['id'])
-            
-            # Execute the statement
-            result = conn.execute(stmt)
-            conn.commit()
-            print(f"{result.rowcount} new jobs saved to database.")
+            inserted = bulk_insert(conn, jobs_table, rows)
+            metrics.count('db.jobs.rows_inserted', inserted)
+            print(f"{inserted} new jobs saved to database.")
+            return inserted
 
     except Exception as e:
         print(f"Error saving jobs to database: {e}")
 
-def get_existing_job_ids():
+@metrics.timed('db.get_existing_job_ids')
+def get_existing_job_ids(window_days=EXISTING_IDS_WINDOW_DAYS):
     """
-    Fetch all job IDs currently in the database to prevent duplicate scraping.
+    Fetch job IDs already in the database to prevent duplicate scraping.
+    Only IDs scraped within the last window_days are loaded (0 loads every ID): the crawl is
+    sorted newest first, so the duplicate streak only ever meets recently scraped jobs.
+    Rows are streamed into a compact JobIdIndex instead of a set of strings: article IDs
+    are read as their numeric job_number, and only other ID formats as strings.
     """
+    numbers = select(jobs_table.c.job_number).where(jobs_table.c.job_number.isnot(None))
+    other_ids = select(jobs_table.c.id).where(jobs_table.c.job_number.is_(None))
+    if window_days:
+        since = datetime.now() - timedelta(days=window_days)
+        numbers = numbers.where(jobs_table.c.scraped_at >= since)
+        other_ids = other_ids.where(jobs_table.c.scraped_at >= since)
+
     try:
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT id FROM jobs"))
-            return {row._mapping['id'] for row in result}
+        with _connection() as conn:
+            result = conn.execution_options(stream_results=True).execute(numbers)
+            return JobIdIndex.from_numbers(result.scalars(), conn.execute(other_ids).scalars())
     except Exception as e:
         print(f"Error fetching existing IDs: {e}")
-        return set()
+        return JobIdIndex.from_ids([])
 
 def get_unprocessed_jobs():
     """
-    Retrieve jobs that exist in 'jobs' table but not in 'jobs_cleaned' table.
+    Retrieve jobs the cleaner has not processed yet (processed_at IS NULL).
     """
     query = text("""
-        SELECT j.id, j.title, j.date_posted, j.location, j.salary
-        FROM jobs j
-        LEFT JOIN jobs_cleaned jc ON j.id = jc.id
-        WHERE jc.id IS NULL
+        SELECT id, title, date_posted, location, salary
+        FROM jobs
+        WHERE processed_at IS NULL
     """)
 
     try:
-        with engine.connect() as conn:
-            result = conn.execute(query)
-            # Use mappings() to safely access by name or index access for safety
-            return [
-                {
-                    'id': row._mapping['id'],
-                    'title': row._mapping['title'],
-                    'date_posted': row._mapping['date_posted'],
-                    'location': row._mapping['location'],
-                    'salary': row._mapping['salary']
-                }
-                for row in result
-            ]
+        with _connection() as conn:
+            # Columns are selected in RawJob field order
+            return [RawJob(*row) for row in conn.execute(query)]
     except Exception as e:
         print(f"Error fetching unprocessed jobs: {e}")
         return []
 
+def iter_unprocessed_jobs(chunk_size=CLEAN_CHUNK_SIZE):
+    """
+    Yield unprocessed jobs in lists of at most chunk_size, so memory stays bounded
+    however many rows are pending. The next chunk is only fetched when the caller asks
+    for it, so a slow consumer never has more than one chunk in flight.
+    Pending rows are found through the ix_jobs_unprocessed partial index, so a run only
+    reads the rows added (or reset for reprocessing) since the last run.
+    PostgreSQL streams through a server-side cursor on its own connection; databases
+    without server-side cursors (SQLite) page by primary key with one short query per chunk,
+    so no read lock is held while the caller writes.
+    """
+    # RawJob field order
+    columns = "id, title, date_posted, location, salary"
+    try:
+        if get_engine().dialect.supports_server_side_cursors:
+            query = text(f"""
+                SELECT {columns}
+                FROM jobs
+                WHERE processed_at IS NULL
+            """)
+            with _read_connection() as conn:
+                result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(query)
+                for partition in result.partitions(chunk_size):
+                    yield [RawJob(*row) for row in partition]
+            return
+
+        query = text(f"""
+            SELECT {columns}
+            FROM jobs
+            WHERE processed_at IS NULL AND id > :after_id
+            ORDER BY id
+            LIMIT :chunk_size
+        """)
+        after_id = ''
+        while True:
+            with _connection() as conn:
+                chunk = [RawJob(*row) for row in conn.execute(query, {'after_id': after_id, 'chunk_size': chunk_size})]
+            if not chunk:
+                return
+            yield chunk
+            after_id = chunk[-1].id
+
+    except Exception as e:
+        print(f"Error streaming unprocessed jobs: {e}")
+
+def get_unprocessed_id_ranges(range_size):
+    """
+    Split the IDs of unprocessed jobs into consecutive key ranges of about range_size rows.
+    IDs are streamed in primary-key order and only the range boundaries are kept.
+    Returns a list of (first_id, last_id, row_count) tuples.
+    """
+    query = text("""
+        SELECT id
+        FROM jobs
+        WHERE processed_at IS NULL
+        ORDER BY id
+    """)
+
+    ranges = []
+    try:
+        with _read_connection() as conn:
+            result = conn.execution_options(stream_results=True).execute(query)
+            first_id = last_id = None
+            count = 0
+            for job_id in result.scalars():
+                if first_id is None:
+                    first_id = job_id
+                last_id = job_id
+                count += 1
+                if count == range_size:
+                    ranges.append((first_id, last_id, count))
+                    first_id, count = None, 0
+            if count:
+                ranges.append((first_id, last_id, count))
+    except Exception as e:
+        print(f"Error splitting unprocessed jobs into ranges: {e}")
+    return ranges
+
+def get_unprocessed_jobs_in_range(first_id, last_id):
+    """
+    Retrieve unprocessed jobs whose IDs fall within [first_id, last_id].
+    Returns None if the query failed, so a failed fetch is not mistaken for an empty range.
+    """
+    query = text("""
+        SELECT id, title, date_posted, location, salary
+        FROM jobs
+        WHERE processed_at IS NULL AND id >= :first_id AND id <= :last_id
+        ORDER BY id
+    """)
+
+    try:
+        with _connection() as conn:
+            result = conn.execute(query, {'first_id': first_id, 'last_id': last_id})
+            return [RawJob(*row) for row in result]
+    except Exception as e:
+        print(f"Error fetching unprocessed jobs in range: {e}")
+        return None
+
+def mark_jobs_processed(conn, job_ids, processed_at, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Set processed_at on the given jobs, in chunks of chunk_size IDs.
+    Called in the transaction that saves their cleaned rows, so a job is marked
+    processed exactly when its cleaned row is committed.
+    """
+    for chunk in chunked(job_ids, chunk_size):
+        conn.execute(update(jobs_table).where(jobs_table.c.id.in_(chunk)).values(processed_at=processed_at))
+
+def reset_processed_jobs(scraped_since=None, scraped_until=None):
+    """
+    Force re-processing of the jobs scraped in [scraped_since, scraped_until] (either bound
+    may be None; both None means every job): their cleaned rows are deleted and they are
+    marked pending, so the next clean run cleans them again. The rollups are rebuilt in the
+    same transaction. Returns the number of jobs reset.
+    """
+    from src.rollups import rebuild_rollups
+
+    condition = jobs_table.c.id.isnot(None)
+    if scraped_since is not None:
+        condition = condition & (jobs_table.c.scraped_at >= scraped_since)
+    if scraped_until is not None:
+        condition = condition & (jobs_table.c.scraped_at <= scraped_until)
+
+    with _connection() as conn:
+        conn.execute(delete(jobs_cleaned_table).where(
+            jobs_cleaned_table.c.id.in_(select(jobs_table.c.id).where(condition))
+        ))
+        reset = conn.execute(update(jobs_table).where(condition).values(processed_at=None)).rowcount
+        rebuild_rollups(conn)
+    print(f"{reset} jobs marked for re-processing.")
+    return reset
+
+def _as_date(value):
+    # The cleaner produces ISO strings; SQLite's Date type only accepts date objects
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+@metrics.timed('db.save_cleaned_jobs')
 def save_cleaned_jobs_to_db(cleaned_jobs):
     """
     Insert cleaned job data into the jobs_cleaned table.
-    PostgreSQL: INSERT ... ON CONFLICT DO NOTHING
+    Chunked bulk insert (COPY on PostgreSQL) with ON CONFLICT DO NOTHING.
+    The rollup tables are updated with the rows that were actually inserted, and the
+    source jobs are marked processed, in the same transaction.
+    CleanJob records are inserted as is; their date_posted (ISO string to date), cleaned_at
+    and job_number are set in place.
+    Returns the number of new rows (None if nothing was written).
     """
     if not cleaned_jobs:
         print("No cleaned jobs to save.")
         return
-    
+
+    cleaned_at = datetime.now()
+    # CleanJob records are the insert rows themselves: only the save-time fields are
+    # filled in, in place (dict rows are converted once)
+    rows = as_records(cleaned_jobs, CleanJob)
+    for job in rows:
+        job.date_posted = _as_date(job.date_posted)
+        job.cleaned_at = cleaned_at
+        if job.job_number is None:
+            job.job_number = article_number(job.id)
+
     try:
-        with engine.connect() as conn:
-            # PostgreSQL: INSERT ... ON CONFLICT DO NOTHING
-            stmt = insert(jobs_cleaned_table).values([
-                {
-                    'id': job['id'],
-                    'title': job['title'],
-                    'date_posted': job['date_posted'],
-                    'city': job['city'],
-                    'province': job['province'],
-                    'min_salary': job['min_salary'],
-                    'max_salary': job['max_salary'],
-                    'salary_period': job['salary_period'],
-                    'cleaned_at': datetime.now()
-                }
-                for job in cleaned_jobs
-            ])
+        from src import schema
+        from src.rollups import update_rollups
 
+        with _connection() as conn:
+            if DB_PARTITION_BY_MONTH and schema.is_partitioned(conn):
+                schema.ensure_month_partitions(conn, schema.month_starts(rows))
             # Do not update existing jobs
-            stmt = stmt.on_conflict_do_nothing(index_elements=['id'])
-            
-            # Execute the statement
-            result = conn.execute(stmt)
-            conn.commit()
-            print(f"{result.rowcount} new cleaned jobs saved to database.")
+            inserted_ids = []
+            inserted = bulk_insert(conn, jobs_cleaned_table, rows, inserted_keys=inserted_ids)
+            # Same transaction: the rollups only ever count committed rows, each once
+            update_rollups(conn, rows, set(inserted_ids))
+            # Every job of the batch is done, including IDs that were already cleaned
+            mark_jobs_processed(conn, [job.id for job in rows], cleaned_at)
+            metrics.count('db.jobs_cleaned.rows_inserted', inserted)
+            print(f"{inserted} new cleaned jobs saved to database.")
+            return inserted
 
     except Exception as e:
         print(f"Error saving cleaned jobs to database: {e}")
-   
\ No newline at end of file
+
+def _month_start(conn, column):
+    # First day of the month, computed by the database
+    if conn.dialect.name == 'sqlite':
+        return func.strftime('%Y-%m-01', column)
+    return func.date_trunc('month', column)
+
+def count_cleaned_jobs_by(column_name, limit=None):
+    """
+    Job counts per value of a jobs_cleaned column, largest first, computed with
+    GROUP BY in the database: [(value, job_count)]. NULL values are not counted.
+    """
+    column = jobs_cleaned_table.c[column_name]
+    job_count = func.count().label('job_count')
+    query = (select(column, job_count).where(column.isnot(None))
+             .group_by(column).order_by(job_count.desc(), column))
+    if limit:
+        query = query.limit(limit)
+
+    with _read_connection() as conn:
+        return [tuple(row) for row in conn.execute(query)]
+
+def count_cleaned_jobs_by_month():
+    """
+    Job counts per posting month, oldest first, computed in the database:
+    [(first day of month as date, job_count)].
+    """
+    with _read_connection() as conn:
+        month = _month_start(conn, jobs_cleaned_table.c.date_posted).label('month')
+        query = (select(month, func.count().label('job_count'))
+                 .where(jobs_cleaned_table.c.date_posted.isnot(None))
+                 .group_by(month).order_by(month))
+        return [(_as_date(str(month)[:10]), job_count) for month, job_count in conn.execute(query)]
+
@@ -0,0 +1,49 @@
+from src import metrics
+
+# Stop when 30 consecutive duplicates found (~1 full page of 25 jobs + margin)
+# This ensures we don't miss new jobs that might be interspersed
+MAX_CONSECUTIVE_DUPLICATE = 30
+
+class DuplicateTracker:
+    """
+    Incremental-scraping state shared by the scraper engines.
+    Filters jobs already in the database or already seen this session,
+    and signals when the consecutive duplicate streak says the crawl has caught up.
+    """
+
+    def __init__(self, existing_ids, max_consecutive_duplicate=MAX_CONSECUTIVE_DUPLICATE):
+        self.existing_ids = existing_ids
+        self.max_consecutive_duplicate = max_consecutive_duplicate
+        self.current_session_ids = set()
+        self.duplicate_streak = 0
+
+    def filter_new_jobs(self, jobs):
+        """
+        Return tuple: (new_jobs, stop_scraping)
+        """
+        new_jobs = []
+
+        for job in jobs:
+            job_id = job['id']
+
+            if job_id in self.existing_ids:
+                self.duplicate_streak += 1
+                metrics.count('scrape.duplicates')
+                print(f" - > Duplicate job found (ID: {job_id}). Consecutive duplicates: {self.duplicate_streak}")
+                if self.duplicate_streak >= self.max_consecutive_duplicate:
+                    print(" - > Maximum consecutive duplicates reached. Stopping incremental scraping.")
+                    return new_jobs, True
+
+            else:
+                if self.duplicate_streak > 0:
+                    print(f" - > New job found (ID: {job_id}). Resetting duplicate streak.")
+                    self.duplicate_streak = 0
+
+                if job_id not in self.current_session_ids:
+                    new_jobs.append(job)
+                    self.current_session_ids.add(job_id)
+                    metrics.count('scrape.new_jobs')
+                else:
+                    metrics.count('scrape.session_duplicates')
+
+        return new_jobs, False
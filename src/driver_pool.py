@@ -0,0 +1,204 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from src import metrics
+from src.constants import DRIVER_POOL_SIZE, DRIVER_MAX_PAGES
+
+# Additional anti-detection: remove webdriver property
+HIDE_WEBDRIVER_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def build_chrome_options():
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new") # Run in headless mode
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+
+    # Anti-bot detection options
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    if os.path.exists("/usr/bin/chromium"):
+        # [FOR GITHUB ACTIONS] Use chromium
+        options.binary_location = "/usr/bin/chromium"
+    return options
+
+def get_driver_path():
+    """
+    Resolve the chromedriver executable once per process.
+    ChromeDriverManager().install() does a network version check, so its result is cached.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            if os.path.exists("/usr/bin/chromedriver"):
+                # [FOR GITHUB ACTIONS] Use the system chromedriver
+                _driver_path = "/usr/bin/chromedriver"
+            else:
+                # [FOR LOCAL TESTING] Use ChromeDriverManager to automatically handle the driver
+                _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+@metrics.timed('scrape.browser_start')
+def create_driver():
+    """
+    Start a headless Chrome with the anti-detection options and CDP script installed.
+    """
+    driver = webdriver.Chrome(service=Service(executable_path=get_driver_path()), options=build_chrome_options())
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": HIDE_WEBDRIVER_SCRIPT})
+    return driver
+
+def is_healthy(driver):
+    """Return True if the browser session still answers commands."""
+    try:
+        driver.execute_script("return document.readyState")
+        return True
+    except Exception:
+        return False
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+# How often a waiting acquire() checks whether a recycled driver freed a slot
+ACQUIRE_POLL_INTERVAL = 0.5  # seconds
+
+class DriverPoolTimeout(RuntimeError):
+    """No driver was released within the timeout given to DriverPool.acquire()."""
+
+class DriverPool:
+    """
+    Thread-safe pool of warm Chrome drivers.
+    Drivers are created lazily up to `size`, health-checked before being handed out,
+    and recycled (quit and replaced) after serving `max_pages` pages.
+    """
+
+    def __init__(self, size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES, factory=create_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self.factory = factory
+        self._idle = queue.LifoQueue()  # most recently used (warmest) driver first
+        self._pages = {}  # id(driver) -> pages served since creation
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, timeout=None):
+        """
+        Return a healthy driver, creating one if the pool is not full,
+        otherwise waiting up to `timeout` seconds for one to be released.
+        Raises DriverPoolTimeout if none is released in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = None
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed.")
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    return self._start_driver()
+                # Wait in short slices: a driver quit on release frees a slot without
+                # putting anything on the idle queue
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise DriverPoolTimeout(f"No browser released within {timeout}s "
+                                            f"(pool of {self.size} in use).")
+                try:
+                    driver = self._idle.get(timeout=ACQUIRE_POLL_INTERVAL if remaining is None
+                                            else min(remaining, ACQUIRE_POLL_INTERVAL))
+                except queue.Empty:
+                    continue
+
+            if is_healthy(driver):
+                return driver
+
+            print(" - > Pooled browser failed health check. Replacing it...")
+            self._discard(driver)
+
+    def release(self, driver, pages=0):
+        """
+        Return a driver to the pool after it served `pages` pages.
+        Drivers past max_pages or failing the health check are quit instead.
+        """
+        with self._lock:
+            served = self._pages.get(id(driver), 0) + pages
+            self._pages[id(driver)] = served
+            closed = self._closed
+
+        if closed or served >= self.max_pages or not is_healthy(driver):
+            if served >= self.max_pages:
+                print(f" - > Recycling browser after {served} pages.")
+            self._discard(driver)
+            return
+
+        try:
+            # Drop the previous page so idle browsers don't hold large DOMs
+            driver.get("about:blank")
+        except Exception:
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def close(self):
+        """Quit every idle driver; drivers still in use are quit when released."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def _start_driver(self):
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        quit_driver(driver)
+        with self._lock:
+            self._created -= 1
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+def get_driver_pool():
+    """
+    Process-wide pool shared by repeated and parallel scrapes; closed at interpreter exit.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = DriverPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
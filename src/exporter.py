@@ -0,0 +1,188 @@
+import json
+import os
+from datetime import datetime
+from sqlalchemy import func, select
+from src import db_manager as db_mgr
+from src.constants import EXPORT_DIR, EXPORT_FORMAT
+
+# Columnar snapshots of jobs_cleaned for offline analysis.
+# Layout: EXPORT_DIR/month=YYYY-MM/part-<run>-<n>.<ext> (hive partitioning by posting month).
+# Each run only adds new files for rows cleaned since the previous run; existing files are
+# never rewritten, so re-cleaned jobs appear once per export and load_snapshot keeps the
+# latest. pyarrow (in requirements.txt) is imported on first use.
+
+EXPORT_FORMATS = {'parquet': 'parquet', 'arrow': 'arrow'}
+# Files starting with '_' are ignored by pyarrow when reading the dataset
+STATE_FILE = '_export_state.json'
+
+# Rows read from the database and converted to Arrow per batch
+EXPORT_BATCH_SIZE = 50_000
+
+EXPORT_COLUMNS = ['id', 'title', 'date_posted', 'city', 'province', 'min_salary', 'max_salary',
+                  'salary_period', 'min_salary_annual', 'max_salary_annual', 'cleaned_at']
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.fs
+    except ImportError as e:
+        raise ImportError("The Parquet/Arrow export needs pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+def export_schema():
+    pa = _pyarrow()
+    categorical = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('id', pa.string()),
+        ('title', pa.string()),
+        ('date_posted', pa.date32()),
+        ('city', categorical),
+        ('province', categorical),
+        ('min_salary', pa.float64()),
+        ('max_salary', pa.float64()),
+        ('salary_period', categorical),
+        ('min_salary_annual', pa.float64()),
+        ('max_salary_annual', pa.float64()),
+        ('cleaned_at', pa.timestamp('us')),
+        ('month', pa.string()),
+    ])
+
+def _file_format(export_format):
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{export_format}'. Choose from: {', '.join(EXPORT_FORMATS)}")
+    # pyarrow calls the Arrow IPC file format 'ipc'
+    return 'ipc' if export_format == 'arrow' else export_format
+
+def load_state(export_dir):
+    path = os.path.join(export_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {'watermark': None, 'runs': []}
+    with open(path, mode='r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(export_dir, state):
+    path = os.path.join(export_dir, STATE_FILE)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, mode='w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(temp_path, path)
+
+def remove_orphans(export_dir, state):
+    """
+    Delete part files written by runs that never completed (not recorded in the state),
+    so their rows are not exported twice.
+    """
+    completed = {run['run_id'] for run in state['runs']}
+    removed = 0
+    for root, _, files in os.walk(export_dir):
+        for name in files:
+            if name.startswith('part-') and name.split('-')[1] not in completed:
+                os.remove(os.path.join(root, name))
+                removed += 1
+    return removed
+
+def _month(value):
+    # Jobs without a posting date go to pyarrow's null partition (__HIVE_DEFAULT_PARTITION__)
+    return value.strftime('%Y-%m') if value else None
+
+def _record_batches(rows_iter, schema):
+    pa = _pyarrow()
+    for chunk in rows_iter:
+        columns = {name: [row[name] for row in chunk] for name in EXPORT_COLUMNS}
+        columns['month'] = [_month(value) for value in columns['date_posted']]
+        yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+def export_cleaned_jobs(export_dir=EXPORT_DIR, export_format=EXPORT_FORMAT, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Append jobs_cleaned rows cleaned since the last export to the columnar snapshot.
+    Run it after cleaning has finished: rows are selected by cleaned_at, up to the newest
+    cleaned_at at the start of the run. Returns the number of rows exported.
+    """
+    pa = _pyarrow()
+    file_format = _file_format(export_format)
+    export_dir = str(export_dir)
+    os.makedirs(export_dir, exist_ok=True)
+    state = load_state(export_dir)
+    if state['runs'] and state.get('format', export_format) != export_format:
+        raise ValueError(f"{export_dir} holds a {state['format']} snapshot; use another directory for {export_format}")
+    orphans = remove_orphans(export_dir, state)
+    if orphans:
+        print(f"Removed {orphans} files left by an interrupted export.")
+
+    table = db_mgr.jobs_cleaned_table
+    watermark = datetime.fromisoformat(state['watermark']) if state['watermark'] else None
+    new_rows = table.c.cleaned_at > watermark if watermark else table.c.cleaned_at.isnot(None)
+
+    with db_mgr.connection_scope() as conn:
+        cutoff = conn.execute(select(func.max(table.c.cleaned_at)).where(new_rows)).scalar()
+        if cutoff is None:
+            print("No new cleaned jobs to export.")
+            return 0
+
+        query = (select(*(table.c[name] for name in EXPORT_COLUMNS))
+                 .where(new_rows, table.c.cleaned_at <= cutoff)
+                 .execution_options(yield_per=batch_size))
+        rows = conn.execute(query).mappings().partitions(batch_size)
+
+        run_id = datetime.now().strftime('%Y%m%dT%H%M%S%f')
+        schema = export_schema()
+        exported = 0
+
+        def counted(batches):
+            nonlocal exported
+            for batch in batches:
+                exported += batch.num_rows
+                yield batch
+
+        pa.dataset.write_dataset(
+            counted(_record_batches(rows, schema)),
+            export_dir,
+            schema=schema,
+            format=file_format,
+            partitioning=pa.dataset.partitioning(pa.schema([('month', pa.string())]), flavor='hive'),
+            basename_template=f"part-{run_id}-{{i}}.{EXPORT_FORMATS[export_format]}",
+            # Existing partitions keep their files; this run only adds new ones
+            existing_data_behavior='overwrite_or_ignore',
+        )
+
+    state['format'] = export_format
+    state['watermark'] = cutoff.isoformat()
+    state['runs'].append({'run_id': run_id, 'rows': exported, 'exported_at': datetime.now().isoformat()})
+    save_state(export_dir, state)
+    print(f"Exported {exported} cleaned jobs to {export_dir} ({export_format}).")
+    return exported
+
+def open_snapshot(export_dir=EXPORT_DIR, export_format=None):
+    """
+    Open the exported snapshot as a pyarrow Dataset. Files are memory-mapped, and
+    to_table(columns=..., filter=...) reads only the requested columns and partitions.
+    """
+    pa = _pyarrow()
+    export_dir = str(export_dir)
+    export_format = export_format or load_state(export_dir).get('format', EXPORT_FORMAT)
+    return pa.dataset.dataset(
+        export_dir,
+        format=_file_format(export_format),
+        partitioning='hive',
+        filesystem=pa.fs.LocalFileSystem(use_mmap=True),
+    )
+
+def load_snapshot(columns=None, export_dir=EXPORT_DIR):
+    """
+    Read the snapshot (or some of its columns) into a pandas DataFrame.
+    Dictionary columns become pandas categoricals and dates become datetime64.
+    A job cleaned again (reset_processed_jobs) is exported again with its new cleaned_at;
+    only its latest row is kept.
+    """
+    import pyarrow.compute as pc
+
+    read = None if columns is None else list(dict.fromkeys([*columns, 'id', 'cleaned_at']))
+    table = open_snapshot(export_dir).to_table(columns=read)
+    df = table.to_pandas(date_as_object=False)
+    if pc.count_distinct(table['id']).as_py() < table.num_rows:
+        df = df.sort_values('cleaned_at', kind='stable').drop_duplicates('id', keep='last').reset_index(drop=True)
+    return df if columns is None else df[list(columns)]
+
+if __name__ == "__main__":
+    export_cleaned_jobs()
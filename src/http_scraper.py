@@ -0,0 +1,115 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src import db_manager as db_mgr
+from src import metrics
+from src.constants import BASE_URL
+from src.dedup import DuplicateTracker
+from src.parser import parse_job_listings
+from src.rate_limit import RateLimiter
+from src.write_behind import BackgroundWriter
+
+# Same browser identity as the Selenium engine
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+REQUEST_TIMEOUT = 30  # seconds per page request
+PAGE_DELAY = 1.0  # minimum interval between page requests (seconds)
+MAX_PAGES = 200  # hard stop in case the site keeps returning results
+
+def page_url(base_url, page):
+    """
+    Return base_url with its 'page' query parameter set to the given page number.
+    """
+    parts = urlsplit(base_url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != 'page']
+    query.append(('page', str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def create_session():
+    """
+    Create a requests session with browser headers and retry/backoff on transient errors.
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-CA,en;q=0.9',
+    })
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=['GET'])
+    session.mount('http://', HTTPAdapter(max_retries=retry))
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    return session
+
+@metrics.timed('scrape.fetch')
+def fetch_page(session, url):
+    response = session.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.text
+
+def crawl_pages(session, base_url, tracker, on_new_jobs, rate_limiter, max_pages=MAX_PAGES, label=''):
+    """
+    Walk the result pages of one search URL until the last page or the duplicate streak.
+    New jobs of every page are handed to on_new_jobs.
+    Returns the number of pages that contained listings. 0 means the first page failed, or
+    that page 2 repeated page 1: the server ignores 'page=' and only the first page is
+    reachable over HTTP.
+    """
+    prefix = f"[{label}] " if label else ""
+    pages_with_listings = 0
+
+    for page in range(1, max_pages + 1):
+        rate_limiter.wait()
+        print(f"\n=== {prefix}Fetching Page {page} ===")
+        try:
+            html = fetch_page(session, page_url(base_url, page))
+        except requests.RequestException as e:
+            print(f" - > {prefix}Error fetching page {page}: {e}")
+            break
+
+        page_jobs = parse_job_listings(html)
+        if not page_jobs:
+            if page == 1:
+                print(f" - > {prefix}No job listings in the HTTP response.")
+            else:
+                print(f" - > {prefix}No more job listings. Reached the last page.")
+            break
+
+        if all(job['id'] in tracker.current_session_ids for job in page_jobs):
+            # The server ignored the page number and served a page we already have
+            print(f" - > {prefix}Page repeats listings already scraped this session. Stopping.")
+            if pages_with_listings == 1:
+                print(f" - > {prefix}The server does not paginate over HTTP.")
+                return 0
+            break
+
+        pages_with_listings += 1
+        metrics.count('scrape.pages')
+        new_jobs, stop_scraping = tracker.filter_new_jobs(page_jobs)
+
+        if new_jobs:
+            on_new_jobs(new_jobs)
+
+        if stop_scraping:
+            break
+
+    return pages_with_listings
+
+def run_http_scraper(base_url=BASE_URL, max_pages=MAX_PAGES, page_delay=PAGE_DELAY):
+    """
+    Scrape Job Bank result pages over plain HTTP by walking the 'page=' parameter.
+    Returns the number of unique new jobs found, or None if the first page could not
+    be fetched or contained no listings, or if the server ignores the page number (the
+    caller should fall back to Selenium).
+    New jobs are saved by a background writer while the next pages are fetched.
+    """
+    tracker = DuplicateTracker(db_mgr.get_existing_job_ids())
+
+    with create_session() as session, BackgroundWriter(db_mgr.save_jobs_to_db) as writer:
+        pages = crawl_pages(session, base_url, tracker, writer.submit, RateLimiter(page_delay), max_pages)
+
+    if not pages:
+        return None
+
+    print("\nHTTP scraping completed.\nTotal unique job found:", len(tracker.current_session_ids))
+    return len(tracker.current_session_ids)
@@ -0,0 +1,77 @@
+# Job Bank article IDs look like 'article-48249602'
+ARTICLE_PREFIX = 'article-'
+
+def article_number(job_id):
+    """
+    Return the numeric part of an 'article-NNNN' ID, or None for any other format.
+    """
+    if job_id.startswith(ARTICLE_PREFIX):
+        digits = job_id[len(ARTICLE_PREFIX):]
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+class JobIdIndex:
+    """
+    Read-only membership index of job IDs.
+    Numeric article IDs are kept in a sorted int64 NumPy array (8 bytes each, binary search),
+    instead of one Python string per ID in a set. IDs in any other format go into a small set.
+    """
+
+    def __init__(self, numbers, other_ids):
+        self.numbers = numbers
+        self.other_ids = other_ids
+
+    @classmethod
+    def from_ids(cls, job_ids, chunk_size=100_000):
+        """
+        Build the index from an iterable of ID strings, converting them in fixed-size chunks
+        so the full list of strings is never materialized.
+        """
+        import numpy as np
+
+        chunks = []
+        buffer = []
+        other_ids = set()
+        for job_id in job_ids:
+            number = article_number(job_id)
+            if number is None:
+                other_ids.add(job_id)
+                continue
+            buffer.append(number)
+            if len(buffer) >= chunk_size:
+                chunks.append(np.array(buffer, dtype=np.int64))
+                buffer = []
+        if buffer:
+            chunks.append(np.array(buffer, dtype=np.int64))
+
+        numbers = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+        numbers.sort()
+        return cls(numbers, other_ids)
+
+    @classmethod
+    def from_numbers(cls, numbers, other_ids=()):
+        """
+        Build the index from already numeric article IDs (e.g. the job_number column),
+        plus any IDs in other formats. np.fromiter fills the array without a list of ints.
+        """
+        import numpy as np
+
+        numbers = np.fromiter(numbers, dtype=np.int64)
+        numbers.sort()
+        return cls(numbers, set(other_ids))
+
+    def __contains__(self, job_id):
+        number = article_number(job_id)
+        if number is None:
+            return job_id in self.other_ids
+        position = self.numbers.searchsorted(number)
+        return position < len(self.numbers) and self.numbers[position] == number
+
+    def __len__(self):
+        return len(self.numbers) + len(self.other_ids)
+
+    @property
+    def nbytes(self):
+        """Approximate memory used by the numeric IDs."""
+        return self.numbers.nbytes
@@ -0,0 +1,183 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+from src.constants import METRICS_ENABLED, METRICS_REPORT_FILE, METRICS_PROMETHEUS_FILE
+
+# Stage timers and counters for one pipeline run (scrape -> clean), kept per process.
+# Disabled by default: timer() then returns a shared no-op context manager and count()
+# returns after one attribute check, so instrumented code pays almost nothing.
+
+PROMETHEUS_PREFIX = 'jobbank'
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class _Timer:
+    __slots__ = ('registry', 'name', 'start')
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+class MetricsRegistry:
+    """
+    Thread-safe timers (calls, total, max seconds) and counters, keyed by dotted names
+    such as 'scrape.parse' or 'db.jobs.rows_inserted'.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.timers = {}
+            self.counters = {}
+            self.started_at = datetime.now()
+
+    def observe(self, name, seconds):
+        with self._lock:
+            stats = self.timers.get(name)
+            if stats is None:
+                self.timers[name] = [1, seconds, seconds]
+            else:
+                stats[0] += 1
+                stats[1] += seconds
+                stats[2] = max(stats[2], seconds)
+
+    def timer(self, name):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self):
+        """
+        The run so far as a JSON-serializable dict.
+        """
+        with self._lock:
+            finished_at = datetime.now()
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'finished_at': finished_at.isoformat(timespec='seconds'),
+                'duration_seconds': round((finished_at - self.started_at).total_seconds(), 3),
+                'timers': {
+                    name: {'calls': calls, 'total_seconds': round(total, 6),
+                           'mean_seconds': round(total / calls, 6), 'max_seconds': round(longest, 6)}
+                    for name, (calls, total, longest) in sorted(self.timers.items())
+                },
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+registry = MetricsRegistry(METRICS_ENABLED)
+
+def is_enabled():
+    return registry.enabled
+
+def enable(enabled=True):
+    registry.enabled = enabled
+
+def timer(name):
+    """
+    Context manager timing a block: `with metrics.timer('scrape.parse'): ...`
+    """
+    return registry.timer(name)
+
+def timed(name):
+    """
+    Decorator timing every call of a function under name.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return function(*args, **kwargs)
+            with _Timer(registry, name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name, value=1):
+    registry.count(name, value)
+
+def _write_atomic(path, content):
+    # Write then rename, so readers (e.g. node_exporter's textfile collector) never see a partial file
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, mode='w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+def _metric_name(name):
+    return f"{PROMETHEUS_PREFIX}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}"
+
+def prometheus_text(report):
+    """
+    Render a run report in the Prometheus text exposition format.
+    """
+    lines = []
+    for name, stats in report['timers'].items():
+        metric = _metric_name(name)
+        lines += [
+            f"# TYPE {metric}_seconds_total counter",
+            f"{metric}_seconds_total {stats['total_seconds']}",
+            f"# TYPE {metric}_calls_total counter",
+            f"{metric}_calls_total {stats['calls']}",
+            f"# TYPE {metric}_max_seconds gauge",
+            f"{metric}_max_seconds {stats['max_seconds']}",
+        ]
+    for name, value in report['counters'].items():
+        metric = _metric_name(name)
+        lines += [f"# TYPE {metric}_total counter", f"{metric}_total {value}"]
+    run = f"{PROMETHEUS_PREFIX}_run"
+    lines += [
+        f"# TYPE {run}_duration_seconds gauge",
+        f"{run}_duration_seconds {report['duration_seconds']}",
+        f"# TYPE {run}_finished_timestamp_seconds gauge",
+        f"{run}_finished_timestamp_seconds {datetime.fromisoformat(report['finished_at']).timestamp():.0f}",
+    ]
+    return '\n'.join(lines) + '\n'
+
+def write_reports(report_file=METRICS_REPORT_FILE, prometheus_file=METRICS_PROMETHEUS_FILE):
+    """
+    Write the JSON run report and, if a path is configured, the Prometheus textfile.
+    Does nothing while metrics are disabled. Returns the report.
+    """
+    if not registry.enabled:
+        return None
+    report = registry.report()
+    try:
+        if report_file:
+            _write_atomic(str(report_file), json.dumps(report, indent=2) + '\n')
+            print(f"Run report written to {report_file}.")
+        if prometheus_file:
+            _write_atomic(str(prometheus_file), prometheus_text(report))
+    except OSError as e:
+        print(f"Could not write run metrics: {e}")
+    return report
@@ -0,0 +1,79 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from src import db_manager as db_mgr
+from src import metrics
+from src.cleaner import clean_job_batch, load_parse_caches
+from src.constants import CLEANER_METHOD, CLEAN_CHUNK_SIZE
+
+def _init_worker():
+    # A forked worker must not reuse the parent's pooled connections
+    db_mgr.dispose_engine(close=False)
+    # Each worker keeps its own parse caches, seeded from the persisted table if any
+    load_parse_caches()
+
+def clean_range(first_id, last_id, method):
+    """
+    Worker task: clean every unprocessed job in [first_id, last_id] and save it
+    through this process's own connection. Returns (rows cleaned, rows inserted).
+    The db_manager helpers print and swallow database errors, so a failed fetch or save
+    (None) is raised here to count the range as failed.
+    """
+    raw_jobs = db_mgr.get_unprocessed_jobs_in_range(first_id, last_id)
+    if raw_jobs is None:
+        raise RuntimeError("fetching the range failed (see the error above)")
+    if not raw_jobs:
+        return 0, 0
+    inserted = db_mgr.save_cleaned_jobs_to_db(clean_job_batch(raw_jobs, method))
+    if inserted is None:
+        raise RuntimeError(f"saving {len(raw_jobs)} cleaned jobs failed (see the error above)")
+    return len(raw_jobs), inserted
+
+def clean_jobs_parallel(workers, method=CLEANER_METHOD, range_size=CLEAN_CHUNK_SIZE):
+    """
+    Clean unprocessed jobs on a pool of worker processes.
+    The unprocessed IDs are split into fixed key ranges up front, so each row belongs to
+    exactly one task and the result does not depend on scheduling. Progress is printed as
+    ranges complete. A failed range does not stop the others; once the pool has drained,
+    RuntimeError lists the failed ranges (their rows stay unprocessed for the next run).
+    Returns the number of rows inserted.
+    """
+    ranges = db_mgr.get_unprocessed_id_ranges(range_size)
+    if not ranges:
+        print("No new jobs to clean.")
+        return 0
+
+    total_rows = sum(count for _, _, count in ranges)
+    print(f"Cleaning {total_rows} unprocessed jobs in {len(ranges)} ranges with {workers} workers...")
+
+    start = time.perf_counter()
+    cleaned = inserted = 0
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {
+            pool.submit(clean_range, first_id, last_id, method): (first_id, last_id)
+            for first_id, last_id, _ in ranges
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            first_id, last_id = futures[future]
+            try:
+                range_cleaned, range_inserted = future.result()
+            except Exception as e:
+                print(f" - > Range {first_id}..{last_id} failed: {type(e).__name__}: {e}")
+                failed.append((first_id, last_id))
+                continue
+            cleaned += range_cleaned
+            inserted += range_inserted
+            # Workers keep their own (discarded) metrics, so the parent counts their results
+            metrics.count('clean.rows', range_cleaned)
+            metrics.count('db.jobs_cleaned.rows_inserted', range_inserted)
+            elapsed = time.perf_counter() - start
+            print(f" - > [{done}/{len(ranges)} ranges] {cleaned}/{total_rows} jobs cleaned "
+                  f"({cleaned / elapsed:,.0f} rows/sec)")
+
+    print(f"Cleaned {cleaned} jobs, {inserted} new rows saved.")
+    if failed:
+        metrics.count('clean.failed_ranges', len(failed))
+        ranges_text = ', '.join(f"{first_id}..{last_id}" for first_id, last_id in sorted(failed))
+        raise RuntimeError(f"{len(failed)} of {len(ranges)} ranges failed and were left unprocessed: "
+                           f"{ranges_text}")
+    return inserted
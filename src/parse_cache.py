@@ -0,0 +1,97 @@
+import json
+import os
+from collections import OrderedDict
+
+# Bump whenever a parse_* function changes its output, so stale persisted tables are ignored
+PARSE_CACHE_VERSION = 3
+
+class MemoizedParser:
+    """
+    Bounded LRU memoization of a single-argument parser, with hit/miss counters.
+    Job Bank strings repeat heavily, so the parser only runs once per distinct string.
+    """
+
+    def __init__(self, parser, maxsize):
+        self.parser = parser
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __call__(self, raw):
+        try:
+            result = self._cache[raw]
+        except KeyError:
+            self.misses += 1
+            result = self.parser(raw)
+            self._store(raw, result)
+            return result
+        except TypeError:
+            # Unhashable input: parse without caching
+            return self.parser(raw)
+        self.hits += 1
+        self._cache.move_to_end(raw)
+        return result
+
+    def _store(self, raw, result):
+        self._cache[raw] = result
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def update(self, entries):
+        for raw, result in entries.items():
+            self._store(raw, result)
+
+    def entries(self):
+        return dict(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total else 0.0
+        return f"{self.hits} hits, {self.misses} misses ({hit_rate:.1%} hit rate, {len(self._cache)} cached)"
+
+def _from_json(value):
+    # Tuples are stored as JSON lists
+    return tuple(value) if isinstance(value, list) else value
+
+def load_caches(path, caches):
+    """
+    Seed each MemoizedParser in caches (name -> parser) from a persisted lookup table.
+    Missing, unreadable or outdated files are ignored.
+    """
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, mode='r', encoding='utf-8') as f:
+            table = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring parse cache {path}: {e}")
+        return
+    if table.get('version') != PARSE_CACHE_VERSION:
+        print(f"Ignoring parse cache {path}: built by an older parser version.")
+        return
+    for name, cache in caches.items():
+        cache.update({raw: _from_json(result) for raw, result in table.get(name, {}).items()})
+
+def save_caches(path, caches):
+    """
+    Persist the raw string -> parsed value entries of every cache in caches.
+    """
+    if not path:
+        return
+    table = {'version': PARSE_CACHE_VERSION}
+    for name, cache in caches.items():
+        # JSON object keys must be strings; None inputs are cheap to parse anyway
+        table[name] = {raw: result for raw, result in cache.entries().items() if isinstance(raw, str)}
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, mode='w', encoding='utf-8') as f:
+        json.dump(table, f, ensure_ascii=False)
+    os.replace(temp_path, path)
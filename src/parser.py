@@ -0,0 +1,145 @@
+import os
+from bs4 import BeautifulSoup, SoupStrainer
+from src import metrics
+from src.records import RawJob
+
+# HTML parser backend used by parse_job_listings (see PARSER_BACKENDS).
+# 'lxml' and 'selectolax' are optional and must be installed separately.
+PARSER_BACKEND = os.getenv('PARSER_BACKEND', 'html.parser')
+
+def clean_text(text):
+    if not text:
+        return "N/A"
+    return ' '.join(text.split())
+
+def _parse_with_soup(html_content, features, parse_only=None):
+    """
+    BeautifulSoup-based extraction shared by the 'html.parser', 'lxml' and 'strainer' backends.
+    """
+    soup = BeautifulSoup(html_content, features, parse_only=parse_only)
+    jobs = soup.find_all('article')
+    job_data_list = []
+
+    for job in jobs:
+        id_attr = job.get('id', '')
+        if not id_attr.startswith('article-'):
+            continue
+
+        title_tag = job.find('span', class_='noctitle')
+        title = title_tag.get_text(strip=True) if title_tag else "N/A"
+
+        date_posted_tag = job.find('li', class_='date')
+        date_posted = date_posted_tag.get_text(strip=True) if date_posted_tag else "N/A"
+
+        location_tag = job.find('li', class_='location')
+        if location_tag:
+            # Remove hidden text often found in location tags
+            inv_span = location_tag.find('span', class_='wb-inv')
+            if inv_span:
+                inv_span.decompose()
+            location = location_tag.get_text(strip=True)
+        else:
+            location = "N/A"
+
+        salary_tag = job.find('li', class_='salary')
+        salary = clean_text(salary_tag.get_text(strip=True)) if salary_tag else "N/A"
+
+        job_data_list.append(RawJob(id_attr, title, date_posted, location, salary))
+
+    return job_data_list
+
+def parse_html_parser(html_content):
+    """Pure-Python parser shipped with the standard library (default)."""
+    return _parse_with_soup(html_content, 'html.parser')
+
+def parse_lxml(html_content):
+    """BeautifulSoup on top of the lxml C parser."""
+    return _parse_with_soup(html_content, 'lxml')
+
+def parse_strainer(html_content):
+    """Standard-library parser that only builds the <article> subtrees."""
+    return _parse_with_soup(html_content, 'html.parser', parse_only=SoupStrainer('article'))
+
+def _node_text(node):
+    # Same result as BeautifulSoup's get_text(strip=True)
+    return node.text(deep=True, separator='', strip=True)
+
+def parse_selectolax(html_content):
+    """Lexbor engine through selectolax; returns the same records as the BeautifulSoup backends."""
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html_content)
+    job_data_list = []
+
+    for job in tree.css('article'):
+        id_attr = job.attributes.get('id') or ''
+        if not id_attr.startswith('article-'):
+            continue
+
+        title_tag = job.css_first('span.noctitle')
+        title = _node_text(title_tag) if title_tag else "N/A"
+
+        date_posted_tag = job.css_first('li.date')
+        date_posted = _node_text(date_posted_tag) if date_posted_tag else "N/A"
+
+        location_tag = job.css_first('li.location')
+        if location_tag:
+            # Remove hidden text often found in location tags
+            inv_span = location_tag.css_first('span.wb-inv')
+            if inv_span:
+                inv_span.decompose()
+            location = _node_text(location_tag)
+        else:
+            location = "N/A"
+
+        salary_tag = job.css_first('li.salary')
+        salary = clean_text(_node_text(salary_tag)) if salary_tag else "N/A"
+
+        job_data_list.append(RawJob(id_attr, title, date_posted, location, salary))
+
+    return job_data_list
+
+PARSER_BACKENDS = {
+    'html.parser': parse_html_parser,
+    'lxml': parse_lxml,
+    'strainer': parse_strainer,
+    'selectolax': parse_selectolax,
+}
+
+# Modules each optional backend needs at parse time
+BACKEND_REQUIREMENTS = {
+    'lxml': 'lxml',
+    'selectolax': 'selectolax.lexbor',
+}
+
+def available_backends():
+    """
+    Return the names of the parser backends whose dependencies are installed.
+    """
+    import importlib
+
+    available = []
+    for name in PARSER_BACKENDS:
+        requirement = BACKEND_REQUIREMENTS.get(name)
+        if requirement:
+            try:
+                importlib.import_module(requirement)
+            except ImportError:
+                continue
+        available.append(name)
+    return available
+
+def parse_job_listings(html_content, backend=None):
+    """
+    Extract RawJob records (id, title, date_posted, location, salary) from search result HTML.
+    Uses PARSER_BACKEND unless a backend name is given.
+    """
+    backend = backend or PARSER_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}'. Choose from: {', '.join(PARSER_BACKENDS)}")
+    with metrics.timer('scrape.parse'):
+        jobs = PARSER_BACKENDS[backend](html_content)
+    if metrics.is_enabled():
+        metrics.count('scrape.html_bytes', len(html_content.encode('utf-8')))
+        metrics.count('scrape.articles_parsed', len(jobs))
+    return jobs
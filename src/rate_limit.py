@@ -0,0 +1,98 @@
+import random
+import threading
+import time
+
+class RateLimiter:
+    """
+    Thread-safe politeness limiter shared by every scraper worker.
+    wait() blocks until at least min_interval seconds have passed since the previous request,
+    so the combined request rate never exceeds 1 / min_interval per second.
+    """
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @classmethod
+    def per_second(cls, max_requests_per_second):
+        return cls(1.0 / max_requests_per_second if max_requests_per_second > 0 else 0.0)
+
+    def wait(self):
+        # Reserve the next slot under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: allows bursts of up to `capacity` requests
+    while keeping the long-run rate at or below `rate` requests per second.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+class AdaptivePacer:
+    """
+    Paces browser actions against a hard ceiling of max_per_minute.
+    The extra delay before each action adapts to the server: it shrinks after fast
+    responses, grows with slow ones and doubles on failures (up to max_delay).
+    Per-action latencies are recorded for the run summary.
+    """
+
+    def __init__(self, max_per_minute, min_delay=0.5, max_delay=30.0, jitter=0.3):
+        self.bucket = TokenBucket(max_per_minute / 60.0)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.delay = min_delay
+        self.latencies = []
+        self.failures = 0
+
+    def wait(self):
+        """Block until the next action is allowed."""
+        self.bucket.acquire()
+        time.sleep(self.delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def record_success(self, latency):
+        self.latencies.append(latency)
+        # Follow the server: half of the latest response time, never below min_delay
+        target = max(self.min_delay, latency / 2)
+        self.delay = min(self.max_delay, max(target, self.delay * 0.75))
+
+    def record_failure(self):
+        """Back off after a timeout or failed action; returns the delay slept."""
+        self.failures += 1
+        self.delay = min(self.max_delay, self.delay * 2)
+        time.sleep(self.delay)
+        return self.delay
+
+    def summary(self):
+        if not self.latencies:
+            return f"no successful actions, {self.failures} failures"
+        ordered = sorted(self.latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        mean = sum(ordered) / len(ordered)
+        return (f"{len(ordered)} actions, mean {mean:.2f}s, p95 {p95:.2f}s, "
+                f"max {ordered[-1]:.2f}s, {self.failures} failures")
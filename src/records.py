@@ -0,0 +1,96 @@
+import sys
+from collections.abc import Mapping
+
+# Typed job records shared by the parser, cleaner and db_manager.
+# A record is one slotted object per job (no per-row __dict__), built once where the row
+# enters the pipeline and passed along as is. Records read like the dicts they replace
+# (job['id'], job.get('city'), dict(job), csv.DictWriter), so code written against dict
+# rows keeps working, and plain dicts are still accepted wherever records are.
+
+def intern(value):
+    # Job Bank strings repeat heavily (titles, places, dates, salaries): keep one copy each
+    return sys.intern(value) if type(value) is str else value
+
+class _Record(Mapping):
+    __slots__ = ()
+    FIELDS = ()
+    _KEYS = frozenset()
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._KEYS else default
+
+    def __contains__(self, key):
+        return key in self._KEYS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def astuple(self):
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    @classmethod
+    def from_mapping(cls, row):
+        """Record from a dict row; missing fields are None."""
+        return cls(*(row.get(name) for name in cls.FIELDS))
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        # Pickle (e.g. to worker processes) as the constructor arguments
+        return type(self), self.astuple()
+
+class RawJob(_Record):
+    """A scraped job listing as parsed from the search results (the scraped columns of jobs)."""
+    FIELDS = ('id', 'title', 'date_posted', 'location', 'salary')
+    _KEYS = frozenset(FIELDS)
+    __slots__ = FIELDS
+
+    def __init__(self, id, title, date_posted, location, salary):
+        self.id = id
+        self.title = intern(title)
+        self.date_posted = intern(date_posted)
+        self.location = intern(location)
+        self.salary = intern(salary)
+
+class CleanJob(_Record):
+    """
+    A cleaned job, with the columns of jobs_cleaned. FIELDS follows the cleaner's output
+    (annualized salaries before cleaned_at), not the table's column order, which differs
+    between new and migrated databases: rows are always matched to columns by name.
+    cleaned_at and job_number are filled in by save_cleaned_jobs_to_db if the cleaner
+    left them empty.
+    """
+    FIELDS = ('id', 'title', 'date_posted', 'city', 'province', 'min_salary', 'max_salary',
+              'salary_period', 'min_salary_annual', 'max_salary_annual', 'cleaned_at', 'job_number')
+    _KEYS = frozenset(FIELDS)
+    __slots__ = FIELDS
+
+    def __init__(self, id, title, date_posted, city, province, min_salary, max_salary, salary_period,
+                 min_salary_annual=None, max_salary_annual=None, cleaned_at=None, job_number=None):
+        self.id = id
+        self.title = intern(title)
+        self.date_posted = date_posted
+        # city and province are interned by the location parsers, once per distinct location
+        self.city = city
+        self.province = province
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+        self.salary_period = salary_period
+        self.min_salary_annual = min_salary_annual
+        self.max_salary_annual = max_salary_annual
+        self.cleaned_at = cleaned_at
+        self.job_number = job_number
+
+def as_records(rows, record_type):
+    """rows as a list of record_type, converting only the rows that are plain mappings."""
+    return [row if type(row) is record_type else record_type.from_mapping(row) for row in rows]
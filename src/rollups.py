@@ -0,0 +1,197 @@
+import math
+from collections import Counter, defaultdict
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from src import db_manager as db_mgr
+
+# Salary sketch buckets grow geometrically: bucket i covers (GAMMA**(i-1), GAMMA**i],
+# so any quantile read from it is within 1% of the true annualized salary
+SKETCH_GAMMA = 1.02
+
+# Rows read per round-trip when rebuilding from jobs_cleaned
+REBUILD_CHUNK_SIZE = 10_000
+
+def month_key(date_posted):
+    """'YYYY-MM' for a date or ISO date string, None if missing."""
+    if not date_posted:
+        return None
+    return str(date_posted)[:7]
+
+def annual_range(job):
+    """(min, max) annualized salary, filling a missing bound from the other one."""
+    low, high = job.get('min_salary_annual'), job.get('max_salary_annual')
+    if low is None and high is None:
+        return None
+    return (low if low is not None else high), (high if high is not None else low)
+
+def sketch_bucket(value):
+    return math.ceil(math.log(value) / math.log(SKETCH_GAMMA))
+
+def bucket_value(bucket):
+    # Midpoint (in relative terms) of the bucket's range
+    return 2 * SKETCH_GAMMA ** bucket / (SKETCH_GAMMA + 1)
+
+class RollupDelta:
+    """
+    Aggregates of a batch of cleaned jobs, ready to be added to the rollup tables.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.salaries = defaultdict(lambda: [0, 0.0, 0.0])
+        self.sketch = Counter()
+
+    def add(self, job):
+        keys = {
+            'province': job.get('province'),
+            'city': job.get('city'),
+            'month': month_key(job.get('date_posted')),
+            'title': job.get('title'),
+        }
+        for dimension, key in keys.items():
+            # Missing values are not counted, like pandas value_counts()
+            if key:
+                self.counts[(dimension, key)] += 1
+
+        salary = annual_range(job)
+        if salary is None:
+            return
+        low, high = salary
+        for dimension, key in (('all', 'all'), ('province', job.get('province')), ('period', job.get('salary_period'))):
+            if key:
+                totals = self.salaries[(dimension, key)]
+                totals[0] += 1
+                totals[1] += low
+                totals[2] += high
+        midpoint = (low + high) / 2
+        if midpoint > 0:
+            self.sketch[sketch_bucket(midpoint)] += 1
+
+    def __bool__(self):
+        return bool(self.counts or self.salaries)
+
+def _add_to_table(conn, table, rows, sum_columns):
+    """
+    Upsert rows, adding sum_columns to the existing values on conflict.
+    Rows are sorted by key so concurrent writers lock them in the same order.
+    """
+    if not rows:
+        return
+    dialect = sqlite if conn.dialect.name == 'sqlite' else postgresql
+    key_columns = [column.name for column in table.primary_key.columns]
+    stmt = dialect.insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={name: table.c[name] + stmt.excluded[name] for name in sum_columns},
+    )
+    rows.sort(key=lambda row: tuple(row[name] for name in key_columns))
+    conn.execute(stmt, rows)
+
+def apply_delta(conn, delta):
+    _add_to_table(conn, db_mgr.rollup_counts_table, [
+        {'dimension': dimension, 'key': key, 'job_count': count}
+        for (dimension, key), count in delta.counts.items()
+    ], ['job_count'])
+    _add_to_table(conn, db_mgr.rollup_salary_table, [
+        {'dimension': dimension, 'key': key, 'salary_count': count, 'min_annual_sum': low, 'max_annual_sum': high}
+        for (dimension, key), (count, low, high) in delta.salaries.items()
+    ], ['salary_count', 'min_annual_sum', 'max_annual_sum'])
+    _add_to_table(conn, db_mgr.rollup_salary_sketch_table, [
+        {'bucket': bucket, 'job_count': count} for bucket, count in delta.sketch.items()
+    ], ['job_count'])
+
+def update_rollups(conn, cleaned_jobs, inserted_ids):
+    """
+    Add the cleaned jobs whose IDs are in inserted_ids to the rollup tables.
+    Called by save_cleaned_jobs_to_db in the transaction that inserted them.
+    """
+    delta = RollupDelta()
+    for job in cleaned_jobs:
+        if job['id'] in inserted_ids:
+            delta.add(job)
+    if delta:
+        apply_delta(conn, delta)
+
+def rebuild_rollups(conn):
+    """
+    Recompute every rollup from jobs_cleaned, e.g. for data cleaned before the
+    rollups existed. Only the columns the rollups need are read (streamed).
+    Returns the number of cleaned jobs aggregated.
+    """
+    table = db_mgr.jobs_cleaned_table
+    columns = ['province', 'city', 'date_posted', 'title', 'salary_period', 'min_salary_annual', 'max_salary_annual']
+    query = select(*(table.c[name] for name in columns)).execution_options(yield_per=REBUILD_CHUNK_SIZE)
+    delta = RollupDelta()
+    total = 0
+    for job in conn.execute(query).mappings():
+        delta.add(job)
+        total += 1
+
+    for rollup in (db_mgr.rollup_counts_table, db_mgr.rollup_salary_table, db_mgr.rollup_salary_sketch_table):
+        conn.execute(delete(rollup))
+    apply_delta(conn, delta)
+    return total
+
+def ensure_rollups(conn):
+    """
+    Build the rollups once if they are empty but jobs_cleaned already has rows.
+    """
+    rollup_rows = conn.execute(select(func.count()).select_from(db_mgr.rollup_counts_table)).scalar()
+    if rollup_rows:
+        return
+    if conn.execute(select(db_mgr.jobs_cleaned_table.c.id).limit(1)).first() is None:
+        return
+    print("Building analytics rollups from existing cleaned jobs...")
+    rebuild_rollups(conn)
+
+def read_counts(conn, dimension, limit=None, order='count'):
+    """
+    [(key, job_count)] for a dimension, largest first (order='count') or by key (order='key').
+    """
+    table = db_mgr.rollup_counts_table
+    query = select(table.c.key, table.c.job_count).where(table.c.dimension == dimension)
+    if order == 'count':
+        query = query.order_by(table.c.job_count.desc(), table.c.key)
+    else:
+        query = query.order_by(table.c.key)
+    if limit:
+        query = query.limit(limit)
+    return [tuple(row) for row in conn.execute(query)]
+
+def read_salaries(conn, dimension):
+    """
+    [(key, salary_count, mean annual min, mean annual max)] for a salary dimension.
+    """
+    table = db_mgr.rollup_salary_table
+    query = select(table).where(table.c.dimension == dimension).order_by(table.c.key)
+    return [
+        (row.key, row.salary_count, row.min_annual_sum / row.salary_count, row.max_annual_sum / row.salary_count)
+        for row in conn.execute(query)
+    ]
+
+def salary_quantiles(conn, quantiles=(0.25, 0.5, 0.75, 0.9)):
+    """
+    Approximate quantiles of the annualized salary midpoint, read from the sketch.
+    Returns {quantile: salary}, empty if no salaries are known.
+    """
+    table = db_mgr.rollup_salary_sketch_table
+    buckets = conn.execute(select(table.c.bucket, table.c.job_count).order_by(table.c.bucket)).all()
+    total = sum(count for _, count in buckets)
+    if not total:
+        return {}
+
+    result = {}
+    targets = sorted(quantiles)
+    seen = 0
+    for bucket, count in buckets:
+        seen += count
+        while targets and seen >= targets[0] * total:
+            result[targets.pop(0)] = round(bucket_value(bucket), 2)
+    for quantile in targets:
+        result[quantile] = round(bucket_value(buckets[-1][0]), 2)
+    return result
+
+if __name__ == "__main__":
+    with db_mgr.connection_scope() as conn:
+        total = rebuild_rollups(conn)
+    print(f"Rebuilt analytics rollups from {total} cleaned jobs.")
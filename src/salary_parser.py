@@ -0,0 +1,176 @@
+import re
+
+# Multipliers from a salary period to a yearly figure (40-hour weeks, 52 weeks, 260 working days)
+ANNUAL_FACTORS = {
+    'hourly': 2080.0,
+    'daily': 260.0,
+    'weekly': 52.0,
+    'biweekly': 26.0,
+    'semimonthly': 24.0,
+    'monthly': 12.0,
+    'annually': 1.0,
+}
+
+# Words that name a period on their own (English and French)
+PERIOD_WORDS = {
+    'hourly': 'hourly', 'horaire': 'hourly',
+    'daily': 'daily', 'quotidien': 'daily', 'quotidiennement': 'daily',
+    'weekly': 'weekly', 'hebdomadaire': 'weekly', 'hebdomadairement': 'weekly',
+    'biweekly': 'biweekly', 'bi-weekly': 'biweekly', 'bihebdomadaire': 'biweekly', 'bi-hebdomadaire': 'biweekly',
+    'semi-monthly': 'semimonthly', 'semimonthly': 'semimonthly', 'bimensuel': 'semimonthly',
+    'bimensuelle': 'semimonthly',
+    'monthly': 'monthly', 'mensuel': 'monthly', 'mensuelle': 'monthly', 'mensuellement': 'monthly',
+    'annually': 'annually', 'yearly': 'annually', 'annuel': 'annually', 'annuelle': 'annually',
+    'annuellement': 'annually',
+}
+
+# Units that name a period after "per", "a", "par", "/" or "l'" ("per hour", "/yr", "de l'heure")
+PERIOD_UNITS = {
+    'hour': 'hourly', 'hr': 'hourly', 'h': 'hourly', 'heure': 'hourly',
+    'day': 'daily', 'jour': 'daily',
+    'week': 'weekly', 'wk': 'weekly', 'semaine': 'weekly',
+    'month': 'monthly', 'mo': 'monthly', 'mois': 'monthly',
+    'year': 'annually', 'yr': 'annually', 'annum': 'annually', 'année': 'annually', 'annee': 'annually',
+    'an': 'annually',
+}
+UNIT_PREFIXES = {'per', 'a', 'an', 'par', 'l', '/'}
+
+# "every two weeks", "aux deux semaines"
+BIWEEKLY_UNITS = {'weeks', 'semaines'}
+BIWEEKLY_PREFIXES = {'two', 'deux'}
+
+# Range keywords; only one seen before the first amount applies ("up to $50", "à partir de 4 000 $").
+# A bare French "de" is not one: "Salaire de 25,00 $ de l'heure" is a single amount
+UP_TO_WORDS = {'jusqu'}
+FROM_WORDS = {'from', 'starting', 'partir'}
+
+# Spaces used as thousands separators in French amounts ("119 700,00 $")
+GROUP_SPACES = ' \u00a0\u202f'
+
+# A number may use ',' '.' or a grouping space as separators; it is validated after matching.
+# An optional k/K suffix means thousands ("$50K")
+NUMBER = rf'\d(?:[\d,.]|[{GROUP_SPACES}](?=\d{{3}}(?!\d)))*(?:\s?(?P<kilo>[kK])(?!\w))?'
+
+# The whole string is tokenized in one scan into amounts, words and slashes
+SALARY_TOKEN = re.compile(rf'(?P<number>{NUMBER})|(?P<word>[^\W\d_]+(?:-[^\W\d_]+)?)|(?P<slash>/)')
+
+MISSING_VALUES = {"", "n/a", "s/o"}
+
+# Job Bank's own English format, matched in one step before falling back to the tokenizer
+JOB_BANK_AMOUNT = r'\$(\d{1,3}(?:,\d{3})*(?:\.\d+)?)'
+JOB_BANK_SALARY = re.compile(
+    rf'Salary {JOB_BANK_AMOUNT}(?: to {JOB_BANK_AMOUNT})? (hourly|daily|weekly|biweekly|monthly|annually)'
+    r'(?: \(to be negotiated\))?'
+)
+
+def _join_groups(whole, separator):
+    # Every group after the first must have exactly three digits
+    head, *groups = whole.split(separator)
+    if not head or not all(len(group) == 3 for group in groups):
+        return None
+    return head + ''.join(groups)
+
+def parse_number(token):
+    """
+    Convert a matched number token to float, or None if it is malformed.
+    '1,234.56', '1.234,56', '1 234,56' and '42,41' (French decimal comma) are all accepted.
+    """
+    for space in GROUP_SPACES:
+        token = token.replace(space, '')
+    token = token.rstrip('.,')
+
+    if ',' in token and '.' in token:
+        # The separator that appears last is the decimal point
+        decimal, thousands = (',', '.') if token.rfind(',') > token.rfind('.') else ('.', ',')
+        if token.count(decimal) > 1:
+            return None
+        whole, fraction = token.split(decimal)
+        whole = _join_groups(whole, thousands)
+        token = None if whole is None else f"{whole}.{fraction}"
+    elif ',' in token:
+        whole, _, fraction = token.rpartition(',')
+        if token.count(',') == 1 and len(fraction) <= 2:
+            token = f"{whole}.{fraction}"
+        else:
+            token = _join_groups(token, ',')
+    elif token.count('.') > 1:
+        token = _join_groups(token, '.')
+
+    if token is None:
+        return None
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+def parse_salary(salary_str):
+    """
+    Extract min/max salary and period from a salary string.
+    "Salary $42.41 to $96.63 hourly" -> (42.41, 96.63, 'hourly')
+    "Salaire 42,41 $ à 96,63 $ de l'heure" -> (42.41, 96.63, 'hourly')
+    Job Bank's standard format is matched directly; anything else goes through scan_salary.
+    Returns tuple: (min_salary, max_salary, period)
+    """
+    if not salary_str or salary_str.strip().lower() in MISSING_VALUES:
+        return None, None, None
+
+    match = JOB_BANK_SALARY.fullmatch(salary_str)
+    if match:
+        low, high, period = match.groups()
+        min_salary = float(low.replace(',', ''))
+        return min_salary, float(high.replace(',', '')) if high else min_salary, period
+    return scan_salary(salary_str)
+
+def scan_salary(salary_str):
+    """
+    General single-pass salary grammar over amount, word and slash tokens.
+    A single amount is both min and max; "up to X" leaves min empty, "from X" leaves max empty.
+    Malformed numbers are skipped. The first period phrase found wins.
+    """
+    numbers = []
+    period = None
+    bound = None
+    previous = None
+    for match in SALARY_TOKEN.finditer(salary_str):
+        kind = match.lastgroup
+        if kind == 'number':
+            kilo = match.group('kilo')
+            value = parse_number(match.group('number').removesuffix(kilo or '').rstrip())
+            if value is not None:
+                numbers.append(value * 1000 if kilo else value)
+            previous = None
+            continue
+        if kind == 'slash':
+            previous = '/'
+            continue
+
+        word = match.group('word').lower()
+        if period is None:
+            if word in PERIOD_WORDS:
+                period = PERIOD_WORDS[word]
+            elif word in PERIOD_UNITS and previous in UNIT_PREFIXES:
+                period = PERIOD_UNITS[word]
+            elif word in BIWEEKLY_UNITS and previous in BIWEEKLY_PREFIXES:
+                period = 'biweekly'
+        if not numbers and bound is None:
+            if word in UP_TO_WORDS or (word == 'to' and previous == 'up'):
+                bound = 'up_to'
+            elif word in FROM_WORDS:
+                bound = 'from'
+        previous = word
+
+    if not numbers:
+        return None, None, period
+    if len(numbers) > 1:
+        return numbers[0], numbers[1], period
+    if bound == 'up_to':
+        return None, numbers[0], period
+    if bound == 'from':
+        return numbers[0], None, period
+    return numbers[0], numbers[0], period
+
+def annualize(amount, period):
+    """Yearly equivalent of amount paid per period (None if either is unknown)."""
+    if amount is None or period not in ANNUAL_FACTORS:
+        return None
+    return round(amount * ANNUAL_FACTORS[period], 2)
@@ -0,0 +1,196 @@
+from datetime import date, datetime
+from sqlalchemy import func, insert, select, text, update
+from src import db_manager as db_mgr
+from src.dates import parse_date
+
+# Versioned schema migrations, applied in order by init_db and recorded in schema_migrations.
+# create_all() only creates missing tables (with their columns and indexes), so each step
+# must also bring an existing database up to date, and be safe to run on a fresh one.
+
+# SQL mirror of salary_parser.annualize, used to backfill rows cleaned before the columns existed
+ANNUAL_FACTOR_SQL = """
+    CASE salary_period
+        WHEN 'hourly' THEN 2080 WHEN 'daily' THEN 260 WHEN 'weekly' THEN 52
+        WHEN 'biweekly' THEN 26 WHEN 'semimonthly' THEN 24 WHEN 'monthly' THEN 12 WHEN 'annually' THEN 1
+    END
+"""
+
+# Future months for which partitions are created ahead of time
+PARTITION_MONTHS_AHEAD = 3
+
+def add_annual_salary_columns(conn):
+    added = db_mgr.ensure_columns(conn, db_mgr.jobs_cleaned_table)
+    if 'min_salary_annual' in added or 'max_salary_annual' in added:
+        conn.execute(text(f"""
+            UPDATE jobs_cleaned
+            SET min_salary_annual = ROUND(CAST(min_salary * {ANNUAL_FACTOR_SQL} AS NUMERIC), 2),
+                max_salary_annual = ROUND(CAST(max_salary * {ANNUAL_FACTOR_SQL} AS NUMERIC), 2)
+        """))
+
+def add_processed_at(conn):
+    if 'processed_at' in db_mgr.ensure_columns(conn, db_mgr.jobs_table):
+        # Jobs cleaned before change capture existed count as processed
+        conn.execute(text("""
+            UPDATE jobs
+            SET processed_at = (SELECT COALESCE(jc.cleaned_at, CURRENT_TIMESTAMP)
+                                FROM jobs_cleaned jc WHERE jc.id = jobs.id)
+            WHERE EXISTS (SELECT 1 FROM jobs_cleaned jc WHERE jc.id = jobs.id)
+        """))
+    db_mgr.unprocessed_jobs_index.create(conn, checkfirst=True)
+
+def _article_id_condition(conn):
+    # IDs of the form 'article-<digits>', whose numeric part becomes job_number
+    if conn.dialect.name == 'sqlite':
+        return "id GLOB 'article-[0-9]*' AND SUBSTR(id, 9) NOT GLOB '*[^0-9]*'"
+    return "id ~ '^article-[0-9]+$'"
+
+def add_job_number_and_posted_on(conn):
+    db_mgr.ensure_columns(conn, db_mgr.jobs_table)
+    db_mgr.ensure_columns(conn, db_mgr.jobs_cleaned_table)
+    for table in ('jobs', 'jobs_cleaned'):
+        conn.execute(text(f"""
+            UPDATE {table} SET job_number = CAST(SUBSTR(id, 9) AS BIGINT)
+            WHERE job_number IS NULL AND {_article_id_condition(conn)}
+        """))
+
+    # Raw dates are few distinct strings ("January 17, 2026"): parse each once in Python
+    jobs = db_mgr.jobs_table
+    raw_dates = conn.execute(
+        select(jobs.c.date_posted).where(jobs.c.posted_on.is_(None), jobs.c.date_posted.isnot(None)).distinct()
+    ).scalars().all()
+    for raw_date in raw_dates:
+        parsed = parse_date(raw_date)
+        if parsed:
+            conn.execute(update(jobs).where(jobs.c.date_posted == raw_date, jobs.c.posted_on.is_(None))
+                         .values(posted_on=date.fromisoformat(parsed)))
+
+def create_secondary_indexes(conn):
+    for table in (db_mgr.jobs_table, db_mgr.jobs_cleaned_table):
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+SCHEMA_MIGRATIONS = [
+    (1, "annualized salary columns on jobs_cleaned", add_annual_salary_columns),
+    (2, "processed_at change capture on jobs", add_processed_at),
+    (3, "numeric job_number key and typed posted_on date", add_job_number_and_posted_on),
+    (4, "indexes on scraped_at, job_number, date_posted, province, city and title", create_secondary_indexes),
+]
+
+def migrate(conn):
+    """
+    Apply the schema migrations not yet recorded in schema_migrations, each in order.
+    Runs in the caller's transaction. Returns the versions applied.
+    """
+    table = db_mgr.schema_migrations_table
+    applied = set(conn.execute(select(table.c.version)).scalars())
+    versions = []
+    for version, description, step in SCHEMA_MIGRATIONS:
+        if version in applied:
+            continue
+        print(f"Applying schema migration {version}: {description}...")
+        step(conn)
+        conn.execute(insert(table).values(version=version, description=description, applied_at=datetime.now()))
+        versions.append(version)
+    return versions
+
+# --- Optional monthly partitioning of jobs_cleaned (PostgreSQL) ---
+
+_partitioned = {}
+
+def is_partitioned(conn):
+    """True if jobs_cleaned is a partitioned table (cached per engine)."""
+    key = str(conn.engine.url)
+    if key not in _partitioned:
+        _partitioned[key] = conn.dialect.name == 'postgresql' and bool(conn.execute(text("""
+            SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid
+            WHERE c.relname = 'jobs_cleaned' AND pg_table_is_visible(c.oid)
+        """)).first())
+    return _partitioned[key]
+
+def _next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+def partition_name(month):
+    return f"jobs_cleaned_y{month.year}m{month.month:02d}"
+
+def existing_partitions(conn):
+    """Names of the partitions of jobs_cleaned, as seen by this transaction."""
+    return set(conn.execute(text("""
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = 'jobs_cleaned' AND pg_table_is_visible(p.oid)
+    """)).scalars())
+
+def ensure_month_partitions(conn, months):
+    """
+    Create the monthly partitions of jobs_cleaned for the given first-of-month dates.
+    Rows without a date go to the default partition.
+    The existing partitions are read from the catalog in the caller's transaction rather
+    than cached, so a rolled-back CREATE is never taken for an existing partition.
+    """
+    existing = existing_partitions(conn)
+    for month in sorted(set(months)):
+        if partition_name(month) in existing:
+            continue
+        conn.exec_driver_sql(
+            f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" PARTITION OF jobs_cleaned '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+
+def partition_jobs_cleaned(conn):
+    """
+    Convert jobs_cleaned into a table partitioned by month of date_posted (PostgreSQL).
+    The existing rows are copied into monthly partitions in one transaction. A unique
+    index on (id, date_posted) replaces the primary key, since unique constraints of a
+    partitioned table must include the partition key; NULLs count as equal (PostgreSQL 15+),
+    so jobs without a date stay unique too.
+    """
+    if conn.dialect.name != 'postgresql':
+        raise ValueError("Monthly partitioning needs PostgreSQL")
+    if is_partitioned(conn):
+        return False
+
+    print("Partitioning jobs_cleaned by month of date_posted...")
+    conn.exec_driver_sql('ALTER TABLE jobs_cleaned RENAME TO jobs_cleaned_unpartitioned')
+    for index in db_mgr.jobs_cleaned_table.indexes:
+        conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{index.name}"')
+    conn.exec_driver_sql(
+        'CREATE TABLE jobs_cleaned (LIKE jobs_cleaned_unpartitioned INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (date_posted)'
+    )
+    conn.exec_driver_sql('ALTER TABLE jobs_cleaned ALTER COLUMN id SET NOT NULL')
+    # NULLS NOT DISTINCT needs PostgreSQL 15; before that, undated rows rely on processed_at alone
+    nulls = ' NULLS NOT DISTINCT' if conn.dialect.server_version_info >= (15,) else ''
+    conn.exec_driver_sql(f'CREATE UNIQUE INDEX ux_jobs_cleaned_id_date_posted ON jobs_cleaned (id, date_posted){nulls}')
+    conn.exec_driver_sql('CREATE TABLE IF NOT EXISTS jobs_cleaned_default PARTITION OF jobs_cleaned DEFAULT')
+
+    jobs_cleaned = db_mgr.jobs_cleaned_table
+    first, last = conn.execute(text(
+        'SELECT MIN(date_posted), MAX(date_posted) FROM jobs_cleaned_unpartitioned'
+    )).one()
+    today = date.today().replace(day=1)
+    month = (first or today).replace(day=1)
+    end = max((last or today).replace(day=1), today)
+    for _ in range(PARTITION_MONTHS_AHEAD):
+        end = _next_month(end)
+    months = []
+    while month <= end:
+        months.append(month)
+        month = _next_month(month)
+    ensure_month_partitions(conn, months)
+
+    columns = ', '.join(f'"{column.name}"' for column in jobs_cleaned.columns)
+    conn.exec_driver_sql(f'INSERT INTO jobs_cleaned ({columns}) SELECT {columns} FROM jobs_cleaned_unpartitioned')
+    conn.exec_driver_sql('DROP TABLE jobs_cleaned_unpartitioned')
+    # Secondary indexes are created on the parent and cascade to every partition
+    create_secondary_indexes(conn)
+    # Not cached as True until committed: the next is_partitioned call asks the catalog again
+    _partitioned.pop(str(conn.engine.url), None)
+    rows = conn.execute(select(func.count()).select_from(jobs_cleaned)).scalar()
+    print(f"jobs_cleaned partitioned into {len(months)} monthly partitions ({rows} rows).")
+    return True
+
+def month_starts(cleaned_rows):
+    """First-of-month dates of the rows' date_posted values."""
+    return {row['date_posted'].replace(day=1) for row in cleaned_rows if row['date_posted']}
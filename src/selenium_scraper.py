@@ -0,0 +1,377 @@
+import time
+from src import db_manager as db_mgr
+from src import metrics
+from src.constants import BASE_URL, MAX_CLICKS_PER_MINUTE
+from src.dedup import DuplicateTracker
+from src.driver_pool import get_driver_pool
+from src.parser import parse_job_listings
+from src.rate_limit import AdaptivePacer
+from src.write_behind import BackgroundWriter
+
+# Selenium Imports
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, ElementClickInterceptedException
+from selenium.webdriver.common.action_chains import ActionChains
+
+# Serializes only the <article> nodes appended after arguments[0] and returns them
+# together with the total article count, so each section costs O(new articles).
+NEW_ARTICLES_SCRIPT = """
+    const articles = document.getElementsByTagName('article');
+    const html = [];
+    for (let i = arguments[0]; i < articles.length; i++) {
+        html.push(articles[i].outerHTML);
+    }
+    return [html.join(''), articles.length];
+"""
+
+# Resolves with the article count once it exceeds arguments[0], or -1 after arguments[1] ms.
+# A MutationObserver wakes the script on DOM changes, so no polling interval is involved.
+WAIT_FOR_NEW_ARTICLES_SCRIPT = """
+    const [minCount, timeoutMs, done] = arguments;
+    const articles = document.getElementsByTagName('article');
+    if (articles.length > minCount) {
+        done(articles.length);
+        return;
+    }
+    let timer = null;
+    const observer = new MutationObserver(() => {
+        if (articles.length > minCount) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(articles.length);
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    timer = setTimeout(() => {
+        observer.disconnect();
+        done(-1);
+    }, timeoutMs);
+"""
+
+def get_new_articles_html(driver, start_index):
+    """
+    Fetch the HTML of articles appended after start_index (high-water mark).
+    Returns tuple: (html, total_article_count)
+    """
+    html, total_article_count = driver.execute_script(NEW_ARTICLES_SCRIPT, start_index)
+    if total_article_count < start_index:
+        # The result list was re-rendered (e.g. page reload): start over from the top
+        html, total_article_count = driver.execute_script(NEW_ARTICLES_SCRIPT, 0)
+    return html, total_article_count
+
+def dismiss_overlays(driver):
+    """Attempt to close any overlays, popups, or cookie banners that might block clicks."""
+    overlay_selectors = [
+        # Common cookie consent buttons
+        "button[id*='accept']",
+        "button[class*='accept']",
+        "button[class*='cookie']",
+        "button[id*='cookie']",
+        ".modal-close",
+        "[data-dismiss='modal']",
+        "button.close",
+        # Job Bank specific selectors if any
+        ".alert-dismissible .close",
+    ]
+    
+    for selector in overlay_selectors:
+        try:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            for element in elements:
+                if element.is_displayed():
+                    try:
+                        element.click()
+                        time.sleep(0.5)
+                        print(f" - -> Dismissed overlay: {selector}")
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+
+
+def wait_for_page_ready(driver, timeout=10):
+    """Wait for page to be fully loaded and ready for interaction."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        # Additional wait for any AJAX requests to complete
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script(
+                "return (typeof jQuery === 'undefined' || jQuery.active === 0)"
+            )
+        )
+        return True
+    except Exception:
+        return True  # Continue anyway if jQuery check fails
+
+
+def click_element_with_retry(driver, element, max_retries=3):
+    """Try multiple click strategies to ensure the element is clicked."""
+    for attempt in range(max_retries):
+        try:
+            # Strategy 1: Standard Selenium click
+            if attempt == 0:
+                element.click()
+                return True
+            
+            # Strategy 2: JavaScript click
+            elif attempt == 1:
+                driver.execute_script("arguments[0].click();", element)
+                return True
+            
+            # Strategy 3: ActionChains click with move
+            else:
+                actions = ActionChains(driver)
+                actions.move_to_element(element).pause(0.5).click().perform()
+                return True
+                
+        except StaleElementReferenceException:
+            print(f" - -> Element became stale on click attempt {attempt + 1}. Re-fetching...")
+            return None  # Signal to re-fetch element
+            
+        except ElementClickInterceptedException as e:
+            print(f" - -> Click intercepted on attempt {attempt + 1}: {str(e)[:100]}")
+            # Try to dismiss any overlays
+            dismiss_overlays(driver)
+            time.sleep(1)
+            continue
+            
+        except Exception as e:
+            print(f" - -> Click attempt {attempt + 1} failed: {str(e)[:100]}")
+            time.sleep(0.5)
+            continue
+    
+    return False
+
+
+def wait_for_new_articles(driver, current_article_count, timeout=60):
+    """
+    Block until the page has more than current_article_count articles, woken by a
+    MutationObserver instead of polling. Returns the new article count, or None on timeout.
+    The driver's script timeout is restored afterwards, as the driver goes back to the pool.
+    """
+    previous_timeout = driver.timeouts.script
+    driver.set_script_timeout(timeout + 5)
+    try:
+        count = driver.execute_async_script(WAIT_FOR_NEW_ARTICLES_SCRIPT, current_article_count, int(timeout * 1000))
+    except TimeoutException:
+        return None
+    finally:
+        driver.set_script_timeout(previous_timeout)
+    return count if count > current_article_count else None
+
+
+def more_results_button(driver, current_article_count, pacer=None):
+    """
+    Click the 'Show more' button with robust error handling and multiple strategies.
+    Waits are event-driven: clicks are paced by the AdaptivePacer and new articles are
+    detected as soon as they are inserted. Per-click latency is recorded on the pacer.
+    """
+    pacer = pacer or AdaptivePacer(MAX_CLICKS_PER_MINUTE)
+    max_attempts = 5
+    
+    for attempt in range(1, max_attempts + 1):
+        try:
+            print(f" - > [{attempt}/{max_attempts}] Attempt. Looking for 'Show more' button...")
+            
+            # Wait for page to be ready
+            wait_for_page_ready(driver)
+            
+            # Dismiss any overlays first
+            if attempt > 1:
+                dismiss_overlays(driver)
+            
+            # Wait for button to be present in DOM
+            more_button = WebDriverWait(driver, 15, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.ID, 'moreresultbutton'))
+            )
+            
+            if not more_button.is_enabled():
+                print(f" - > [{attempt}/{max_attempts}] Button is disabled. May have reached end of listings.")
+                return False
+            
+            # Scroll to element with offset to ensure it's not hidden by headers
+            # (instant scroll, so no settle time is needed)
+            driver.execute_script("""
+                arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});
+                window.scrollBy(0, -100);
+            """, more_button)
+            
+            # Wait for button to be clickable
+            more_button = WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                EC.element_to_be_clickable((By.ID, 'moreresultbutton'))
+            )
+            
+            # Adaptive, rate-capped delay before click (replaces the fixed human-like delay)
+            with metrics.timer('scrape.pacer_wait'):
+                pacer.wait()
+            
+            # Attempt to click with retry strategies
+            click_started = time.monotonic()
+            click_result = click_element_with_retry(driver, more_button)
+            
+            if click_result is None:
+                # Element was stale, continue to next attempt
+                continue
+            elif not click_result:
+                print(f" - > [{attempt}/{max_attempts}] All click strategies failed.")
+                pacer.record_failure()
+                continue
+            
+            print(" - > 'Show more' button clicked. Waiting for new data to load...")
+
+            # Wake up as soon as new articles are inserted
+            with metrics.timer('scrape.wait_for_articles'):
+                new_count = wait_for_new_articles(driver, current_article_count, timeout=60)
+            if new_count is not None:
+                latency = time.monotonic() - click_started
+                pacer.record_success(latency)
+                print(f" - > New job listings loaded in {latency:.1f}s. ({current_article_count} -> {new_count})")
+                return True
+
+            print(f" - > [{attempt}/{max_attempts}] Timeout waiting for new job listings after click.")
+
+            # The site may be slow to respond (anti-bot?): back off, then re-check
+            backoff = pacer.record_failure()
+            print(f" - > Backed off {backoff:.1f}s before checking button state...")
+
+            new_count = len(driver.find_elements(By.TAG_NAME, 'article'))
+            if new_count > current_article_count:
+                print(f" - > New job listings detected after extra wait. ({current_article_count} -> {new_count})")
+                return True
+
+            # Check if button still exists and is clickable using WebDriverWait
+            try:
+                btn_check = WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.ID, 'moreresultbutton'))
+                )
+
+                driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", btn_check)
+
+                if not btn_check.is_displayed():
+                    print(" - > Button exists but is hidden. May have reached end of listings.")
+                    return False
+
+                if not btn_check.is_enabled():
+                    print(" - > Button is disabled. May have reached end of listings.")
+                    return False
+
+                print(f" - > Button still exists and is clickable. Retrying...")
+
+            except TimeoutException:
+                print(" - > Button not found after waiting. May have reached end of listings or page issue.")
+                # One more check with simple find
+                try:
+                    driver.find_element(By.ID, 'moreresultbutton')
+                    print(" - > Button found with simple find. Retrying...")
+                except Exception:
+                    # Really no button
+                    return False
+            continue
+
+        except TimeoutException:
+            print(f" - > [{attempt}/{max_attempts}] Timeout waiting for button to appear.")
+            
+            # Check if we've reached the end of listings (button might not exist)
+            try:
+                btn = driver.find_element(By.ID, 'moreresultbutton')
+                if not btn.is_displayed():
+                    print(" - > Button exists but is hidden. May have reached end of listings.")
+                    return False
+            except Exception:
+                print(" - > Button not found. May have reached end of listings.")
+                return False
+            
+            pacer.record_failure()
+            continue
+            
+        except StaleElementReferenceException:
+            print(f" - > [{attempt}/{max_attempts}] Stale element. Page may have updated. Retrying...")
+            continue
+            
+        except Exception as e:
+            print(f" - > [{attempt}/{max_attempts}] Exception occurred: {type(e).__name__}: {str(e)[:150]}")
+            pacer.record_failure()
+            continue
+
+    print(f" - > [Terminating] {max_attempts} attempts reached without loading new job listings.")
+    print(f" - > Failed to load new job listings after {max_attempts} attempts. Ending scraping.")
+    return False
+
+def run_selenium_scraper(incremental=True, pool=None):
+    """
+    Scrape Job Bank listings with Selenium, clicking 'Show more' until duplicates are reached.
+    With incremental=True only the articles appended since the last section are parsed;
+    otherwise the whole page source is re-parsed every section.
+    The browser is borrowed from the process-wide driver pool unless a pool is given.
+    New jobs are saved by a background writer, so clicks never wait on the database.
+    """
+    pool = pool or get_driver_pool()
+    driver = pool.acquire()
+    pacer = AdaptivePacer(MAX_CLICKS_PER_MINUTE)
+    writer = BackgroundWriter(db_mgr.save_jobs_to_db)
+    tracker = None
+    section_count = 0
+
+    try:
+        print("Starting browser and navigating to Job Bank website...")
+        with metrics.timer('scrape.first_page'):
+            driver.get(BASE_URL)
+            # Wait until the first results are rendered instead of a fixed delay
+            wait_for_new_articles(driver, 0, timeout=30)
+
+        # get existing job ids from database
+        tracker = DuplicateTracker(db_mgr.get_existing_job_ids())
+
+        section_count = 1
+
+        # Number of <article> nodes already parsed (high-water mark for incremental mode)
+        parsed_article_count = 0
+
+        while True:  # Adjust the range for more or fewer scrolls
+            print(f"\n=== Scraping Section {section_count} ===")
+            metrics.count('scrape.pages')
+
+            with metrics.timer('scrape.read_html'):
+                if incremental:
+                    html, parsed_article_count = get_new_articles_html(driver, parsed_article_count)
+                else:
+                    html = driver.page_source
+            section_jobs = parse_job_listings(html)
+
+            new_jobs, stop_scraping = tracker.filter_new_jobs(section_jobs)
+
+            if new_jobs:
+                # save_to_csv(new_jobs, file_path)
+                # Queued for the writer thread; raises if an earlier write failed
+                writer.submit(new_jobs)
+
+            if stop_scraping:
+                break
+
+            # Attempt to click the "More Results" button
+            current_article_count = parsed_article_count if incremental else len(section_jobs)
+            with metrics.timer('scrape.more_results_button'):
+                more_results = more_results_button(driver, current_article_count, pacer)
+            if not more_results:
+                break
+
+            section_count += 1
+    
+    except BaseException:
+        # Flush the queued jobs but keep the original error
+        writer.close(raise_errors=False)
+        raise
+
+    else:
+        # Flush the queued jobs; raises if a background write failed
+        writer.close()
+
+    finally:
+        if tracker is not None:
+            print("\nIncremental scraping in descending order completed.\nTotal unique job found:", len(tracker.current_session_ids))
+        print(f"'Show more' click latency: {pacer.summary()}")
+        pool.release(driver, pages=section_count)
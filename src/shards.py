@@ -0,0 +1,116 @@
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from src import db_manager as db_mgr
+from src.constants import BASE_URL, SHARD_WORKERS, MAX_REQUESTS_PER_SECOND
+from src.dedup import DuplicateTracker
+from src.http_scraper import create_session, crawl_pages, MAX_PAGES
+from src.rate_limit import RateLimiter
+from src.write_behind import BackgroundWriter
+
+# Query parameters whose values become independent shards (one per province x search term)
+SHARD_KEYS = ('fprov', 'term')
+
+def split_base_url(base_url=BASE_URL, shard_keys=SHARD_KEYS):
+    """
+    Split a multi-facet search URL into one URL per combination of the shard_keys values.
+    All other parameters (fcid, fn21, sort, ...) are kept on every shard.
+    Example: fprov=AB&fprov=ON&term=data -> [fprov=AB&term=data, fprov=ON&term=data]
+    """
+    parts = urlsplit(base_url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    values = {key: [value for k, value in query if k == key] for key in shard_keys}
+    values = {key: vals for key, vals in values.items() if vals}
+    if not values:
+        return [base_url]
+
+    shard_urls = []
+    for combination in itertools.product(*values.values()):
+        chosen = dict(zip(values.keys(), combination))
+        shard_query = [(k, v) for k, v in query if k not in chosen]
+        shard_query += list(chosen.items())
+        shard_urls.append(urlunsplit(parts._replace(query=urlencode(shard_query))))
+    return shard_urls
+
+def shard_label(shard_url, shard_keys=SHARD_KEYS):
+    query = parse_qsl(urlsplit(shard_url).query)
+    return ' x '.join(v for k, v in query if k in shard_keys)
+
+def crawl_shard(shard_url, existing_ids, rate_limiter, results, max_pages, stop=None):
+    """
+    Crawl one shard with its own session and duplicate streak, pushing new jobs onto results.
+    Once stop (a threading.Event) is set, the shard gives up the next time it has new jobs.
+    Returns the number of pages with listings.
+    """
+    label = shard_label(shard_url)
+    tracker = DuplicateTracker(existing_ids)
+
+    def deliver(jobs):
+        if stop is not None and stop.is_set():
+            raise RuntimeError("crawl stopped")
+        results.put(jobs)
+
+    try:
+        with create_session() as session:
+            return crawl_pages(session, shard_url, tracker, deliver, rate_limiter, max_pages, label=label)
+    except Exception as e:
+        print(f" - > [{label}] Shard failed: {type(e).__name__}: {e}")
+        return 0
+
+def run_sharded_scraper(base_url=BASE_URL, max_workers=SHARD_WORKERS,
+                        max_requests_per_second=MAX_REQUESTS_PER_SECOND, max_pages=MAX_PAGES):
+    """
+    Crawl every province x term shard of base_url concurrently over HTTP.
+    A single RateLimiter caps the combined request rate of all workers, and results from
+    every shard are merged by this thread into one deduplicated stream, saved by a
+    background writer like the other engines. If a write fails, the shards are stopped and
+    the BackgroundWriteError is raised here.
+    Returns the number of unique new jobs, or None if no shard returned listings.
+    """
+    shard_urls = split_base_url(base_url)
+    print(f"Scraping {len(shard_urls)} shards with {max_workers} workers "
+          f"(max {max_requests_per_second} requests/sec)...")
+
+    existing_ids = db_mgr.get_existing_job_ids()
+    rate_limiter = RateLimiter.per_second(max_requests_per_second)
+    results = queue.Queue()
+    stop = threading.Event()
+    written_ids = set()
+
+    def merge(jobs):
+        new_jobs = []
+        for job in jobs:
+            if job['id'] not in written_ids:
+                written_ids.add(job['id'])
+                new_jobs.append(job)
+        # Raises if an earlier background write failed
+        writer.submit(new_jobs)
+
+    with BackgroundWriter(db_mgr.save_jobs_to_db) as writer, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(crawl_shard, url, existing_ids, rate_limiter, results, max_pages, stop)
+            for url in shard_urls
+        ]
+        try:
+            while not all(future.done() for future in futures):
+                try:
+                    merge(results.get(timeout=0.5))
+                except queue.Empty:
+                    continue
+
+            # Drain anything queued after the last check
+            while not results.empty():
+                merge(results.get_nowait())
+        except BaseException:
+            # Stop the shards at their next page; the pool then waits for them to finish
+            stop.set()
+            raise
+
+    if not any(future.result() for future in futures):
+        return None
+
+    print("\nSharded scraping completed.\nTotal unique job found:", len(written_ids))
+    return len(written_ids)
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from src.cleaner import parse_date
+from src.records import CleanJob, RawJob, intern
+from src.salary_parser import annualize, parse_salary
+
+# Same pattern and format as the scalar parse_* functions in src/cleaner.py
+LOCATION_PATTERN = r'(.+?)\s*\((.+?)\)'
+DATE_FORMAT = "%B %d, %Y"
+
+RAW_COLUMNS = list(RawJob.FIELDS)
+
+def _missing(series):
+    """Rows the scalar parsers treat as missing: None, empty string or 'n/a'."""
+    return series.isna() | (series == "") | (series.str.lower() == "n/a")
+
+def _as_object(values, mask):
+    """Object array with None where mask is True (so NaN/NaT never leak into the output)."""
+    result = np.asarray(values, dtype=object)
+    result[np.asarray(mask)] = None
+    return result
+
+def clean_dates(dates):
+    parsed = pd.to_datetime(dates, format=DATE_FORMAT, errors='coerce')
+    result = _as_object(parsed.dt.strftime("%Y-%m-%d"), parsed.isna())
+
+    # Strings pandas could not parse (e.g. outside its Timestamp range) go through the
+    # scalar parser, so the output matches parse_date exactly
+    retry = (parsed.isna() & ~_missing(dates)).to_numpy()
+    for position in np.flatnonzero(retry):
+        result[position] = parse_date(dates.iat[position])
+    return result
+
+def clean_locations(locations):
+    missing = _missing(locations)
+    parts = locations.str.extract(LOCATION_PATTERN)
+    matched = parts[0].notna()
+
+    city = parts[0].str.strip().where(matched, locations.str.strip()).map(intern, na_action='ignore')
+    province = parts[1].str.strip().map(intern, na_action='ignore')
+    return _as_object(city, missing), _as_object(province, missing | ~matched)
+
+def clean_salaries(salaries):
+    """
+    Salaries go through the single-pass salary grammar once per distinct string
+    (the caller passes the factorized uniques), so there is one definition of the format.
+    Returns object arrays: min, max, period, annualized min, annualized max.
+    """
+    columns = [np.empty(len(salaries), dtype=object) for _ in range(5)]
+    min_salary, max_salary, period, min_annual, max_annual = columns
+    for position, salary in enumerate(salaries):
+        min_salary[position], max_salary[position], period[position] = parse_salary(salary)
+        min_annual[position] = annualize(min_salary[position], period[position])
+        max_annual[position] = annualize(max_salary[position], period[position])
+    return columns
+
+def _factorize(series):
+    """
+    Split a column into integer codes and its distinct values. Parsing runs on the
+    distinct values only (Job Bank strings repeat heavily) and is broadcast back by code.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes, pd.Series(uniques, dtype=object)
+
+def _expand(parsed, codes):
+    # Code -1 (None/NaN in the input) selects the trailing None
+    return np.append(parsed, None).take(codes)
+
+def clean_jobs_frame(raw):
+    """
+    Clean a DataFrame of raw jobs (id, title, date_posted, location, salary).
+    Returns a DataFrame with the jobs_cleaned columns; values match the scalar clean_job.
+    """
+    date_codes, dates = _factorize(raw['date_posted'])
+    location_codes, locations = _factorize(raw['location'])
+    salary_codes, salaries = _factorize(raw['salary'])
+
+    city, province = clean_locations(locations)
+    min_salary, max_salary, period, min_annual, max_annual = clean_salaries(salaries)
+
+    return pd.DataFrame({
+        'id': raw['id'].to_numpy(dtype=object),
+        'title': raw['title'].to_numpy(dtype=object),
+        'date_posted': _expand(clean_dates(dates), date_codes),
+        'city': _expand(city, location_codes),
+        'province': _expand(province, location_codes),
+        'min_salary': _expand(min_salary, salary_codes),
+        'max_salary': _expand(max_salary, salary_codes),
+        'salary_period': _expand(period, salary_codes),
+        'min_salary_annual': _expand(min_annual, salary_codes),
+        'max_salary_annual': _expand(max_annual, salary_codes),
+        'cleaned_at': pd.Series([datetime.now()] * len(raw), dtype=object),
+    })
+
+def clean_job_batch(raw_jobs):
+    """
+    Vectorized equivalent of [clean_job(job) for job in raw_jobs]: a list of CleanJob.
+    """
+    if not raw_jobs:
+        return []
+    # RawJob records are read as tuples (pandas would iterate a Mapping's keys)
+    rows = [job.astuple() if type(job) is RawJob else tuple(job.get(name) for name in RAW_COLUMNS)
+            for job in raw_jobs]
+    raw = pd.DataFrame.from_records(rows, columns=RAW_COLUMNS)
+    del rows
+    cleaned = clean_jobs_frame(raw)
+    # Faster than DataFrame.to_dict('records') for wide object frames
+    return [CleanJob(*row) for row in zip(*(cleaned[column].to_numpy() for column in cleaned.columns))]
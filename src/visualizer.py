@@ -1,83 +1,348 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates # for date formatting
-import seaborn as sns
+import hashlib
+import json
 import os
-from src.constants import CLEANED_JOB_LISTINGS_CSV, VISUALIZATION_IMAGE
+from src.constants import (CLEANED_JOB_LISTINGS_CSV, EXPORT_DIR, VISUALIZATION_IMAGE,
+                           VISUALIZATION_DPI, VISUALIZATION_FORMAT, VISUALIZATION_PANELS, VISUALIZATION_WORKERS)
+
+# pandas, matplotlib and seaborn are imported lazily, so importing this module
+# (e.g. from the CLI for a non-visual command) stays cheap
+
+CHART_COLUMNS = ['province', 'city', 'date_posted', 'title']
+
+# Bump when the chart code changes, so cached renders are redrawn
+RENDER_VERSION = 1
+
+IMAGE_FORMATS = ('png', 'svg', 'webp')
+COMBINED_SIZE = (20, 12)
+PANEL_SIZE = (10, 6)
+
+def csv_aggregates(input_file):
+    """
+    Compute the chart aggregates from a cleaned CSV (full scan).
+    Returns None if the file does not exist.
+    """
+    import pandas as pd
 
-def generate_visuals(input_file):
-    print("=== Starting visualizations ===", flush=True)
-    # Data loading
     if not os.path.exists(input_file):
         print(f"Error: {input_file} file does not exist.")
-        return
-    df = pd.read_csv(input_file, encoding='utf-8-sig')
+        return None
+    # Only the charted columns are parsed
+    df = pd.read_csv(input_file, encoding='utf-8-sig', usecols=CHART_COLUMNS)
     print(f"Loaded {len(df)} records from {input_file} for visualization.")
+    return _frame_aggregates(df)
+
+def snapshot_aggregates(export_dir=EXPORT_DIR):
+    """
+    Compute the chart aggregates from the memory-mapped Parquet/Arrow snapshot
+    (see src/exporter.py), reading only the charted columns.
+    """
+    from src.exporter import load_snapshot
+
+    df = load_snapshot(columns=CHART_COLUMNS, export_dir=export_dir)
+    print(f"Loaded {len(df)} records from the {export_dir} snapshot for visualization.")
+    return _frame_aggregates(df)
+
+def _value_counts(column):
+    counts = column.value_counts()
+    # Categorical columns (from the snapshot) also count unused categories and would put
+    # every category on the chart axis; keep plain labels with at least one job
+    counts = counts[counts > 0]
+    counts.index = counts.index.astype(object)
+    return counts
+
+def _frame_aggregates(df):
+    import pandas as pd
+
+    df['date_posted'] = pd.to_datetime(df['date_posted'], errors='coerce')
+    return {
+        'province_counts': _value_counts(df['province']),
+        'city_counts': _value_counts(df['city']).head(10),
+        'monthly_counts': df.resample('MS', on='date_posted').size(),
+        'top_titles': _value_counts(df['title']).head(10),
+    }
+
+def _counts_series(rows):
+    import pandas as pd
+
+    rows = list(rows)
+    keys = [key for key, _ in rows]
+    return pd.Series([count for _, count in rows], index=keys, dtype='int64')
+
+def _monthly_series(rows):
+    import pandas as pd
+
+    monthly_counts = _counts_series(rows)
+    monthly_counts.index = pd.to_datetime(monthly_counts.index.map(str))
+    # Months without postings are plotted as 0, like resample('MS')
+    return monthly_counts.asfreq('MS', fill_value=0)
+
+def sql_aggregates():
+    """
+    Compute the chart aggregates in the database from jobs_cleaned: GROUP BY province,
+    top-10 cities and titles, and month buckets are pushed down, so only the small
+    result sets reach pandas.
+    """
+    from src import db_manager as db_mgr
+
+    with db_mgr.connection_scope():
+        province_rows = db_mgr.count_cleaned_jobs_by('province')
+        city_rows = db_mgr.count_cleaned_jobs_by('city', limit=10)
+        month_rows = db_mgr.count_cleaned_jobs_by_month()
+        title_rows = db_mgr.count_cleaned_jobs_by('title', limit=10)
+    print("Loaded chart aggregates from jobs_cleaned for visualization.")
+
+    return {
+        'province_counts': _counts_series(province_rows),
+        'city_counts': _counts_series(city_rows),
+        'monthly_counts': _monthly_series(month_rows),
+        'top_titles': _counts_series(title_rows),
+    }
+
+def rollup_aggregates():
+    """
+    Read the chart aggregates from the rollup tables (see src/rollups.py):
+    a few hundred rows, whatever the size of jobs_cleaned.
+    """
+    from src import db_manager as db_mgr
+    from src import rollups
+
+    with db_mgr.connection_scope() as conn:
+        province_rows = rollups.read_counts(conn, 'province')
+        city_rows = rollups.read_counts(conn, 'city', limit=10)
+        month_rows = rollups.read_counts(conn, 'month', order='key')
+        title_rows = rollups.read_counts(conn, 'title', limit=10)
+    print("Loaded chart aggregates from the rollup tables for visualization.")
+
+    return {
+        'province_counts': _counts_series(province_rows),
+        'city_counts': _counts_series(city_rows),
+        'monthly_counts': _monthly_series((f"{month}-01", count) for month, count in month_rows),
+        'top_titles': _counts_series(title_rows),
+    }
+
+def _pyplot():
+    import matplotlib
+    # Headless backend: no GUI toolkit is loaded and no display is needed
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
     # Set seaborn style
     sns.set(style="whitegrid")
-    fig, axes = plt.subplots(2, 2, figsize=(20, 12))
+    return plt
 
-    # Plot 1: Job Listings by Province
-    province_counts = df['province'].value_counts()
+def draw_provinces(ax, province_counts):
+    import seaborn as sns
 
+    # Plot 1: Job Listings by Province
     sns.barplot(
         x=province_counts.index,
         y=province_counts.values,
-        ax=axes[0, 0],
+        ax=ax,
         palette="magma"
     )
-    axes[0, 0].set_title("Job Distributions by Province", fontsize=16, pad=15)
-    axes[0, 0].set_xlabel("Province", fontsize=14)
-    axes[0, 0].set_ylabel("Number of Job Listings", fontsize=14)
+    ax.set_title("Job Distributions by Province", fontsize=16, pad=15)
+    ax.set_xlabel("Province", fontsize=14)
+    ax.set_ylabel("Number of Job Listings", fontsize=14)
 
-    # Plot 2: Top 10 Cities with Most Job Listings
-    city_counts = df['city'].value_counts().head(10)
+def draw_cities(ax, city_counts):
+    import seaborn as sns
 
+    # Plot 2: Top 10 Cities with Most Job Listings
     sns.barplot(
         x=city_counts.index,
         y=city_counts.values,
-        ax=axes[0, 1],
+        ax=ax,
         palette="viridis"
     )
-    axes[0, 1].set_title("Top 10 Cities with Most Job Listings", fontsize=16, pad=15)
-    axes[0, 1].set_xlabel("City", fontsize=14)
-    axes[0, 1].set_ylabel("Number of Job Listings", fontsize=14)   
+    ax.set_title("Top 10 Cities with Most Job Listings", fontsize=16, pad=15)
+    ax.set_xlabel("City", fontsize=14)
+    ax.set_ylabel("Number of Job Listings", fontsize=14)
 
-    # Plot 3: Job postings over Time
-    df['date_posted'] = pd.to_datetime(df['date_posted'], errors='coerce')
-    monthly_counts = df.resample('MS', on='date_posted').size()
+def draw_monthly(ax, monthly_counts):
+    import matplotlib.dates as mdates # for date formatting
+    import seaborn as sns
 
+    # Plot 3: Job postings over Time
     sns.lineplot(
         x=monthly_counts.index,
         y=monthly_counts.values,
-        ax=axes[1 , 0],
+        ax=ax,
         marker="o",
         color="teal"
     )
-    axes[1, 0].set_title("Job Postings Over Time", fontsize=16, pad=15)
-    axes[1, 0].xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-    axes[1, 0].tick_params(axis='x', rotation=45)
-    axes[1, 0].set_xlabel("Date Posted", fontsize=14)
-    axes[1, 0].set_ylabel("Number of Job Listings", fontsize=14)   
+    ax.set_title("Job Postings Over Time", fontsize=16, pad=15)
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    ax.tick_params(axis='x', rotation=45)
+    ax.set_xlabel("Date Posted", fontsize=14)
+    ax.set_ylabel("Number of Job Listings", fontsize=14)
+
+def draw_titles(ax, top_titles):
+    import seaborn as sns
 
     # Plot 4: circle graph of Job Titles
-    top_titles = df['title'].value_counts().head(10)
-    axes[1, 1].pie(
+    ax.pie(
         top_titles.values,
         labels=top_titles.index,
         autopct='%1.1f%%',
         startangle=140,
         colors=sns.color_palette("pastel")[0:10]
     )
-    axes[1, 1].set_title("Top 10 Job Titles Distribution", fontsize=16, pad=15) 
+    ax.set_title("Top 10 Job Titles Distribution", fontsize=16, pad=15)
+
+# Panel name -> (aggregate it draws, drawing function, position in the combined figure)
+PANELS = {
+    'provinces': ('province_counts', draw_provinces, (0, 0)),
+    'cities': ('city_counts', draw_cities, (0, 1)),
+    'monthly': ('monthly_counts', draw_monthly, (1, 0)),
+    'titles': ('top_titles', draw_titles, (1, 1)),
+}
+
+def aggregates_hash(aggregates, **render_options):
+    """
+    Content hash of the aggregates plus every option that changes the rendered image.
+    """
+    payload = {
+        name: [[str(key), int(value)] for key, value in series.items()]
+        for name, series in sorted(aggregates.items())
+    }
+    payload['render'] = dict(render_options, version=RENDER_VERSION)
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def _hash_file(output_file):
+    return f"{output_file}.sha256"
+
+def is_fresh(output_file, digest):
+    """True if output_file exists and was rendered from inputs with this hash."""
+    try:
+        with open(_hash_file(output_file), mode='r', encoding='utf-8') as f:
+            return f.read().strip() == digest and os.path.exists(output_file)
+    except OSError:
+        return False
+
+def _mark_rendered(output_file, digest):
+    with open(_hash_file(output_file), mode='w', encoding='utf-8') as f:
+        f.write(digest)
+
+def render_combined(aggregates, output_file, dpi, image_format):
+    """The 2x2 figure with all four panels."""
+    plt = _pyplot()
+    fig, axes = plt.subplots(2, 2, figsize=COMBINED_SIZE)
+    for key, draw, position in PANELS.values():
+        draw(axes[position], aggregates[key])
 
     # optimize layout and saving
-    plt.tight_layout()
-    plt.savefig(VISUALIZATION_IMAGE, dpi=300)
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=dpi, format=image_format)
+    plt.close(fig)
+    return output_file
+
+def render_panel(name, series, output_file, dpi, image_format):
+    """One panel in its own figure (runs in a worker process when rendering in parallel)."""
+    plt = _pyplot()
+    _, draw, _ = PANELS[name]
+    fig, ax = plt.subplots(figsize=PANEL_SIZE)
+    draw(ax, series)
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=dpi, format=image_format)
+    plt.close(fig)
+    return output_file
+
+def _panel_path(output_file, name, image_format):
+    base, _ = os.path.splitext(output_file)
+    return f"{base}_{name}.{image_format}"
+
+def render_panels(aggregates, output_file, dpi, image_format, workers):
+    """
+    Render each panel to its own file. Each panel has its own content hash, so only panels
+    whose data changed are redrawn, in parallel worker processes. Returns every panel path.
+    """
+    paths = []
+    stale = []
+    for name, (key, _, _) in PANELS.items():
+        path = _panel_path(output_file, name, image_format)
+        digest = aggregates_hash({key: aggregates[key]}, panel=name, dpi=dpi, format=image_format)
+        paths.append(path)
+        if is_fresh(path, digest):
+            print(f"{path} is up to date.")
+        else:
+            stale.append((name, path, digest))
+
+    if workers > 1 and len(stale) > 1:
+        # Processes, not threads: pyplot keeps global state and is not thread-safe
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as executor:
+            futures = [
+                executor.submit(render_panel, name, aggregates[PANELS[name][0]], path, dpi, image_format)
+                for name, path, _ in stale
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for name, path, _ in stale:
+            render_panel(name, aggregates[PANELS[name][0]], path, dpi, image_format)
 
-    print(f"Visualizations saved to {VISUALIZATION_IMAGE}.", flush=True)
-    # plt.show()
+    for _, path, digest in stale:
+        _mark_rendered(path, digest)
+        print(f"Visualization saved to {path}.", flush=True)
+    return paths
+
+def render(aggregates, output_file=VISUALIZATION_IMAGE, panels=VISUALIZATION_PANELS, dpi=VISUALIZATION_DPI,
+           image_format=VISUALIZATION_FORMAT, workers=VISUALIZATION_WORKERS):
+    """
+    Render the charts, skipping any image already rendered from the same aggregates and options.
+    panels: 'combined' (one 2x2 image) or 'separate' (one image per panel).
+    image_format: png, svg or webp (replaces the extension of output_file).
+    Returns the paths of the images.
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format '{image_format}'. Choose from: {', '.join(IMAGE_FORMATS)}")
+    output_file = str(output_file)
+    directory = os.path.dirname(output_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if panels == 'separate':
+        return render_panels(aggregates, output_file, dpi, image_format, workers)
+    if panels != 'combined':
+        raise ValueError(f"Unknown panel layout '{panels}'. Choose from: combined, separate")
+
+    output_file = f"{os.path.splitext(output_file)[0]}.{image_format}"
+    digest = aggregates_hash(aggregates, panel='combined', dpi=dpi, format=image_format)
+    if is_fresh(output_file, digest):
+        print(f"{output_file} is up to date; the aggregates have not changed.")
+        return [output_file]
+    render_combined(aggregates, output_file, dpi, image_format)
+    _mark_rendered(output_file, digest)
+    print(f"Visualizations saved to {output_file}.", flush=True)
+    return [output_file]
+
+def generate_visuals(input_file=CLEANED_JOB_LISTINGS_CSV, source='csv', **render_options):
+    """
+    Draw the job market charts.
+    source: 'csv' scans input_file; 'sql' aggregates jobs_cleaned in the database;
+    'rollups' reads the pre-aggregated rollup tables; 'snapshot' reads the exported
+    Parquet/Arrow snapshot.
+    render_options are passed to render() (output_file, panels, dpi, image_format, workers).
+    """
+    print("=== Starting visualizations ===", flush=True)
+    if source == 'rollups':
+        aggregates = rollup_aggregates()
+    elif source == 'sql':
+        aggregates = sql_aggregates()
+    elif source == 'snapshot':
+        aggregates = snapshot_aggregates()
+    elif source == 'csv':
+        aggregates = csv_aggregates(input_file)
+    else:
+        raise ValueError(f"Unknown visualizer source '{source}'. Choose from: rollups, sql, snapshot, csv")
+    if aggregates is None:
+        return
+    return render(aggregates, **render_options)
 
 if __name__ == "__main__":
-    generate_visuals(CLEANED_JOB_LISTINGS_CSV)
\ No newline at end of file
+    # Standalone runs render from the cleaned CSV and need no database, as they always did;
+    # set VISUALIZER_SOURCE explicitly (or use `main.py visualize --source`) for the others
+    generate_visuals(CLEANED_JOB_LISTINGS_CSV, source=os.getenv('VISUALIZER_SOURCE', 'csv'))
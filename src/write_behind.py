@@ -0,0 +1,139 @@
+import queue
+import threading
+import time
+from src import metrics
+from src.constants import WRITER_BATCH_SIZE, WRITER_FLUSH_SECONDS, WRITER_QUEUE_SIZE
+
+# Sentinel telling the writer thread to flush and exit
+_CLOSE = object()
+
+class BackgroundWriteError(RuntimeError):
+    """A background write failed; raised in the crawl thread by submit() or close()."""
+
+class BackgroundWriter:
+    """
+    Write-behind stage between a scraper loop and the database.
+    submit() queues a list of jobs and returns at once; a writer thread coalesces the
+    per-section lists into batches of about batch_size jobs and hands each batch to write
+    (e.g. db_mgr.save_jobs_to_db), so browser/network waits and DB round-trips overlap.
+    A partial batch is written after flush_seconds, and everything is flushed by close().
+    The queue is bounded: if the database falls behind, submit() blocks instead of
+    buffering without limit. write must return None on failure (as the db_manager savers
+    do) or raise; the failure is re-raised in the caller by the next submit() or close().
+    """
+
+    def __init__(self, write, batch_size=WRITER_BATCH_SIZE, max_pending=WRITER_QUEUE_SIZE,
+                 flush_seconds=WRITER_FLUSH_SECONDS):
+        self.write = write
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._error_raised = False
+        self._closed = False
+        self.written = 0
+        self._thread = threading.Thread(target=self._run, name='job-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        # Always flush; only report a write failure if the block itself succeeded
+        self.close(raise_errors=exc_type is None)
+        return False
+
+    def submit(self, jobs):
+        """
+        Queue jobs for writing. Blocks while the queue is full.
+        Raises BackgroundWriteError if an earlier write failed.
+        """
+        self._raise_error()
+        if self._closed:
+            raise RuntimeError("Background writer is closed.")
+        if not jobs:
+            return
+        while True:
+            try:
+                self._queue.put(list(jobs), timeout=0.5)
+                return
+            except queue.Full:
+                # The writer may have died while we waited
+                self._raise_error()
+
+    def close(self, raise_errors=True):
+        """
+        Flush queued jobs and stop the writer thread.
+        Raises BackgroundWriteError if a write failed (and was not raised yet).
+        """
+        if not self._closed:
+            self._closed = True
+            while self._thread.is_alive():
+                try:
+                    self._queue.put(_CLOSE, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            self._thread.join()
+        if raise_errors:
+            self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None and not self._error_raised:
+            self._error_raised = True
+            raise self._error
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        try:
+            result = self.write(batch)
+        except Exception as e:
+            raise BackgroundWriteError(f"Writing {len(batch)} jobs failed: {type(e).__name__}: {e}") from e
+        if result is None:
+            raise BackgroundWriteError(f"Writing {len(batch)} jobs failed (see the error above).")
+        self.written += len(batch)
+        metrics.count('writer.batches')
+        batch.clear()
+
+    def _run(self):
+        batch = []
+        first_queued = None
+        try:
+            while True:
+                timeout = None
+                if batch:
+                    timeout = max(0.0, first_queued + self.flush_seconds - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    # Partial batch waited long enough
+                    self._flush(batch)
+                    continue
+
+                if item is _CLOSE:
+                    self._flush(batch)
+                    return
+                if not batch:
+                    first_queued = time.monotonic()
+                batch.extend(item)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+        except BackgroundWriteError as e:
+            self._error = e
+        except Exception as e:
+            self._error = BackgroundWriteError(f"Background writer stopped: {type(e).__name__}: {e}")
+        if self._error is not None:
+            dropped = len(batch) + self._drain()
+            print(f" - > Background writer failed; {dropped} queued jobs were not saved.")
+
+    def _drain(self):
+        # Empty the queue after a failure so blocked submit()/close() calls can proceed
+        dropped = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return dropped
+            if item is not _CLOSE:
+                dropped += len(item)